@@ -36,6 +36,7 @@ extras_require = {
         "rise",
     ],
     "midi": ["python-rtmidi"],
+    "numpy": ["numpy"],
     "wave": ["wavefile"],
     "test": [
         "black",
@@ -0,0 +1,156 @@
+import datetime
+
+import uqbar.cli
+
+
+class ManageCacheScript(uqbar.cli.CLI):
+    """
+    Manages the non-realtime render cache.
+
+    ::
+
+        supriya cache --help
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
+    alias = "cache"
+    short_description = "manage the render cache"
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _format_size(cls, size):
+        for unit in ("B", "KB", "MB", "GB"):
+            if size < 1000 or unit == "GB":
+                break
+            size /= 1000
+        if unit == "B":
+            return "{} {}".format(int(size), unit)
+        return "{:.1f} {}".format(size, unit)
+
+    @classmethod
+    def _format_time(cls, timestamp):
+        return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+    def _handle_export(self, render_cache, archive_path, names=None):
+        print("Exporting {} ...".format(render_cache.directory_path))
+        names = render_cache.export(archive_path, names=names or None)
+        for name in names:
+            print("    Exported {}".format(name))
+        print("    Wrote {}".format(archive_path))
+
+    def _handle_import(self, render_cache, archive_path):
+        print("Importing {} ...".format(archive_path))
+        for name in render_cache.import_(archive_path):
+            print("    Imported {}".format(name))
+
+    def _handle_inspect(self, render_cache):
+        print("Inspecting {} ...".format(render_cache.directory_path))
+        entries = render_cache.rebuild()
+        for name, entry in sorted(
+            entries.items(), key=lambda item: (-item[1]["accessed"], item[0])
+        ):
+            print(
+                "    {} [{}, accessed {}, created {}]".format(
+                    entry["file_name"],
+                    self._format_size(entry["size"]),
+                    self._format_time(entry["accessed"]),
+                    self._format_time(entry["created"]),
+                )
+            )
+        print(
+            "    {} entries, {} total.".format(
+                len(entries),
+                self._format_size(sum(_["size"] for _ in entries.values())),
+            )
+        )
+
+    def _handle_prune(
+        self, render_cache, max_age=None, max_entries=None, max_size=None
+    ):
+        print("Pruning {} ...".format(render_cache.directory_path))
+        if max_age is not None:
+            max_age = max_age * 24 * 60 * 60
+        for name in render_cache.prune(
+            max_age=max_age, max_entries=max_entries, max_size=max_size
+        ):
+            print("    Pruned {}".format(name))
+
+    def _process_args(self, args):
+        import supriya.nonrealtime
+
+        render_cache = supriya.nonrealtime.RenderCache(
+            args.cache_path, max_entries=args.max_entries, max_size=args.max_size
+        )
+        if args.export:
+            self._handle_export(render_cache, args.export, names=args.names)
+        elif args.import_:
+            self._handle_import(render_cache, args.import_)
+        elif args.prune:
+            self._handle_prune(
+                render_cache,
+                max_age=args.max_age,
+                max_entries=args.max_entries,
+                max_size=args.max_size,
+            )
+        else:
+            self._handle_inspect(render_cache)
+
+    def _setup_argument_parser(self, parser):
+        action_group = parser.add_argument_group("actions")
+        action_group = action_group.add_mutually_exclusive_group()
+        action_group.add_argument(
+            "--inspect",
+            "-I",
+            action="store_true",
+            help="list cached renders, most recently used first (default)",
+        )
+        action_group.add_argument(
+            "--prune",
+            "-P",
+            action="store_true",
+            help="evict least recently used renders",
+        )
+        action_group.add_argument(
+            "--export",
+            "-E",
+            help="export cached renders to a gzipped tar archive",
+            metavar="ARCHIVE",
+        )
+        action_group.add_argument(
+            "--import",
+            dest="import_",
+            help="import cached renders from a gzipped tar archive",
+            metavar="ARCHIVE",
+        )
+
+        prune_group = parser.add_argument_group("--prune options")
+        prune_group.add_argument(
+            "--max-age",
+            help="evict renders unused for this many days",
+            metavar="DAYS",
+            type=float,
+        )
+        prune_group.add_argument(
+            "--max-entries", help="evict down to this many renders", type=int
+        )
+        prune_group.add_argument(
+            "--max-size", help="evict down to this size, as in 500M or 2G"
+        )
+
+        export_group = parser.add_argument_group("--export options")
+        export_group.add_argument(
+            "names", help="render names to export", metavar="NAME", nargs="*"
+        )
+
+        common_group = parser.add_argument_group("common options")
+        common_group.add_argument(
+            "--cache-path",
+            "-p",
+            help="cache directory (default: configured cache)",
+            metavar="PATH",
+        )
@@ -2,6 +2,7 @@
 Tools for Supriya's project maintenance scripts.
 """
 from .ManageAssetScript import ManageAssetScript  # noqa
+from .ManageCacheScript import ManageCacheScript  # noqa
 from .ManageMaterialScript import ManageMaterialScript  # noqa
 from .ManageProjectScript import ManageProjectScript  # noqa
 from .ManageSessionScript import ManageSessionScript  # noqa
@@ -1,3 +1,4 @@
+import asyncio
 import threading
 import time
 
@@ -72,6 +73,52 @@ class Requestable(SupriyaValueObject):
             return None
         return self._response
 
+    async def communicate_async(
+        self, server=None, sync=True, timeout=1.0, apply_local=True
+    ):
+        """
+        Communicates with ``server`` without blocking the event loop.
+
+        The response resolves a future, so many requests can be in flight at
+        once via ``asyncio.gather()``. Works with both threaded and asyncio
+        OSC IO.
+        """
+        import supriya.realtime
+
+        server = server or supriya.realtime.Server.get_default_server()
+        assert server.is_running
+        with server._lock:
+            if apply_local:
+                for request in self._linearize():
+                    request._apply_local(server)
+        # handle non-sync
+        if self._handle_async(sync, server):
+            return
+        response_pattern, requestable = self._get_response_pattern_and_requestable(
+            server
+        )
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def resolve(response):
+            if not future.done():
+                future.set_result(response)
+
+        callback = server.osc_io.register(
+            pattern=response_pattern,
+            procedure=lambda response: loop.call_soon_threadsafe(resolve, response),
+            once=True,
+            parse_response=True,
+        )
+        server.send_message(requestable)
+        try:
+            self._response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            server.osc_io.unregister(callback)
+            print("TIMED OUT:", repr(self))
+            return None
+        return self._response
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -91,19 +91,14 @@ class Node(SessionObject):
                     value = id_mapping[value]
                 settings[key] = value
         else:
-            for key, events in self._events.items():
-                events = events[:]
-                for i, (event_offset, value) in enumerate(events):
-                    # TODO: This is dreadfully inefficient.
-                    if id_mapping and value in id_mapping:
-                        value = id_mapping[value]
-                        events[i] = (event_offset, value)
-                index = bisect.bisect_left(events, (offset, 0.0))
-                if len(events) <= index:
+            offset_settings = self.session._node_settings.get(offset, {}).get(self)
+            for key in self._events:
+                if not offset_settings or key not in offset_settings:
                     continue
-                event_offset, value = events[index]
-                if offset == event_offset:
-                    settings[key] = value
+                value = offset_settings[key]
+                if id_mapping and value in id_mapping:
+                    value = id_mapping[value]
+                settings[key] = value
         return settings
 
     def _fixup_duration(self, new_duration: float) -> None:
@@ -134,8 +129,11 @@ class Node(SessionObject):
                 continue
             event = (split_offset, events[-1][-1])
             right_events.setdefault(name, []).insert(0, event)
+        old_events = self._events
         self._events = left_events
         new_node._events = right_events
+        self._index_events(old_events)
+        new_node._index_events({})
 
     def _fixup_node_actions(
         self, new_node: "Node", start_offset: "float", stop_offset: "float"
@@ -174,20 +172,43 @@ class Node(SessionObject):
         _, value = events[index]
         return value
 
+    def _index_events(self, old_events) -> None:
+        """
+        Replaces `old_events` with this node's events in the session's
+        offset-indexed settings.
+        """
+        node_settings = self.session._node_settings
+        for key, events in old_events.items():
+            for offset, _ in events:
+                offset_settings = node_settings.get(offset, {})
+                settings = offset_settings.get(self, {})
+                settings.pop(key, None)
+                if not settings:
+                    offset_settings.pop(self, None)
+                if not offset_settings:
+                    node_settings.pop(offset, None)
+        for key, events in self._events.items():
+            for offset, value in events:
+                settings = node_settings.setdefault(offset, {}).setdefault(self, {})
+                settings[key] = value
+
     def _set_at_offset(self, offset, item, value):
         """
         Relative to Synth start offset.
         """
         if offset < self.start_offset or self.stop_offset <= offset:
             return
+        settings = self.session._node_settings.setdefault(offset, {})
+        settings.setdefault(self, {})[item] = value
         events = self._events.setdefault(item, [])
         new_event = (offset, value)
         if not events:
             events.append(new_event)
             return
-        index = bisect.bisect_left(events, new_event)
+        index = bisect.bisect_left(events, (offset,))
         if len(events) <= index:
             events.append(new_event)
+            return
         old_offset, old_value = events[index]
         if old_offset == offset:
             events[index] = (offset, value)
@@ -0,0 +1,192 @@
+import collections.abc
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class PersistentDict(SupriyaObject, collections.abc.MutableMapping):
+    """
+    A dictionary whose copies share structure.
+
+    Entries are bucketed by hash into a two-level, 16-way trie. Copying is
+    O(1): the copy shares the original's trie, and each side then copies
+    only the path to any bucket it writes to. A chain of copies, such as a
+    session's states, therefore stores only the differences between them.
+
+    ::
+
+        >>> import supriya.nonrealtime
+        >>> dict_one = supriya.nonrealtime.PersistentDict({"a": 1, "b": 2})
+        >>> dict_two = dict_one.copy()
+        >>> dict_two["c"] = 3
+        >>> del dict_two["a"]
+        >>> sorted(dict_one.items())
+        [('a', 1), ('b', 2)]
+
+    ::
+
+        >>> sorted(dict_two.items())
+        [('b', 2), ('c', 3)]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Session Internals"
+
+    __slots__ = ("_length", "_root", "_token")
+
+    _bits = 4
+
+    _mask = 0b1111
+
+    _width = 16
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None):
+        self._length = 0
+        self._root = None
+        # Trie nodes stamped with this token are referenced by this
+        # dictionary alone, and may be written to in place. Each branch also
+        # records a bitmask of the buckets it owns.
+        self._token = object()
+        if items:
+            self.update(items)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        root = self._root
+        if root is None:
+            return False
+        hash_ = hash(key)
+        branch = root[hash_ & self._mask]
+        if branch is None:
+            return False
+        bucket = branch[(hash_ >> self._bits) & self._mask]
+        return bucket is not None and key in bucket
+
+    def __delitem__(self, key):
+        bucket = self._get_bucket(key)
+        if bucket is None or key not in bucket:
+            raise KeyError(key)
+        del self._get_writable_bucket(key)[key]
+        self._length -= 1
+
+    def __eq__(self, expr):
+        if not isinstance(expr, PersistentDict):
+            return collections.abc.MutableMapping.__eq__(self, expr)
+        if self._root is expr._root:
+            return True
+        elif self._length != expr._length:
+            return False
+        # Shared subtries are equal by identity, so only diverged paths are
+        # compared.
+        width = self._width
+        empty = (None,) * width
+        for branch_one, branch_two in zip(
+            (self._root or empty)[:width], (expr._root or empty)[:width]
+        ):
+            if branch_one is branch_two:
+                continue
+            for bucket_one, bucket_two in zip(
+                (branch_one or empty)[:width], (branch_two or empty)[:width]
+            ):
+                if bucket_one is not bucket_two and (bucket_one or {}) != (
+                    bucket_two or {}
+                ):
+                    return False
+        return True
+
+    def __getitem__(self, key):
+        bucket = self._get_bucket(key)
+        if bucket is None:
+            raise KeyError(key)
+        return bucket[key]
+
+    def __iter__(self):
+        width = self._width
+        for branch in (self._root or ())[:width]:
+            for bucket in (branch or ())[:width]:
+                if bucket:
+                    yield from bucket
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self.items()))
+
+    def __setitem__(self, key, value):
+        bucket = self._get_writable_bucket(key)
+        if key not in bucket:
+            self._length += 1
+        bucket[key] = value
+
+    ### PRIVATE METHODS ###
+
+    def _get_bucket(self, key):
+        root = self._root
+        if root is None:
+            return None
+        hash_ = hash(key)
+        branch = root[hash_ & self._mask]
+        if branch is None:
+            return None
+        return branch[(hash_ >> self._bits) & self._mask]
+
+    def _get_writable_bucket(self, key):
+        # Roots are laid out as [*branches, token], and branches as
+        # [*buckets, token, owned bucket bitmask].
+        hash_ = hash(key)
+        mask, token, width = self._mask, self._token, self._width
+        root = self._root
+        if root is None:
+            root = self._root = [None] * width + [token]
+        elif root[width] is not token:
+            root = self._root = root[:width] + [token]
+        index = hash_ & mask
+        branch = root[index]
+        if branch is None:
+            branch = root[index] = [None] * width + [token, 0]
+        elif branch[width] is not token:
+            branch = root[index] = branch[:width] + [token, 0]
+        index = (hash_ >> self._bits) & mask
+        bucket = branch[index]
+        if bucket is None:
+            bucket = branch[index] = {}
+            branch[width + 1] |= 1 << index
+        elif not branch[width + 1] & (1 << index):
+            bucket = branch[index] = bucket.copy()
+            branch[width + 1] |= 1 << index
+        return bucket
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        self._length = 0
+        self._root = None
+
+    def copy(self):
+        """
+        Copies the dictionary in constant time.
+        """
+        copied = type(self)()
+        copied._length = self._length
+        copied._root = self._root
+        # Neither side may now write to the shared trie in place.
+        self._token = object()
+        return copied
+
+    def get(self, key, default=None):
+        root = self._root
+        if root is None:
+            return default
+        hash_ = hash(key)
+        branch = root[hash_ & self._mask]
+        if branch is None:
+            return default
+        bucket = branch[(hash_ >> self._bits) & self._mask]
+        if bucket is None:
+            return default
+        return bucket.get(key, default)
@@ -0,0 +1,385 @@
+import contextlib
+import json
+import os
+import pathlib
+import re
+import tarfile
+import tempfile
+import time
+
+import supriya
+from supriya.system.SupriyaObject import SupriyaObject
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class RenderCache(SupriyaObject):
+    """
+    A content-addressed cache of non-realtime renders.
+
+    Renders are named by a hash of their inputs, so any render with the same
+    name can be reused. The cache indexes them in a manifest, mapping each
+    name to its output file, size, creation time and last access time, and
+    evicts the least recently used renders when bounded.
+
+    ::
+
+        >>> import supriya.nonrealtime
+        >>> render_cache = supriya.nonrealtime.RenderCache(
+        ...     "~/.cache/supriya", max_size="2G"
+        ... )
+        >>> render_cache.max_size
+        2000000000
+
+    The manifest is rebuilt from the cache directory's contents whenever it is
+    missing, so caches may be shared between machines by copying or exporting
+    their files.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Session Internals"
+
+    __slots__ = ("_directory_path", "_max_entries", "_max_size")
+
+    _manifest_name = "manifest.json"
+
+    _size_pattern = re.compile(r"^(\d+(?:\.\d+)?)\s*([KMGT]?)B?$", re.IGNORECASE)
+
+    _size_multipliers = {
+        "": 1,
+        "K": 10 ** 3,
+        "M": 10 ** 6,
+        "G": 10 ** 9,
+        "T": 10 ** 12,
+    }
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory_path=None, max_entries=None, max_size=None):
+        directory_path = directory_path or supriya.config.get(
+            "cache", "path", fallback=None
+        )
+        self._directory_path = (
+            pathlib.Path(directory_path or supriya.output_path).expanduser().absolute()
+        )
+        if max_entries is None:
+            max_entries = supriya.config.get("cache", "max_entries", fallback=None)
+        if max_entries is not None:
+            max_entries = int(max_entries)
+            assert 0 < max_entries
+        self._max_entries = max_entries
+        if max_size is None:
+            max_size = supriya.config.get("cache", "max_size", fallback=None)
+        if max_size is not None:
+            max_size = self._parse_size(max_size)
+        self._max_size = max_size
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, name):
+        return self._to_name(name) in self._read_manifest()
+
+    def __iter__(self):
+        return iter(sorted(self._read_manifest()))
+
+    def __len__(self):
+        return len(self._read_manifest())
+
+    ### PRIVATE METHODS ###
+
+    def _build_entry(self, name, entry=None):
+        file_paths = self._find_file_paths(name)
+        if not file_paths:
+            return None
+        stats = [_.stat() for _ in file_paths]
+        modified = max(_.st_mtime for _ in stats)
+        entry = dict(entry or {})
+        entry.setdefault("created", modified)
+        entry.setdefault("accessed", modified)
+        if entry.get("file_name") not in [_.name for _ in file_paths]:
+            entry["file_name"] = file_paths[0].name
+        entry["size"] = sum(_.st_size for _ in stats)
+        return entry
+
+    def _find_file_paths(self, name):
+        if not self.directory_path.exists():
+            return []
+        # Output files sort before their .osc datagrams.
+        return sorted(
+            (
+                path
+                for path in self.directory_path.glob("{}.*".format(name))
+                if path.is_file() and path.suffix != ".tmp"
+            ),
+            key=lambda path: (path.suffix == ".osc", path.name),
+        )
+
+    @contextlib.contextmanager
+    def _lock(self):
+        """
+        Serializes manifest updates between processes, where possible.
+        """
+        self.directory_path.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        lock_path = self.directory_path / "manifest.lock"
+        with open(str(lock_path), "w") as file_pointer:
+            fcntl.flock(file_pointer, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file_pointer, fcntl.LOCK_UN)
+
+    @classmethod
+    def _parse_size(cls, expr):
+        if isinstance(expr, (int, float)):
+            size = int(expr)
+        else:
+            match = cls._size_pattern.match(str(expr).strip())
+            if not match:
+                raise ValueError(expr)
+            number, unit = match.groups()
+            size = int(float(number) * cls._size_multipliers[unit.upper()])
+        assert 0 <= size
+        return size
+
+    def _read_manifest(self):
+        try:
+            with open(str(self.manifest_path), "r") as file_pointer:
+                return json.load(file_pointer)
+        except (IOError, ValueError):
+            return self._scan()
+
+    def _scan(self):
+        manifest = {}
+        if not self.directory_path.exists():
+            return manifest
+        names = set()
+        for path in self.directory_path.iterdir():
+            if path.name.startswith(".") or path.name.startswith("manifest."):
+                continue
+            if path.is_file() and path.suffix != ".tmp":
+                names.add(path.name.partition(".")[0])
+        for name in sorted(names):
+            entry = self._build_entry(name)
+            if entry is not None:
+                manifest[name] = entry
+        return manifest
+
+    @classmethod
+    def _to_name(cls, expr):
+        return pathlib.Path(str(expr)).name.partition(".")[0]
+
+    def _write_manifest(self, manifest):
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=str(self.directory_path),
+            prefix="manifest-",
+            suffix=".tmp",
+            delete=False,
+        ) as file_pointer:
+            json.dump(manifest, file_pointer, indent=4, sort_keys=True)
+        os.replace(file_pointer.name, str(self.manifest_path))
+
+    ### PUBLIC METHODS ###
+
+    def add(self, file_path):
+        """
+        Indexes a render, or records an access if already indexed.
+        """
+        name = self._to_name(file_path)
+        now = time.time()
+        with self._lock():
+            manifest = self._read_manifest()
+            entry = manifest.get(name) or {"created": now}
+            entry.update(accessed=now, file_name=pathlib.Path(str(file_path)).name)
+            entry = self._build_entry(name, entry)
+            if entry is None:
+                manifest.pop(name, None)
+            else:
+                manifest[name] = entry
+            self._write_manifest(manifest)
+        return entry
+
+    @contextlib.contextmanager
+    def atomic_path(self, file_path):
+        """
+        Yields a temporary path beside `file_path`, moved into place only if
+        the block completes and the path was written.
+
+        Concurrent renders of the same entry never see each other's partial
+        output.
+        """
+        file_path = pathlib.Path(file_path)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=str(file_path.parent), prefix=file_path.stem + "-", suffix=".tmp"
+        )
+        os.close(file_descriptor)
+        temporary_path = pathlib.Path(temporary_path)
+        temporary_path.unlink()
+        try:
+            yield temporary_path
+            if temporary_path.exists():
+                os.replace(str(temporary_path), str(file_path))
+        finally:
+            if temporary_path.exists():
+                temporary_path.unlink()
+
+    def export(self, archive_path, names=None):
+        """
+        Exports renders, and their manifest entries, to a gzipped tar archive.
+
+        Returns the exported entries' names.
+        """
+        manifest = self._read_manifest()
+        if names is not None:
+            names = {self._to_name(_) for _ in names}
+            manifest = {
+                name: entry for name, entry in manifest.items() if name in names
+            }
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            manifest_path = pathlib.Path(temporary_directory) / self._manifest_name
+            with open(str(manifest_path), "w") as file_pointer:
+                json.dump(manifest, file_pointer, indent=4, sort_keys=True)
+            with tarfile.open(str(archive_path), "w:gz") as archive:
+                archive.add(str(manifest_path), arcname=self._manifest_name)
+                for name in sorted(manifest):
+                    for file_path in self._find_file_paths(name):
+                        archive.add(str(file_path), arcname=file_path.name)
+        return sorted(manifest)
+
+    def import_(self, archive_path):
+        """
+        Imports renders from an archive made by `export()`.
+
+        Renders already in the cache are kept. Returns the imported entries'
+        names.
+        """
+        imported_names = []
+        with tarfile.open(str(archive_path), "r:*") as archive, self._lock():
+            manifest = self._read_manifest()
+            archived_manifest = json.load(archive.extractfile(self._manifest_name))
+            members = {
+                member.name: member
+                for member in archive.getmembers()
+                if member.isfile() and member.name != self._manifest_name
+            }
+            for name, entry in sorted(archived_manifest.items()):
+                if name in manifest:
+                    continue
+                for member_name, member in sorted(members.items()):
+                    if pathlib.PurePath(member_name).name != member_name:
+                        continue
+                    if self._to_name(member_name) != name:
+                        continue
+                    file_path = self.directory_path / member_name
+                    with self.atomic_path(file_path) as temporary_path:
+                        with open(str(temporary_path), "wb") as file_pointer:
+                            file_pointer.write(archive.extractfile(member).read())
+                entry = self._build_entry(name, entry)
+                if entry is not None:
+                    manifest[name] = entry
+                    imported_names.append(name)
+            self._write_manifest(manifest)
+        return imported_names
+
+    def prune(self, max_age=None, max_entries=None, max_size=None, keep=()):
+        """
+        Evicts least recently used renders until the cache is within bounds.
+
+        Defaults to the cache's own bounds. Renders named in `keep` are never
+        evicted. Entries whose files have disappeared are dropped. Returns the
+        evicted entries' names.
+        """
+        if max_entries is None:
+            max_entries = self.max_entries
+        if max_size is None:
+            max_size = self.max_size
+        else:
+            max_size = self._parse_size(max_size)
+        keep = {self._to_name(_) for _ in keep}
+        now = time.time()
+        evicted_names = []
+        with self._lock():
+            manifest = self._read_manifest()
+            for name, entry in tuple(manifest.items()):
+                entry = self._build_entry(name, entry)
+                if entry is None:
+                    manifest.pop(name)
+                else:
+                    manifest[name] = entry
+            entry_count = len(manifest)
+            total_size = sum(_["size"] for _ in manifest.values())
+            for name, entry in sorted(
+                manifest.items(), key=lambda item: (item[1]["accessed"], item[0])
+            ):
+                if name in keep:
+                    continue
+                if (
+                    (max_age is None or now - entry["accessed"] <= max_age)
+                    and (max_entries is None or entry_count <= max_entries)
+                    and (max_size is None or total_size <= max_size)
+                ):
+                    continue
+                for file_path in self._find_file_paths(name):
+                    file_path.unlink()
+                manifest.pop(name)
+                entry_count -= 1
+                total_size -= entry["size"]
+                evicted_names.append(name)
+            self._write_manifest(manifest)
+        return evicted_names
+
+    def rebuild(self):
+        """
+        Rebuilds the manifest from the cache directory's contents, keeping
+        known access times.
+        """
+        with self._lock():
+            manifest = self._read_manifest()
+            scanned_manifest = self._scan()
+            for name, entry in scanned_manifest.items():
+                if name in manifest:
+                    scanned_manifest[name] = self._build_entry(name, manifest[name])
+            self._write_manifest(scanned_manifest)
+        return scanned_manifest
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self):
+        return self._directory_path
+
+    @property
+    def entries(self):
+        """
+        Gets the manifest, mapping render names to their entries.
+        """
+        return self._read_manifest()
+
+    @property
+    def manifest_path(self):
+        return self.directory_path / self._manifest_name
+
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    @property
+    def max_size(self):
+        """
+        Gets the cache's maximum size, in bytes.
+
+        Sizes may be given as strings with a decimal unit suffix, as in
+        ``"500M"`` or ``"2G"``.
+        """
+        return self._max_size
+
+    @property
+    def size(self):
+        return sum(_["size"] for _ in self._read_manifest().values())
@@ -96,6 +96,7 @@ class Session:
         "_buses",
         "_input",
         "_name",
+        "_node_settings",
         "_nodes",
         "_offsets",
         "_options",
@@ -143,6 +144,9 @@ class Session:
         self._active_moments = []
         self._buffers = supriya.time.TimespanCollection(accelerated=True)
         self._name = name
+        # Offset -> node -> setting name -> value, for every setting made on
+        # a node, maintained by Node._set_at_offset().
+        self._node_settings = {}
         self._nodes = supriya.time.TimespanCollection(accelerated=True)
         self._offsets = []
         self._root_node = supriya.nonrealtime.RootNode(self)
@@ -745,14 +749,19 @@ class Session:
 
     def _collect_node_settings(self, offset, state, id_mapping):
         result = collections.OrderedDict()
+        if not self._node_settings.get(offset):
+            return result
         if state.nodes_to_children is None:
             # Current state is sparse;
             # Use previous non-sparse state's nodes to order settings.
             state = self._find_state_before(offset, with_node_tree=True)
-            iterator = state._iterate_nodes(self.root_node, state.nodes_to_children)
-        else:
-            iterator = state._iterate_nodes(self.root_node, state.nodes_to_children)
-        for node in iterator:
+        nodes = state._sort_nodes(
+            self.root_node,
+            self._node_settings[offset],
+            state.nodes_to_children,
+            state.nodes_to_parents,
+        )
+        for node in nodes:
             settings = node._collect_settings(
                 offset, id_mapping=id_mapping, persistent=False
             )
@@ -981,14 +990,15 @@ class Session:
         del (self.states[offset])
         return state
 
-    def _to_non_xrefd_osc_bundles(self, duration=None):
-        osc_bundles = []
-        request_bundles = self._to_non_xrefd_request_bundles(duration=duration)
-        for request_bundle in request_bundles:
-            osc_bundles.append(request_bundle.to_osc(True))
-        return osc_bundles
+    def _iterate_non_xrefd_osc_bundles(self, duration=None):
+        for request_bundle in self._iterate_non_xrefd_request_bundles(duration):
+            yield request_bundle.to_osc(True)
 
-    def _to_non_xrefd_request_bundles(self, duration=None):
+    def _iterate_non_xrefd_request_bundles(self, duration=None):
+        """
+        Compiles the session offset by offset, yielding each offset's
+        request bundle as soon as it is built.
+        """
         id_mapping = self._build_id_mapping()
         if self.duration == float("inf"):
             assert duration is not None and 0 < duration < float("inf")
@@ -1000,7 +1010,6 @@ class Session:
         buffer_settings = self._collect_buffer_settings(id_mapping)
         bus_settings = self._collect_bus_settings(id_mapping)
         is_last_offset = False
-        request_bundles = []
         buffer_open_states = {}
         visited_synthdefs = set()
         for offset in offsets:
@@ -1020,13 +1029,15 @@ class Session:
             if is_last_offset:
                 requests.append(NothingRequest())
             if requests:
-                request_bundle = RequestBundle(
-                    contents=requests, timestamp=float(offset)
-                )
-                request_bundles.append(request_bundle)
+                yield RequestBundle(contents=requests, timestamp=float(offset))
             if is_last_offset:
                 break
-        return request_bundles
+
+    def _to_non_xrefd_osc_bundles(self, duration=None):
+        return list(self._iterate_non_xrefd_osc_bundles(duration=duration))
+
+    def _to_non_xrefd_request_bundles(self, duration=None):
+        return list(self._iterate_non_xrefd_request_bundles(duration=duration))
 
     ### PUBLIC METHODS ###
 
@@ -1224,6 +1235,10 @@ class Session:
         duration=None,
         header_format=HeaderFormat.AIFF,
         input_file_path=None,
+        max_workers=None,
+        partition_tail=None,
+        partitions=None,
+        render_cache=None,
         render_directory_path=None,
         sample_format=SampleFormat.INT24,
         sample_rate=44100,
@@ -1238,7 +1253,11 @@ class Session:
         renderer = supriya.nonrealtime.SessionRenderer(
             session=self,
             header_format=header_format,
+            max_workers=max_workers,
+            partition_tail=partition_tail,
+            partitions=partitions,
             print_transcript=print_transcript,
+            render_cache=render_cache,
             render_directory_path=render_directory_path,
             sample_format=sample_format,
             sample_rate=sample_rate,
@@ -1,9 +1,14 @@
+import concurrent.futures
+import contextlib
+import filecmp
 import hashlib
+import math
 import os
 import pathlib
 import shutil
 import struct
 import subprocess
+import tempfile
 
 import tqdm  # type: ignore
 import uqbar.containers
@@ -11,6 +16,7 @@ import uqbar.io
 import yaml
 
 import supriya
+import supriya.osc
 import supriya.realtime
 import supriya.soundfiles
 import supriya.system
@@ -30,9 +36,14 @@ class SessionRenderer(SupriyaObject):
 
     __slots__ = (
         "_compiled_sessions",
+        "_datagram_file_paths",
         "_header_format",
+        "_max_workers",
+        "_partition_tail",
+        "_partitions",
         "_prerender_tuples",
         "_print_transcript",
+        "_render_cache",
         "_render_directory_path",
         "_sample_format",
         "_sample_rate",
@@ -45,31 +56,79 @@ class SessionRenderer(SupriyaObject):
         "_sessionables_to_sessions",
     )
 
+    # Message addresses whose first argument is a node ID.
+    _node_addresses = ("/n_map", "/n_mapa", "/n_set")
+
+    # Message addresses whose arguments are pairs of node IDs.
+    _node_pair_addresses = ("/g_head", "/g_tail", "/n_after", "/n_before")
+
+    _partition_header_formats = (HeaderFormat.AIFF, HeaderFormat.WAV)
+
+    _partition_sample_formats = (
+        SampleFormat.INT16,
+        SampleFormat.INT24,
+        SampleFormat.INT32,
+    )
+
     ### INITIALIZER ###
 
     def __init__(
         self,
         session,
         header_format=HeaderFormat.AIFF,
+        max_workers=None,
+        partition_tail=None,
+        partitions=None,
         print_transcript=None,
+        render_cache=None,
         render_directory_path=None,
         sample_format=SampleFormat.INT24,
         sample_rate=44100,
         transcript_prefix=None,
     ):
+        import supriya.nonrealtime
+
         self._session = session
 
         self._header_format = HeaderFormat.from_expr(header_format)
 
+        if max_workers is not None:
+            max_workers = int(max_workers)
+            assert 0 < max_workers
+        self._max_workers = max_workers
+
+        if partitions is not None:
+            partitions = int(partitions)
+            assert 0 < partitions
+        self._partitions = partitions
+
+        if partition_tail is not None:
+            partition_tail = float(partition_tail)
+            assert 0.0 <= partition_tail
+        self._partition_tail = partition_tail
+
         if print_transcript:
             print_transcript = bool(print_transcript)
         self._print_transcript = print_transcript
 
+        if (
+            render_directory_path is None
+            and render_cache is None
+            and supriya.config.has_section("cache")
+        ):
+            render_cache = supriya.nonrealtime.RenderCache()
+        if render_cache is not None:
+            assert isinstance(render_cache, supriya.nonrealtime.RenderCache)
+            render_directory_path = render_directory_path or render_cache.directory_path
+        self._render_cache = render_cache
+
         self._render_directory_path = (
             pathlib.Path(render_directory_path or supriya.output_path)
             .expanduser()
             .absolute()
         )
+        if render_cache is not None:
+            assert self._render_directory_path == render_cache.directory_path
 
         self._sample_format = SampleFormat.from_expr(sample_format)
 
@@ -84,21 +143,15 @@ class SessionRenderer(SupriyaObject):
 
     ### PRIVATE METHODS ###
 
-    def _build_datagram(self, osc_bundles):
-        datagrams = []
-        for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack(">i", size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b"".join(datagrams)
-        return datagram
-
-    def _build_file_path(self, datagram, input_file_path, session):
-        # print('BUILDING FILE PATH')
-        md5 = hashlib.md5()
-        md5.update(datagram)
+    def _build_datagram(self, osc_bundle):
+        datagram = osc_bundle.to_datagram(realtime=False)
+        return struct.pack(">i", len(datagram)) + datagram
+
+    def _build_file_path(self, md5, input_file_path, session):
+        """
+        Builds a session's file path from `md5`, a hash already updated with
+        the session's datagram.
+        """
         hash_values = []
         if input_file_path is not None:
             hash_values.append(input_file_path)
@@ -119,6 +172,127 @@ class SessionRenderer(SupriyaObject):
         file_path = "session-{}.osc".format(md5)
         return pathlib.Path(file_path)
 
+    def _build_partition_bundles(self, osc_bundles, start_offset, stop_offset):
+        """
+        Builds the score for a window of `osc_bundles`, running from
+        `start_offset` until `stop_offset`, or the end.
+
+        Bundles before the window are replayed at its start, without the
+        synths they create, so that its groups, buffers and buses are in
+        place. Returns None if the window can't be built, as when the score
+        writes buffers to disk.
+        """
+        dropped_synth_ids = set()
+        window_bundles = [(0.0, [])]
+        for osc_bundle in osc_bundles:
+            timestamp = osc_bundle.timestamp
+            if stop_offset is not None and stop_offset <= timestamp:
+                break
+            is_before_start = timestamp < start_offset
+            messages = []
+            for osc_message in osc_bundle.contents:
+                address, contents = osc_message.address, osc_message.contents
+                if address == "/s_new":
+                    if contents[3] in dropped_synth_ids:
+                        return None
+                    if is_before_start:
+                        dropped_synth_ids.add(contents[1])
+                        continue
+                elif address == "/g_new":
+                    if any(_ in dropped_synth_ids for _ in contents[2::3]):
+                        return None
+                elif address == "/b_write":
+                    return None
+                elif address == "/n_free":
+                    contents = [_ for _ in contents if _ not in dropped_synth_ids]
+                    if not contents:
+                        continue
+                    osc_message = supriya.osc.OscMessage(address, *contents)
+                elif address in self._node_addresses:
+                    if contents[0] in dropped_synth_ids:
+                        continue
+                elif address in self._node_pair_addresses:
+                    pairs = [
+                        pair
+                        for pair in zip(contents[::2], contents[1::2])
+                        if not any(_ in dropped_synth_ids for _ in pair)
+                    ]
+                    if not pairs:
+                        continue
+                    osc_message = supriya.osc.OscMessage(address, *sum(pairs, ()))
+                messages.append(osc_message)
+            if is_before_start:
+                window_bundles[0][1].extend(messages)
+            elif timestamp == start_offset:
+                window_bundles[0][1].extend(messages)
+            elif messages:
+                window_bundles.append((timestamp - start_offset, messages))
+        if stop_offset is not None:
+            window_bundles.append(
+                (stop_offset - start_offset, [supriya.osc.OscMessage(0)])
+            )
+        return [
+            supriya.osc.OscBundle(timestamp=timestamp, contents=messages)
+            for timestamp, messages in window_bundles
+            if messages
+        ]
+
+    def _build_partitions(self, session, duration, block_size):
+        """
+        Splits `session`'s timeline into windows, as triples of start, cut and
+        stop frames. Each window renders from its start, and keeps the frames
+        from its cut until its stop, or the end of the last window.
+
+        Each window starts at a block boundary, at or before its cut, where no
+        synth sounds, so synths crossing the cut start, with all their state,
+        inside the window's pre-roll. Gated synths, released rather than freed
+        when they stop, are taken to sound for `partition_tail` seconds after
+        they stop. Cuts whose pre-roll would reach back past the previous
+        window's start are dropped.
+        """
+        import supriya.nonrealtime
+
+        sample_rate = self.sample_rate
+        partition_tail = self.partition_tail or 0.0
+        intervals = [
+            (
+                node.start_offset,
+                node.stop_offset + (partition_tail if node.synthdef.has_gate else 0.0),
+            )
+            for node in session.nodes
+            if isinstance(node, supriya.nonrealtime.Synth)
+        ]
+
+        def find_start_frame(frame):
+            while True:
+                offset = frame / sample_rate
+                start_offsets = [
+                    start_offset
+                    for start_offset, stop_offset in intervals
+                    if start_offset < offset < stop_offset
+                ]
+                if not start_offsets:
+                    return frame
+                frame = (
+                    int(math.floor(min(start_offsets) * sample_rate / block_size))
+                    * block_size
+                )
+
+        frame_count = duration * sample_rate
+        windows = [[0, 0, None]]
+        for i in range(1, self.partitions or 1):
+            cut_frame = (
+                int(round(frame_count * i / self.partitions / block_size)) * block_size
+            )
+            if not windows[-1][1] < cut_frame < frame_count:
+                continue
+            start_frame = find_start_frame(cut_frame)
+            if start_frame <= windows[-1][0]:
+                continue
+            windows[-1][2] = cut_frame
+            windows.append([start_frame, cut_frame, None])
+        return [tuple(_) for _ in windows]
+
     def _build_render_command(
         self,
         input_file_path,
@@ -160,67 +334,117 @@ class SessionRenderer(SupriyaObject):
         render_yaml = yaml.dump(render_data, default_flow_style=False, indent=4)
         return render_yaml
 
-    def _build_xrefd_bundles(self, osc_bundles):
+    def _build_xrefd_bundle(self, osc_bundle):
         extension = ".{}".format(self.header_format.name.lower())
-        for osc_bundle in osc_bundles:
-            for osc_message in osc_bundle.contents:
-                contents = list(osc_message.contents)
-                for i, x in enumerate(contents):
-                    x = self._sessionable_to_session(x)
-                    try:
-                        if x not in self.renderable_prefixes:
-                            continue
-                    except TypeError:
+        for osc_message in osc_bundle.contents:
+            contents = list(osc_message.contents)
+            for i, x in enumerate(contents):
+                x = self._sessionable_to_session(x)
+                try:
+                    if x not in self.renderable_prefixes:
                         continue
-                    renderable_file_path = self.renderable_prefixes[x].with_suffix(
-                        extension
-                    )
-                    contents[i] = str(renderable_file_path)
-                osc_message._contents = tuple(contents)
-        return osc_bundles
+                except TypeError:
+                    continue
+                renderable_file_path = self.renderable_prefixes[x].with_suffix(
+                    extension
+                )
+                contents[i] = str(renderable_file_path)
+            osc_message._contents = tuple(contents)
+        return osc_bundle
 
-    def _build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-        self, expr, parent
-    ):
+    def _compile_dependency(self, expr, parent, write_datagrams=False):
         import supriya.nonrealtime
 
         expr = self._sessionable_to_session(expr)
         if isinstance(expr, supriya.nonrealtime.Session):
             if expr not in self.dependency_graph:
-                self._build_dependency_graph_and_nonxrefd_osc_bundles(expr)
+                self._compile_session(expr, write_datagrams=write_datagrams)
             self.dependency_graph.add(expr, parent=parent)
         elif hasattr(expr, "__render__"):
+            if expr not in self.renderable_prefixes:
+                renderable_prefix = expr._build_file_path().with_suffix("")
+                self.renderable_prefixes[expr] = renderable_prefix
             self.dependency_graph.add(expr, parent=parent)
 
-    def _build_dependency_graph_and_nonxrefd_osc_bundles(self, session, duration=None):
+    def _compile_session(self, session, duration=None, write_datagrams=False):
+        """
+        Compiles `session` one offset at a time, compiling its dependencies
+        as they are found.
+
+        Each bundle is cross-referenced and hashed as soon as it is built.
+        When `write_datagrams` is true, each is then written to a temporary
+        datagram file and discarded. Otherwise only the top-level session's
+        bundles are kept, for `to_osc_bundles()`.
+        """
         input_ = session.input_
         if isinstance(input_, str):
             input_ = pathlib.Path(input_)
         input_ = self._sessionable_to_session(input_)
-        non_xrefd_bundles = session._to_non_xrefd_osc_bundles(duration)
-        self.compiled_sessions[session] = input_, non_xrefd_bundles
         if session is self.session:
             self.dependency_graph.add(session)
-        self._build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-            input_, session
-        )
-        for non_xrefd_bundle in non_xrefd_bundles:
-            for request in non_xrefd_bundle.contents:
-                for x in request.contents:
-                    self._build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-                        x, session
-                    )
+        self._compile_dependency(input_, session, write_datagrams=write_datagrams)
+        input_file_path = input_
+        if input_ and input_ in self.renderable_prefixes:
+            extension = ".{}".format(self.header_format.name.lower())
+            input_file_path = self.renderable_prefixes[input_]
+            input_file_path = input_file_path.with_suffix(extension)
+        if input_file_path:
+            input_file_path = self.get_path_relative_to_render_path(
+                input_file_path, self.render_directory_path
+            )
+            self.session_input_paths[session] = input_file_path
+        datagram_file_path = file_pointer = osc_bundles = None
+        if write_datagrams:
+            file_pointer = tempfile.NamedTemporaryFile(
+                dir=str(self.render_directory_path),
+                prefix="session-",
+                suffix=".osc.tmp",
+                delete=False,
+            )
+            datagram_file_path = pathlib.Path(file_pointer.name)
+            self._datagram_file_paths.append(datagram_file_path)
+        if session is self.session and (
+            not write_datagrams or (self.partitions or 0) > 1
+        ):
+            osc_bundles = []
+        md5 = hashlib.md5()
+        try:
+            for osc_bundle in session._iterate_non_xrefd_osc_bundles(duration):
+                for osc_message in osc_bundle.contents:
+                    for x in osc_message.contents:
+                        self._compile_dependency(
+                            x, session, write_datagrams=write_datagrams
+                        )
+                osc_bundle = self._build_xrefd_bundle(osc_bundle)
+                datagram = self._build_datagram(osc_bundle)
+                md5.update(datagram)
+                if file_pointer is not None:
+                    file_pointer.write(datagram)
+                if osc_bundles is not None:
+                    osc_bundles.append(osc_bundle)
+        finally:
+            if file_pointer is not None:
+                file_pointer.close()
+        renderable_prefix = self._build_file_path(
+            md5, input_file_path, session
+        ).with_suffix("")
+        self.renderable_prefixes[session] = renderable_prefix
+        prerender_tuple = (session, datagram_file_path, input_, osc_bundles)
+        self.compiled_sessions[session] = prerender_tuple
 
     def _call_subprocess(self, command):
         return subprocess.call(command, shell=True)
 
-    def _stream_subprocess(self, command, session_duration):
+    def _stream_subprocess(self, command, session_duration, show_progress=True):
         process = subprocess.Popen(
             command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
         )
         previous_value = 0
         progress_bar = tqdm.tqdm(
-            bar_format=(), total=int(session_duration * 1000), unit="ms"
+            bar_format=(),
+            disable=not show_progress,
+            total=int(session_duration * 1000),
+            unit="ms",
         )
         with progress_bar:
             while True:
@@ -247,46 +471,36 @@ class SessionRenderer(SupriyaObject):
                         return -6
         return process.poll()
 
-    def _collect_prerender_tuples(self, session, duration=None):
+    def _collect_prerender_tuples(self, session, duration=None, write_datagrams=False):
         import supriya.nonrealtime
 
-        self._build_dependency_graph_and_nonxrefd_osc_bundles(
-            session, duration=duration
+        self._compile_session(
+            session, duration=duration, write_datagrams=write_datagrams
         )
         assert self.dependency_graph.is_acyclic()
-        extension = ".{}".format(self.header_format.name.lower())
         for renderable in self.dependency_graph:
             if isinstance(renderable, supriya.nonrealtime.Session):
-                result = self._collect_session_prerender_tuple(renderable, extension)
-                prerender_tuple, renderable_prefix = result
+                prerender_tuple = self.compiled_sessions[renderable]
             else:
-                result = self._collect_renderable_prerender_tuple(renderable)
-                prerender_tuple, renderable_prefix = result
+                prerender_tuple = (renderable,)
             self.prerender_tuples.append(prerender_tuple)
-            self.renderable_prefixes[renderable] = renderable_prefix
         return self.prerender_tuples
 
-    def _collect_renderable_prerender_tuple(self, renderable):
-        renderable_prefix = renderable._build_file_path().with_suffix("")
-        return (renderable,), renderable_prefix
-
-    def _collect_session_prerender_tuple(self, session, extension):
-        input_, non_xrefd_bundles = self.compiled_sessions[session]
-        osc_bundles = self._build_xrefd_bundles(non_xrefd_bundles)
-        input_file_path = input_
-        if input_ and input_ in self.renderable_prefixes:
-            input_file_path = self.renderable_prefixes[input_]
-            input_file_path = input_file_path.with_suffix(extension)
-        if input_file_path:
-            input_file_path = self.get_path_relative_to_render_path(
-                input_file_path, self.render_directory_path
-            )
-            self.session_input_paths[session] = input_file_path
-        datagram = self._build_datagram(osc_bundles)
-        renderable_prefix = self._build_file_path(
-            datagram, input_file_path, session
-        ).with_suffix("")
-        return (session, datagram, input_, osc_bundles), renderable_prefix
+    def _render(self, extension, **kwargs):
+        assert self.prerender_tuples, self.prerender_tuples
+        visited_renderable_prefixes = []
+        with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
+            for prerender_tuple in self.prerender_tuples:
+                renderable = prerender_tuple[0]
+                renderable_prefix = self.renderable_prefixes[renderable]
+                visited_renderable_prefixes.append(
+                    renderable_prefix.with_suffix("").name
+                )
+                output_file_path = renderable_prefix.with_suffix(extension)
+                exit_code = self._render_renderable(
+                    prerender_tuple, output_file_path, **kwargs
+                )
+        return exit_code, output_file_path, visited_renderable_prefixes
 
     def _render_datagram(
         self,
@@ -294,6 +508,8 @@ class SessionRenderer(SupriyaObject):
         input_file_path,
         output_file_path,
         session_osc_file_path,
+        show_progress=True,
+        transcript=None,
         **kwargs,
     ):
         relative_session_osc_file_path = session_osc_file_path
@@ -301,49 +517,345 @@ class SessionRenderer(SupriyaObject):
             relative_session_osc_file_path = session_osc_file_path.relative_to(
                 pathlib.Path.cwd()
             )
-        self._report("Rendering {}.".format(relative_session_osc_file_path))
+        self._report("Rendering {}.".format(relative_session_osc_file_path), transcript)
         if output_file_path.exists():
             self._report(
                 "    Skipped {}. Output already exists.".format(
                     relative_session_osc_file_path
-                )
+                ),
+                transcript,
             )
             return 0
         server_options = session._options
         server_options = utils.new(server_options, **kwargs)
         memory_size = server_options.memory_size
-        for factor in range(1, 6):
-            command = self._build_render_command(
-                input_file_path,
-                output_file_path,
-                session_osc_file_path,
-                server_options=server_options,
+        with self._open_output_file_path(output_file_path) as render_file_path:
+            for factor in range(1, 6):
+                command = self._build_render_command(
+                    input_file_path,
+                    render_file_path,
+                    session_osc_file_path,
+                    server_options=server_options,
+                )
+                self._report("    Command: {}".format(command), transcript)
+                try:
+                    exit_code = self._stream_subprocess(
+                        command, session.duration, show_progress=show_progress
+                    )
+                except KeyboardInterrupt:
+                    if render_file_path.exists():
+                        render_file_path.unlink()
+                    raise
+                server_options = utils.new(
+                    server_options, memory_size=memory_size * (2 ** factor)
+                )
+                if exit_code == -6:
+                    self._report(
+                        "    Out of memory. Increasing to {}.".format(
+                            server_options.memory_size
+                        ),
+                        transcript,
+                    )
+                else:
+                    self._report(
+                        "    Rendered {} with exit code {}.".format(
+                            relative_session_osc_file_path, exit_code
+                        ),
+                        transcript,
+                    )
+                    break
+            if exit_code and render_file_path != output_file_path:
+                if render_file_path.exists():
+                    render_file_path.unlink()
+        return exit_code
+
+    def _render_parallel(self, extension, **kwargs):
+        """
+        Renders each renderable once all of its dependencies have rendered,
+        running up to `max_workers` at a time.
+
+        Each renderable's transcript is collected separately, then appended
+        to the renderer's transcript in dependency order.
+
+        Distinct renderables with identical contents share an output file, so
+        each waits for any other render of that file to finish, then skips it
+        just as a sequential render would.
+        """
+        assert self.prerender_tuples, self.prerender_tuples
+        renderables = [_[0] for _ in self.prerender_tuples]
+        prerender_tuples = dict(zip(renderables, self.prerender_tuples))
+        output_file_paths = {
+            renderable: self.renderable_prefixes[renderable].with_suffix(extension)
+            for renderable in renderables
+        }
+        transcripts = {renderable: [] for renderable in renderables}
+        exit_codes, futures, error = {}, {}, None
+        pending, rendering_file_paths = list(renderables), set()
+        reported_count = 0
+        with uqbar.io.DirectoryChange(
+            directory=str(self.render_directory_path)
+        ), concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            while pending or futures:
+                for renderable in pending[:]:
+                    if error is not None:
+                        break
+                    dependencies = self.dependency_graph.children(renderable)
+                    if not all(_ in exit_codes for _ in dependencies):
+                        continue
+                    if output_file_paths[renderable] in rendering_file_paths:
+                        continue
+                    pending.remove(renderable)
+                    rendering_file_paths.add(output_file_paths[renderable])
+                    future = executor.submit(
+                        self._render_renderable,
+                        prerender_tuples[renderable],
+                        output_file_paths[renderable],
+                        show_progress=False,
+                        transcript=transcripts[renderable],
+                        **kwargs,
+                    )
+                    futures[future] = renderable
+                if not futures:
+                    break
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    renderable = futures.pop(future)
+                    rendering_file_paths.remove(output_file_paths[renderable])
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                        continue
+                    exit_codes[renderable] = future.result()
+                while (
+                    reported_count < len(renderables)
+                    and renderables[reported_count] in exit_codes
+                ):
+                    for message in transcripts[renderables[reported_count]]:
+                        self._report(message, prefixed=True)
+                    reported_count += 1
+        if error is not None:
+            for renderable in renderables[reported_count:]:
+                for message in transcripts[renderable]:
+                    self._report(message, prefixed=True)
+            raise error
+        visited_renderable_prefixes = [
+            self.renderable_prefixes[renderable].with_suffix("").name
+            for renderable in renderables
+        ]
+        return (
+            exit_codes[renderables[-1]],
+            output_file_paths[renderables[-1]],
+            visited_renderable_prefixes,
+        )
+
+    def _render_partitions(
+        self,
+        session,
+        osc_bundles,
+        output_file_path,
+        session_osc_file_path,
+        show_progress=True,
+        transcript=None,
+        **kwargs,
+    ):
+        """
+        Renders `session` as overlapping windows of its timeline, in parallel,
+        then stitches the windows' audio together.
+
+        Returns None, without rendering, when `session` can't be partitioned.
+        """
+        import supriya.nonrealtime
+
+        if (
+            output_file_path.exists()
+            or session.input_
+            or self.header_format not in self._partition_header_formats
+            or self.sample_format not in self._partition_sample_formats
+        ):
+            return None
+        if self.partition_tail is None and any(
+            isinstance(node, supriya.nonrealtime.Synth) and node.synthdef.has_gate
+            for node in session.nodes
+        ):
+            # Gated synths keep sounding through their release after they
+            # stop, for however long their synthdef says, so cutting right
+            # after them would truncate it.
+            self._report(
+                "Not partitioning {}: gated synths need a partition tail.".format(
+                    session_osc_file_path
+                ),
+                transcript,
             )
-            self._report("    Command: {}".format(command))
+            return None
+        if any(
+            osc_message.address == "/b_write"
+            for osc_bundle in osc_bundles
+            for osc_message in osc_bundle.contents
+        ):
+            # Each window's scsynth would write its own copy of the file, with
+            # only the window's audio, if any.
+            self._report(
+                "Not partitioning {}: it writes buffers to disk.".format(
+                    session_osc_file_path
+                ),
+                transcript,
+            )
+            return None
+        server_options = utils.new(session._options, **kwargs)
+        windows = self._build_partitions(
+            session, osc_bundles[-1].timestamp, server_options.block_size
+        )
+        if len(windows) < 2:
+            return None
+        window_osc_bundles = []
+        for start_frame, _, stop_frame in windows:
+            if stop_frame is not None:
+                stop_frame /= self.sample_rate
+            window_osc_bundles.append(
+                self._build_partition_bundles(
+                    osc_bundles, start_frame / self.sample_rate, stop_frame
+                )
+            )
+            if window_osc_bundles[-1] is None:
+                return None
+        self._report(
+            "Partitioning {} into {} windows.".format(
+                session_osc_file_path, len(windows)
+            ),
+            transcript,
+        )
+        prefix = session_osc_file_path.with_suffix("")
+        window_file_paths = [
+            pathlib.Path("{}-part-{}".format(prefix, i)) for i in range(len(windows))
+        ]
+        window_transcripts = [[] for _ in windows]
+        try:
+            for window_file_path, window_bundles in zip(
+                window_file_paths, window_osc_bundles
+            ):
+                window_osc_file_path = window_file_path.with_suffix(".osc")
+                with open(str(window_osc_file_path), "wb") as file_pointer:
+                    for osc_bundle in window_bundles:
+                        file_pointer.write(self._build_datagram(osc_bundle))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers or len(windows)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._render_datagram,
+                        session,
+                        None,
+                        window_file_path.with_suffix(output_file_path.suffix),
+                        window_file_path.with_suffix(".osc"),
+                        show_progress=False,
+                        transcript=window_transcript,
+                        **kwargs,
+                    )
+                    for window_file_path, window_transcript in zip(
+                        window_file_paths, window_transcripts
+                    )
+                ]
+                concurrent.futures.wait(futures)
+            for window_transcript in window_transcripts:
+                for message in window_transcript:
+                    self._report(message, transcript, prefixed=True)
+            for future in futures:
+                if future.result():
+                    return future.result()
+            self._report("Stitching {}.".format(output_file_path), transcript)
             try:
-                exit_code = self._stream_subprocess(command, session.duration)
-            except KeyboardInterrupt:
+                with self._open_output_file_path(output_file_path) as render_file_path:
+                    self._stitch_partitions(
+                        windows,
+                        [
+                            _.with_suffix(output_file_path.suffix)
+                            for _ in window_file_paths
+                        ],
+                        render_file_path,
+                    )
+            except ValueError as exception:
                 if output_file_path.exists():
                     output_file_path.unlink()
-                raise
-            server_options = utils.new(
-                server_options, memory_size=memory_size * (2 ** factor)
-            )
-            if exit_code == -6:
                 self._report(
-                    "    Out of memory. Increasing to {}.".format(
-                        server_options.memory_size
-                    )
+                    "    Failed to stitch: {!r}.".format(exception), transcript
                 )
-            else:
-                self._report(
-                    "    Rendered {} with exit code {}.".format(
-                        relative_session_osc_file_path, exit_code
-                    )
-                )
-                break
+                return None
+            self._report("    Stitched {}.".format(output_file_path), transcript)
+        finally:
+            for window_file_path in window_file_paths:
+                for suffix in (".osc", output_file_path.suffix):
+                    if window_file_path.with_suffix(suffix).exists():
+                        window_file_path.with_suffix(suffix).unlink()
+        return 0
+
+    def _render_renderable(
+        self,
+        prerender_tuple,
+        output_file_path,
+        show_progress=True,
+        transcript=None,
+        **kwargs,
+    ):
+        import supriya.nonrealtime
+
+        renderable = prerender_tuple[0]
+        if not isinstance(renderable, supriya.nonrealtime.Session):
+            renderable.__render__(
+                output_file_path=output_file_path,
+                print_transcript=self.print_transcript,
+            )
+            if self.render_cache is not None:
+                self.render_cache.add(output_file_path)
+            return 0
+        (session, datagram_file_path, input_, osc_bundles) = prerender_tuple
+        osc_file_path = self.renderable_prefixes[session].with_suffix(".osc")
+        input_file_path = self.session_input_paths.get(session)
+        self._write_datagram(osc_file_path, datagram_file_path, transcript)
+        exit_code = None
+        if session is self.session and (self.partitions or 0) > 1:
+            exit_code = self._render_partitions(
+                session,
+                osc_bundles,
+                output_file_path,
+                osc_file_path,
+                show_progress=show_progress,
+                transcript=transcript,
+                **kwargs,
+            )
+        if exit_code is None:
+            exit_code = self._render_datagram(
+                session,
+                input_file_path,
+                output_file_path,
+                osc_file_path,
+                show_progress=show_progress,
+                transcript=transcript,
+                **kwargs,
+            )
+        if exit_code:
+            self._report("    SuperCollider errored!", transcript)
+            raise NonrealtimeRenderError(exit_code)
+        if self.render_cache is not None:
+            self.render_cache.add(output_file_path)
         return exit_code
 
+    @contextlib.contextmanager
+    def _open_output_file_path(self, output_file_path):
+        """
+        Yields the path scsynth should render `output_file_path` to.
+
+        Renders into a cache are written to a temporary file first, and moved
+        into place once complete.
+        """
+        if self.render_cache is None:
+            yield output_file_path
+            return
+        with self.render_cache.atomic_path(output_file_path) as file_path:
+            yield file_path
+
     def _read(self, file_path, mode=""):
         try:
             with open(str(file_path), "r" + mode) as file_pointer:
@@ -351,15 +863,25 @@ class SessionRenderer(SupriyaObject):
         except FileNotFoundError:
             return None
 
-    def _report(self, message):
-        if self.transcript_prefix:
+    def _report(self, message, transcript=None, prefixed=False):
+        if self.transcript_prefix and not prefixed:
             message = "{}{}".format(self.transcript_prefix, message)
+        if transcript is not None:
+            transcript.append(message)
+            return
         if self.print_transcript:
             print(message)
         self.transcript.append(message)
 
+    def _remove_datagram_files(self):
+        for datagram_file_path in self._datagram_file_paths:
+            if datagram_file_path.exists():
+                datagram_file_path.unlink()
+        self._datagram_file_paths[:] = []
+
     def _reset(self):
         self._compiled_sessions = {}
+        self._datagram_file_paths = []
         self._prerender_tuples = []
         self._session._transcript = self._transcript = []
         self._renderable_prefixes = {}
@@ -374,8 +896,74 @@ class SessionRenderer(SupriyaObject):
             return self._sessionables_to_sessions[expr]
         return expr
 
-    def _write_datagram(self, file_path, new_contents):
-        self._write(file_path, new_contents, mode="b")
+    def _stitch_partitions(self, windows, file_paths, output_file_path):
+        """
+        Concatenates each window's frames from its cut until its stop into
+        `output_file_path`.
+
+        Raises ValueError when a window's audio can't be read.
+        """
+        import aifc
+        import wave
+
+        if self.header_format == HeaderFormat.AIFF:
+            module = aifc
+        else:
+            module = wave
+        block_frame_count = 2 ** 16
+        try:
+            writer = module.open(str(output_file_path), "wb")
+            try:
+                if module is aifc:
+                    writer.aiff()
+                for i, (window, file_path) in enumerate(zip(windows, file_paths)):
+                    start_frame, cut_frame, stop_frame = window
+                    reader = module.open(str(file_path), "rb")
+                    try:
+                        if not i:
+                            writer.setparams(reader.getparams())
+                        reader.setpos(cut_frame - start_frame)
+                        if stop_frame is None:
+                            frame_count = reader.getnframes()
+                            frame_count -= cut_frame - start_frame
+                        else:
+                            frame_count = stop_frame - cut_frame
+                        while 0 < frame_count:
+                            frames = reader.readframes(
+                                min(frame_count, block_frame_count)
+                            )
+                            if not frames:
+                                raise EOFError(file_path)
+                            writer.writeframes(frames)
+                            frame_count -= min(frame_count, block_frame_count)
+                    finally:
+                        reader.close()
+            finally:
+                writer.close()
+        except (EOFError, module.Error) as exception:
+            raise ValueError(exception) from exception
+
+    def _write_datagram(self, file_path, datagram_file_path, transcript=None):
+        """
+        Moves a temporary datagram file into place, unless an identical file
+        already exists there.
+        """
+        cwd = pathlib.Path.cwd()
+        relative_file_path = file_path
+        if file_path.is_absolute() and cwd in file_path.parents:
+            relative_file_path = file_path.relative_to(cwd)
+        self._report("Writing {}.".format(relative_file_path), transcript)
+        if file_path.exists() and filecmp.cmp(
+            str(file_path), str(datagram_file_path), shallow=False
+        ):
+            datagram_file_path.unlink()
+            self._report(
+                "    Skipped {}. File already exists.".format(relative_file_path),
+                transcript,
+            )
+        else:
+            os.replace(str(datagram_file_path), str(file_path))
+            self._report("    Wrote {}.".format(relative_file_path), transcript)
 
     def _write_render_yml(self, file_path, render_yaml):
         self._write(file_path, render_yaml)
@@ -404,7 +992,7 @@ class SessionRenderer(SupriyaObject):
 
     def to_osc_bundles(self, duration=None):
         self._collect_prerender_tuples(self.session, duration=duration)
-        (session, datagram, input_file_path, osc_bundles) = self.prerender_tuples[-1]
+        (session, _, input_file_path, osc_bundles) = self.prerender_tuples[-1]
         return osc_bundles
 
     @classmethod
@@ -436,50 +1024,34 @@ class SessionRenderer(SupriyaObject):
         build_render_yml=None,
         **kwargs,
     ):
-        import supriya.nonrealtime
-
         extension = ".{}".format(self.header_format.name.lower())
         if output_file_path is not None:
             output_file_path = pathlib.Path(output_file_path)
             output_file_path = output_file_path.expanduser().absolute()
         original_output_file_path = output_file_path
-        self._collect_prerender_tuples(self.session, duration=duration)
-        assert self.prerender_tuples, self.prerender_tuples
-        visited_renderable_prefixes = []
-        with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
-            for prerender_tuple in self.prerender_tuples:
-                renderable = prerender_tuple[0]
-                renderable_prefix = self.renderable_prefixes[renderable]
-                visited_renderable_prefixes.append(
-                    renderable_prefix.with_suffix("").name
-                )
-                output_file_path = renderable_prefix.with_suffix(extension)
-                if isinstance(renderable, supriya.nonrealtime.Session):
-                    (session, datagram, input_, _) = prerender_tuple
-                    osc_file_path = renderable_prefix.with_suffix(".osc")
-                    input_file_path = self.session_input_paths.get(session)
-                    self._write_datagram(osc_file_path, datagram)
-                    exit_code = self._render_datagram(
-                        session,
-                        input_file_path,
-                        output_file_path,
-                        osc_file_path,
-                        **kwargs,
-                    )
-                    if exit_code:
-                        self._report("    SuperCollider errored!")
-                        raise NonrealtimeRenderError(exit_code)
-                else:
-                    renderable.__render__(
-                        output_file_path=output_file_path,
-                        print_transcript=self.print_transcript,
-                    )
+        try:
+            self._collect_prerender_tuples(
+                self.session, duration=duration, write_datagrams=True
+            )
+            if self.max_workers and 1 < self.max_workers:
+                render_method = self._render_parallel
+            else:
+                render_method = self._render
+            exit_code, output_file_path, visited_renderable_prefixes = render_method(
+                extension, **kwargs
+            )
+        finally:
+            self._remove_datagram_files()
         output_file_path = self.render_directory_path / output_file_path
         if not output_file_path.exists():
             self._report("    Output file is missing!")
             raise NonrealtimeOutputMissing(output_file_path)
         if original_output_file_path is not None:
             shutil.copy(str(output_file_path), str(original_output_file_path))
+        if self.render_cache is not None and (
+            self.render_cache.max_entries or self.render_cache.max_size is not None
+        ):
+            self.render_cache.prune(keep=visited_renderable_prefixes)
         if build_render_yml:
             output_directory = (original_output_file_path or output_file_path).parent
             render_yaml = self._build_render_yml(visited_renderable_prefixes)
@@ -500,6 +1072,38 @@ class SessionRenderer(SupriyaObject):
     def header_format(self):
         return self._header_format
 
+    @property
+    def max_workers(self):
+        """
+        Gets the maximum number of renderables rendered at once.
+
+        Independent sessions in the dependency graph render in parallel, each
+        in its own scsynth process, when this is greater than one.
+        """
+        return self._max_workers
+
+    @property
+    def partition_tail(self):
+        """
+        Gets how long gated synths are taken to keep sounding after they
+        stop, in seconds, when partitioning.
+
+        Sessions with gated synths only partition when this is given.
+        """
+        return self._partition_tail
+
+    @property
+    def partitions(self):
+        """
+        Gets the number of windows to split the session's timeline into.
+
+        When greater than one, the session renders as that many overlapping
+        windows, each in its own scsynth process, stitched together
+        sample-accurately. Sessions with an input, or rendered to formats
+        other than integer AIFF or WAV, render whole.
+        """
+        return self._partitions
+
     @property
     def prerender_tuples(self):
         return self._prerender_tuples
@@ -508,6 +1112,17 @@ class SessionRenderer(SupriyaObject):
     def print_transcript(self):
         return self._print_transcript
 
+    @property
+    def render_cache(self):
+        """
+        Gets the render cache, if any.
+
+        Renders into the default render directory are indexed by the default
+        render cache when supriya's configuration file has a ``[cache]``
+        section, which also bounds it.
+        """
+        return self._render_cache
+
     @property
     def render_directory_path(self):
         return self._render_directory_path
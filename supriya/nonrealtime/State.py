@@ -1,9 +1,10 @@
 import collections
-from typing import Dict, Tuple
+from typing import MutableMapping, Tuple
 
 import uqbar.graphs
 
 import supriya.commands
+from supriya.nonrealtime.PersistentDict import PersistentDict
 from supriya.nonrealtime.SessionObject import SessionObject
 from supriya.utils import iterate_nwise
 
@@ -11,6 +12,10 @@ from supriya.utils import iterate_nwise
 class State(SessionObject):
     """
     A non-realtime state.
+
+    Large node trees are held in persistent dictionaries, so cloning a state
+    shares its tree, and each state stores only its changes. Smaller trees
+    are plain dicts, which are faster to copy outright.
     """
 
     ### CLASS VARIABLES ###
@@ -31,15 +36,17 @@ class State(SessionObject):
 
     _ordered_buffer_request_types = (supriya.commands.BufferZeroRequest,)
 
+    # Node trees move into persistent dictionaries once they hold more nodes
+    # than this, and back into dicts once they shrink to half of it.
+    _persistent_node_count = 256
+
     ### INITIALIZER ###
 
     def __init__(self, session, offset):
-        from supriya.nonrealtime import Node
-
         SessionObject.__init__(self, session)
         self._transitions = collections.OrderedDict()
-        self._nodes_to_children: Dict[Node, Tuple[Node]] = {}
-        self._nodes_to_parents: Dict[Node, Tuple[Node]] = {}
+        self._nodes_to_children: MutableMapping = {}
+        self._nodes_to_parents: MutableMapping = {}
         self._start_nodes = set()
         self._stop_nodes = set()
         self._start_buffers = set()
@@ -79,7 +86,10 @@ class State(SessionObject):
             supriya.nonrealtime.NodeTransition.free_node(
                 stop_node, nodes_to_children, nodes_to_parents
             )
-        return nodes_to_children, nodes_to_parents
+        return (
+            cls._coerce_node_tree(nodes_to_children),
+            cls._coerce_node_tree(nodes_to_parents),
+        )
 
     def _as_graphviz_graph(self):
         from supriya.nonrealtime.Synth import Synth
@@ -111,6 +121,15 @@ class State(SessionObject):
             synth_a.attach(synth_b)
         return cluster, node_mapping, ordered_synths
 
+    @classmethod
+    def _coerce_node_tree(cls, node_tree):
+        if isinstance(node_tree, PersistentDict):
+            if len(node_tree) <= cls._persistent_node_count // 2:
+                return dict(node_tree.items())
+        elif cls._persistent_node_count < len(node_tree):
+            return PersistentDict(node_tree)
+        return node_tree
+
     def _clone(self, new_offset):
         if float("-inf") < self.offset:
             self.session._apply_transitions(self.offset, chain=False)
@@ -221,6 +240,43 @@ class State(SessionObject):
                 raise Exception
         return transitions
 
+    @classmethod
+    def _sort_nodes(cls, root_node, nodes, nodes_to_children, nodes_to_parents):
+        """
+        Sorts `nodes` into the order `_iterate_nodes()` would visit them,
+        walking only their ancestors rather than the whole tree.
+
+        Nodes not reachable from `root_node` are discarded.
+        """
+        paths = {root_node: ()}
+        positions = {}
+
+        def get_path(node):
+            if node in paths:
+                return paths[node]
+            paths[node] = None
+            parent = nodes_to_parents.get(node)
+            if parent is None:
+                return None
+            parent_path = get_path(parent)
+            if parent_path is None:
+                return None
+            if parent not in positions:
+                children = nodes_to_children.get(parent) or ()
+                positions[parent] = dict(zip(children, range(len(children))))
+            position = positions[parent].get(node)
+            if position is not None:
+                paths[node] = parent_path + (position,)
+            return paths[node]
+
+        path_node_pairs = []
+        for node in nodes:
+            path = get_path(node)
+            if path is not None:
+                path_node_pairs.append((path, node))
+        path_node_pairs.sort(key=lambda pair: pair[0])
+        return [node for _, node in path_node_pairs]
+
     ### PUBLIC METHODS ###
 
     def report(self):
@@ -260,13 +316,13 @@ class State(SessionObject):
     @property
     def nodes_to_children(
         self
-    ) -> Dict["supriya.nonrealtime.Node", Tuple["supriya.nonrealtime.Node"]]:
+    ) -> MutableMapping["supriya.nonrealtime.Node", Tuple["supriya.nonrealtime.Node"]]:
         return self._nodes_to_children
 
     @property
     def nodes_to_parents(
         self
-    ) -> Dict["supriya.nonrealtime.Node", Tuple["supriya.nonrealtime.Node"]]:
+    ) -> MutableMapping["supriya.nonrealtime.Node", "supriya.nonrealtime.Node"]:
         return self._nodes_to_parents
 
     @property
@@ -12,6 +12,8 @@ from .Group import Group  # noqa
 from .Moment import Moment  # noqa
 from .Node import Node  # noqa
 from .NodeTransition import NodeTransition  # noqa
+from .PersistentDict import PersistentDict  # noqa
+from .RenderCache import RenderCache  # noqa
 from .RootNode import RootNode  # noqa
 from .Session import Session  # noqa
 from .SessionFactory import SessionFactory  # noqa
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+from supriya.osc.OscIO import OscIO
+
+
+class AsyncOscIO(OscIO):
+    """
+    An asyncio-native OSC IO.
+
+    Datagrams are received by an ``asyncio.DatagramProtocol`` and dispatched
+    on the event loop, so callbacks may resolve futures directly. Scheduled
+    bundle contents are held by the event loop's own timer heap.
+
+    ::
+
+        >>> import asyncio
+        >>> import supriya.osc
+        >>> async def main():
+        ...     osc_io = supriya.osc.AsyncOscIO()
+        ...     await osc_io.boot(port=57123)
+        ...     print(osc_io.is_running)
+        ...     osc_io.quit()
+        ...     print(osc_io.is_running)
+        ...
+        >>> loop = asyncio.new_event_loop()
+        >>> loop.run_until_complete(main())
+        True
+        False
+        >>> loop.close()
+
+    """
+
+    class OscProtocol(asyncio.DatagramProtocol):
+        def __init__(self, io_instance):
+            self.io_instance = io_instance
+
+        def datagram_received(self, data, address):
+            self.io_instance._process_datagram(data)
+
+    def __init__(
+        self,
+        debug_osc=False,
+        debug_udp=False,
+        ip_address="127.0.0.1",
+        port=57751,
+        schedule_bundles=False,
+        timeout=2,
+    ):
+        OscIO.__init__(
+            self,
+            debug_osc=debug_osc,
+            debug_udp=debug_udp,
+            ip_address=ip_address,
+            port=port,
+            schedule_bundles=schedule_bundles,
+            timeout=timeout,
+        )
+        self.protocol = None
+        self.scheduled_handles = set()
+        self.transport = None
+
+    ### PRIVATE METHODS ###
+
+    def _schedule_message(self, timestamp, message):
+        def process_message():
+            self.scheduled_handles.discard(handle)
+            self._process_message(message)
+
+        loop = asyncio.get_event_loop()
+        handle = loop.call_later(timestamp - time.time(), process_message)
+        self.scheduled_handles.add(handle)
+
+    def _send_datagram(self, datagram):
+        self.transport.sendto(datagram)
+
+    ### PUBLIC METHODS ###
+
+    async def boot(self, ip_address=None, port=None):
+        if self.is_running:
+            return
+        if ip_address:
+            self.ip_address = ip_address
+        if port:
+            self.port = port
+        loop = asyncio.get_event_loop()
+        self.transport, self.protocol = await loop.create_datagram_endpoint(
+            lambda: self.OscProtocol(self), remote_addr=(self.ip_address, self.port)
+        )
+        self.is_running = True
+
+    def quit(self):
+        if not self.is_running:
+            return
+        self.transport.close()
+        for handle in self.scheduled_handles:
+            handle.cancel()
+        self.scheduled_handles.clear()
+        self.protocol = None
+        self.transport = None
+        self.is_running = False
@@ -1,8 +1,8 @@
 import datetime
-import decimal
 import struct
 
 from supriya.osc import format_datagram
+from supriya.osc.OscCodec import OscCodec
 from supriya.system.SupriyaValueObject import SupriyaValueObject
 
 
@@ -84,6 +84,7 @@ class OscBundle(SupriyaValueObject):
     __slots__ = ("_contents", "_timestamp")
 
     _bundle_prefix = b"#bundle\x00"
+    _codec = OscCodec()
     _immediately = struct.pack(">q", 1)
 
     ### INITIALIZER ###
@@ -126,10 +127,8 @@ class OscBundle(SupriyaValueObject):
         if payload[offset : offset + 8] == OscBundle._immediately:
             date = None
         else:
-            seconds, fraction = struct.unpack(">II", payload[offset : offset + 8])
-            date = decimal.Decimal("{!s}.{!s}".format(seconds, fraction))
-            date = float(date)
-            date = OscBundle._ntp_to_system_time(date)
+            seconds, fraction = struct.unpack_from(">II", payload, offset)
+            date = OscBundle._ntp_to_system_time(seconds + fraction / 4_294_967_296)
         offset += 8
         return date, offset
 
@@ -143,11 +142,9 @@ class OscBundle(SupriyaValueObject):
             return OscBundle._immediately
         if realtime:
             ntp = OscBundle._system_time_to_ntp(value)
-            seconds, fraction = str(ntp).split(".")
-            seconds = int(seconds)
-            fraction = int(fraction)
-            result = struct.pack(">I", seconds)
-            result += struct.pack(">I", fraction)
+            seconds = int(ntp)
+            fraction = min(int((ntp - seconds) * 4_294_967_296), 4_294_967_295)
+            result = struct.pack(">II", seconds, fraction)
         else:
             kSecondsToOSC = 4_294_967_296
             result = struct.pack(">q", int(value * kSecondsToOSC))
@@ -161,35 +158,12 @@ class OscBundle(SupriyaValueObject):
 
     @staticmethod
     def from_datagram(datagram):
-        import supriya.osc
-
-        assert OscBundle.datagram_is_bundle(datagram)
-        offset = 8
-        timestamp, offset = OscBundle._read_date(datagram, offset)
-        contents = []
-        while offset < len(datagram):
-            length, offset = supriya.osc.OscMessage._read_int(datagram, offset)
-            data = datagram[offset : offset + length]
-            if OscBundle.datagram_is_bundle(data):
-                item = OscBundle.from_datagram(data)
-            else:
-                item = supriya.osc.OscMessage.from_datagram(data)
-            contents.append(item)
-            offset += length
-        osc_bundle = OscBundle(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+        return OscBundle._codec.decode_bundle(datagram)
 
     def to_datagram(self, realtime=True):
-        import supriya.osc
-
-        datagram = OscBundle._bundle_prefix
-        datagram += OscBundle._write_date(self._timestamp, realtime=realtime)
-        for content in self.contents:
-            content_datagram = content.to_datagram()
-            content_length = len(content_datagram)
-            datagram += supriya.osc.OscMessage._write_int(content_length)
-            datagram += content_datagram
-        return datagram
+        return OscBundle._codec.encode_bundle(
+            self._timestamp, self.contents, realtime=realtime
+        )
 
     def to_list(self):
         result = [self.timestamp]
@@ -0,0 +1,383 @@
+import collections
+import enum
+import struct
+
+
+class OscCodec:
+    """
+    A table-driven OSC codec.
+
+    Encoders are compiled once per address and type-tag signature into a
+    ``struct`` format, so encoding a message is a single ``pack`` call.
+    Decoders are compiled once per type-tag signature, grouping runs of
+    fixed-width arguments into single ``unpack_from`` calls against the
+    original datagram.
+
+    ::
+
+        >>> import supriya.osc
+        >>> codec = supriya.osc.OscCodec()
+        >>> datagram = codec.encode_message('/s_new', ('default', 1000, 0, 1))
+        >>> datagram
+        b'/s_new\\x00\\x00,siii\\x00\\x00\\x00default\\x00\\x00\\x00\\x03\\xe8\\x00\\x00\\x00\\x00\\x00\\x00\\x00\\x01'
+
+    ::
+
+        >>> codec.decode(datagram)
+        OscMessage('/s_new', 'default', 1000, 0, 1)
+
+    ::
+
+        >>> codec.encode_message('/n_set', (1000, 'frequency', 440.0)) == (
+        ...     supriya.osc.OscMessage('/n_set', 1000, 'frequency', 440.0).to_datagram()
+        ...     )
+        True
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_cache_size", "_decoders", "_encoders")
+
+    _bundle_prefix = b"#bundle\x00"
+
+    _fixed_formats = {"d": "d", "f": "f", "i": "i"}
+
+    _constants = {"F": False, "N": None, "T": True}
+
+    _decode_errors = (
+        AssertionError,
+        IndexError,
+        UnicodeDecodeError,
+        ValueError,
+        struct.error,
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, cache_size=1024):
+        self._cache_size = int(cache_size)
+        self._decoders = {}
+        self._encoders = {}
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _encode_string(value):
+        encoded = value.encode("utf-8")
+        return encoded + b"\x00" * (4 - (len(encoded) % 4))
+
+    def _compile_decoder(self, type_tags):
+        # Operations are (kind, argument) pairs. Runs of fixed-width
+        # arguments collapse into one precompiled struct.
+        operations = []
+        fixed_run = ""
+        for type_tag in type_tags:
+            if type_tag in self._fixed_formats:
+                fixed_run += self._fixed_formats[type_tag]
+                continue
+            if fixed_run:
+                operations.append(("x", struct.Struct(">" + fixed_run)))
+                fixed_run = ""
+            if type_tag in self._constants:
+                operations.append(("c", self._constants[type_tag]))
+            elif type_tag in "sb[]":
+                operations.append((type_tag, None))
+            else:
+                raise ValueError("Cannot decode type tag {!r}".format(type_tag))
+        if fixed_run:
+            operations.append(("x", struct.Struct(">" + fixed_run)))
+        operations = tuple(operations)
+        if len(self._decoders) >= self._cache_size:
+            self._decoders.clear()
+        self._decoders[type_tags] = operations
+        return operations
+
+    def _compile_encoder(self, address, type_tags):
+        if isinstance(address, str):
+            prefix = self._encode_string(address)
+        else:
+            prefix = struct.pack(">i", address)
+        prefix += self._encode_string("," + type_tags)
+        format_ = ">{}s".format(len(prefix))
+        is_variable = False
+        for type_tag in type_tags:
+            if type_tag in self._fixed_formats:
+                format_ += self._fixed_formats[type_tag]
+            elif type_tag == "s":
+                format_ += "%ds"
+                is_variable = True
+            elif type_tag == "b":
+                format_ += "i%ds"
+                is_variable = True
+        if is_variable:
+            encoder = (prefix, format_)
+        else:
+            encoder = (prefix, struct.Struct(format_))
+        if len(self._encoders) >= self._cache_size:
+            self._encoders.clear()
+        self._encoders[address, type_tags] = encoder
+        return encoder
+
+    def _decode_blob(self, datagram, start, stop):
+        if datagram[start : start + 8] == self._bundle_prefix:
+            return self._decode_bundle(datagram, start, stop)
+        try:
+            return self._decode_message(datagram, start, stop)
+        except self._decode_errors:
+            return bytearray(datagram[start:stop])
+
+    def _decode_bundle(self, datagram, start, stop):
+        import supriya.osc
+
+        timestamp, offset = supriya.osc.OscBundle._read_date(datagram, start + 8)
+        contents = []
+        while offset < stop:
+            (length,) = struct.unpack_from(">i", datagram, offset)
+            offset += 4
+            if datagram[offset : offset + 8] == self._bundle_prefix:
+                contents.append(self._decode_bundle(datagram, offset, offset + length))
+            else:
+                contents.append(self._decode_message(datagram, offset, offset + length))
+            offset += length
+        return supriya.osc.OscBundle(timestamp=timestamp, contents=contents)
+
+    def _decode_message(self, datagram, start, stop):
+        import supriya.osc
+
+        end = datagram.index(b"\x00", start, stop)
+        address = datagram[start:end].decode("utf-8")
+        offset = start + (end - start) // 4 * 4 + 4
+        end = datagram.index(b"\x00", offset, stop)
+        type_tags = datagram[offset:end].decode("utf-8")
+        if not type_tags.startswith(","):
+            raise ValueError("Malformed type tags: {!r}".format(type_tags))
+        offset += (end - offset) // 4 * 4 + 4
+        type_tags = type_tags[1:]
+        operations = self._decoders.get(type_tags)
+        if operations is None:
+            operations = self._compile_decoder(type_tags)
+        contents = []
+        stack = []
+        for kind, argument in operations:
+            if kind == "x":
+                contents.extend(argument.unpack_from(datagram, offset))
+                offset += argument.size
+            elif kind == "s":
+                end = datagram.index(b"\x00", offset, stop)
+                contents.append(datagram[offset:end].decode("utf-8"))
+                offset += (end - offset) // 4 * 4 + 4
+            elif kind == "c":
+                contents.append(argument)
+            elif kind == "b":
+                (length,) = struct.unpack_from(">i", datagram, offset)
+                offset += 4
+                contents.append(self._decode_blob(datagram, offset, offset + length))
+                offset += length + (-length % 4)
+            elif kind == "[":
+                stack.append(contents)
+                contents = []
+            elif kind == "]":
+                array = tuple(contents)
+                contents = stack.pop()
+                contents.append(array)
+        if offset > stop:
+            raise ValueError("Truncated datagram")
+        return supriya.osc.OscMessage(address, *contents)
+
+    def _flatten(self, values, type_tags, payload, sizes):
+        for value in values:
+            type_ = type(value)
+            if type_ is int:
+                type_tags.append("i")
+                payload.append(value)
+            elif type_ is float:
+                type_tags.append("f")
+                payload.append(value)
+            elif type_ is str:
+                encoded = value.encode("utf-8")
+                type_tags.append("s")
+                payload.append(encoded)
+                sizes.append(len(encoded) + 4 - (len(encoded) % 4))
+            elif type_ is bool:
+                type_tags.append("T" if value else "F")
+            elif value is None:
+                type_tags.append("N")
+            else:
+                self._flatten_other(value, type_tags, payload, sizes)
+
+    def _flatten_other(self, value, type_tags, payload, sizes):
+        if hasattr(value, "to_datagram"):
+            value = bytearray(value.to_datagram())
+        elif isinstance(value, enum.Enum):
+            self._flatten((value.value,), type_tags, payload, sizes)
+            return
+        if isinstance(value, bytearray):
+            type_tags.append("b")
+            payload.append(len(value))
+            payload.append(bytes(value))
+            sizes.append(len(value) + (-len(value) % 4))
+        elif isinstance(value, str):
+            self._flatten((str(value),), type_tags, payload, sizes)
+        elif isinstance(value, bool):
+            type_tags.append("T" if value else "F")
+        elif isinstance(value, float):
+            type_tags.append("f")
+            payload.append(value)
+        elif isinstance(value, int):
+            type_tags.append("i")
+            payload.append(value)
+        elif isinstance(value, collections.Sequence):
+            type_tags.append("[")
+            self._flatten(value, type_tags, payload, sizes)
+            type_tags.append("]")
+        else:
+            raise TypeError("Cannot encode {!r}".format(value))
+
+    def _plan_bundle(self, timestamp, contents, realtime, plans):
+        import supriya.osc
+
+        date = supriya.osc.OscBundle._write_date(timestamp, realtime=realtime)
+        plans.append((">8s8s", (self._bundle_prefix, date), 16))
+        size = 16
+        for content in contents:
+            index = len(plans)
+            plans.append(None)
+            if isinstance(content, supriya.osc.OscBundle):
+                content_size = self._plan_bundle(
+                    content.timestamp, content.contents, realtime, plans
+                )
+            else:
+                content_size = self._plan_message(
+                    content.address, content.contents, plans
+                )
+            plans[index] = (">i", (content_size,), 4)
+            size += 4 + content_size
+        return size
+
+    def _plan_message(self, address, contents, plans):
+        type_tags, payload, sizes = [], [], []
+        self._flatten(contents, type_tags, payload, sizes)
+        type_tags = "".join(type_tags)
+        encoder = self._encoders.get((address, type_tags))
+        if encoder is None:
+            encoder = self._compile_encoder(address, type_tags)
+        prefix, format_ = encoder
+        if sizes:
+            format_ = format_ % tuple(sizes)
+            size = struct.calcsize(format_)
+        else:
+            size = format_.size
+        plans.append((format_, (prefix, *payload), size))
+        return size
+
+    ### PUBLIC METHODS ###
+
+    def decode(self, datagram):
+        """
+        Decodes ``datagram`` into an OSC message or bundle.
+
+        ::
+
+            >>> import supriya.osc
+            >>> codec = supriya.osc.OscCodec()
+            >>> bundle = supriya.osc.OscBundle(
+            ...     contents=[supriya.osc.OscMessage('/n_free', 1000)],
+            ...     )
+            >>> codec.decode(codec.encode_bundle(None, bundle.contents))
+            OscBundle(
+                contents=(
+                    OscMessage('/n_free', 1000),
+                    ),
+                )
+
+        Returns OSC message or OSC bundle.
+        """
+        if not isinstance(datagram, bytes):
+            datagram = bytes(datagram)
+        if datagram[:8] == self._bundle_prefix:
+            return self._decode_bundle(datagram, 0, len(datagram))
+        return self._decode_message(datagram, 0, len(datagram))
+
+    def decode_bundle(self, datagram):
+        """
+        Decodes ``datagram`` into an OSC bundle.
+
+        Returns OSC bundle.
+        """
+        if not isinstance(datagram, bytes):
+            datagram = bytes(datagram)
+        if datagram[:8] != self._bundle_prefix:
+            raise ValueError("Not a bundle: {!r}".format(datagram[:8]))
+        return self._decode_bundle(datagram, 0, len(datagram))
+
+    def decode_message(self, datagram):
+        """
+        Decodes ``datagram`` into an OSC message.
+
+        Returns OSC message.
+        """
+        if not isinstance(datagram, bytes):
+            datagram = bytes(datagram)
+        return self._decode_message(datagram, 0, len(datagram))
+
+    def encode_bundle(self, timestamp, contents, realtime=True):
+        """
+        Encodes a bundle of ``contents`` at ``timestamp``.
+
+        The bundle's size is calculated up front, and every nested element
+        is packed into a single preallocated buffer.
+
+        Returns bytes.
+        """
+        plans = []
+        size = self._plan_bundle(timestamp, contents, realtime, plans)
+        buffer_ = bytearray(size)
+        offset = 0
+        for format_, arguments, format_size in plans:
+            if isinstance(format_, str):
+                struct.pack_into(format_, buffer_, offset, *arguments)
+            else:
+                format_.pack_into(buffer_, offset, *arguments)
+            offset += format_size
+        return bytes(buffer_)
+
+    def encode_header(self, address, type_tags):
+        """
+        Encodes the address and type tags of a message.
+
+        Callers holding arguments which are already packed big-endian, such
+        as a NumPy array of samples, can append them to the header directly.
+
+        ::
+
+            >>> import struct
+            >>> import supriya.osc
+            >>> codec = supriya.osc.OscCodec()
+            >>> header = codec.encode_header('/b_setn', 'iiff')
+            >>> codec.decode(header + struct.pack('>iiff', 1, 2, 0.5, 0.25))
+            OscMessage('/b_setn', 1, 2, 0.5, 0.25)
+
+        Returns bytes.
+        """
+        encoder = self._encoders.get((address, type_tags))
+        if encoder is None:
+            encoder = self._compile_encoder(address, type_tags)
+        return encoder[0]
+
+    def encode_message(self, address, contents):
+        """
+        Encodes a message with ``address`` and ``contents``.
+
+        Returns bytes.
+        """
+        type_tags, payload, sizes = [], [], []
+        self._flatten(contents, type_tags, payload, sizes)
+        type_tags = "".join(type_tags)
+        encoder = self._encoders.get((address, type_tags))
+        if encoder is None:
+            encoder = self._compile_encoder(address, type_tags)
+        prefix, format_ = encoder
+        if sizes:
+            return struct.pack(format_ % tuple(sizes), prefix, *payload)
+        return format_.pack(prefix, *payload)
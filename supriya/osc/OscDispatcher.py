@@ -0,0 +1,236 @@
+import re
+import threading
+
+
+class OscDispatcher:
+    """
+    An index of OSC callbacks.
+
+    Callbacks are bucketed by their exact pattern, so matching a message
+    costs one dictionary lookup per pattern prefix: ``(address,)``,
+    ``(address, first_argument)`` and so on. Buckets are immutable tuples
+    replaced wholesale on write, so matching never takes the lock.
+
+    Removal is constant time: a callback is dropped from the live table, and
+    its stale bucket entry is compacted away lazily once at least half of a
+    bucket is stale.
+
+    Addresses containing OSC wildcards (``*``, ``?``, ``[...]``, ``{...}``)
+    are compiled to regular expressions once, at registration.
+
+    ::
+
+        >>> import supriya.osc
+        >>> dispatcher = supriya.osc.OscDispatcher()
+        >>> callback_one = dispatcher.register(('/synced', 1), 'one')
+        >>> callback_two = dispatcher.register(('/n_*',), 'two')
+        >>> callback_three = dispatcher.register(('/{n_go,n_end}', 1000), 'three')
+
+    ::
+
+        >>> dispatcher.match(supriya.osc.OscMessage('/synced', 1))
+        ['one']
+
+    ::
+
+        >>> dispatcher.match(supriya.osc.OscMessage('/n_go', 1000, 0, -1, -1, 0))
+        ['two', 'three']
+
+    ::
+
+        >>> dispatcher.unregister(callback_two)
+        >>> dispatcher.match(supriya.osc.OscMessage('/n_go', 1000, 0, -1, -1, 0))
+        ['three']
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_compiled_patterns",
+        "_index",
+        "_keys",
+        "_live",
+        "_lock",
+        "_maximum_length",
+        "_stale_counts",
+        "_wildcards",
+    )
+
+    _wildcard_characters = frozenset("*?[{")
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self._compiled_patterns = {}
+        self._index = {}
+        self._keys = {}
+        self._live = {}
+        self._lock = threading.RLock()
+        self._maximum_length = 0
+        self._stale_counts = {}
+        self._wildcards = ()
+
+    ### SPECIAL METHODS ###
+
+    def __iter__(self):
+        return iter(tuple(callback for callback, _ in self._live.values()))
+
+    def __len__(self):
+        return len(self._live)
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _compile_address(cls, address):
+        """
+        Compiles an OSC address pattern into a regular expression.
+
+        ::
+
+            >>> import supriya.osc
+            >>> compiled = supriya.osc.OscDispatcher._compile_address(
+            ...     '/foo/[!a-c]?/{bar,baz}*'
+            ...     )
+            >>> compiled.pattern
+            '/foo/[^a-c][^/]/(?:bar|baz)[^/]*'
+
+        """
+        regex, index = "", 0
+        while index < len(address):
+            character = address[index]
+            index += 1
+            if character == "*":
+                regex += "[^/]*"
+            elif character == "?":
+                regex += "[^/]"
+            elif character == "[":
+                end = address.index("]", index)
+                characters = address[index:end]
+                index = end + 1
+                negate = characters.startswith("!")
+                if negate:
+                    characters = characters[1:]
+                characters = "".join("\\" + x if x in "\\^]" else x for x in characters)
+                regex += "[{}{}]".format("^" if negate else "", characters)
+            elif character == "{":
+                end = address.index("}", index)
+                alternatives = address[index:end].split(",")
+                index = end + 1
+                regex += "(?:{})".format("|".join(re.escape(x) for x in alternatives))
+            else:
+                regex += re.escape(character)
+        return re.compile(regex)
+
+    def _is_wildcard(self, pattern):
+        address = pattern[0]
+        return isinstance(address, str) and not self._wildcard_characters.isdisjoint(
+            address
+        )
+
+    def _mark_stale(self, key):
+        # Called with the lock held.
+        if key is None:
+            self._wildcards = tuple(
+                entry for entry in self._wildcards if id(entry[2]) in self._live
+            )
+            return
+        bucket = self._index.get(key, ())
+        stale_count = self._stale_counts.get(key, 0) + 1
+        if stale_count * 2 < len(bucket):
+            self._stale_counts[key] = stale_count
+            return
+        bucket = tuple(x for x in bucket if id(x) in self._live)
+        self._stale_counts.pop(key, None)
+        if bucket:
+            self._index[key] = bucket
+        else:
+            self._index.pop(key, None)
+
+    ### PUBLIC METHODS ###
+
+    def match(self, message):
+        """
+        Matches ``message`` against registered callbacks.
+
+        One-shot callbacks are claimed atomically, so a one-shot callback is
+        returned by at most one call, even when several threads match
+        concurrently.
+
+        Returns list of callbacks.
+        """
+        live, index = self._live, self._index
+        items = (message.address,) + message.contents
+        matching_callbacks = []
+        for length in range(1, min(self._maximum_length, len(items)) + 1):
+            try:
+                bucket = index.get(items[:length])
+            except TypeError:  # unhashable argument, e.g. a blob
+                break
+            if bucket:
+                for callback in bucket:
+                    if id(callback) in live:
+                        matching_callbacks.append(callback)
+        if self._wildcards and isinstance(message.address, str):
+            for compiled, arguments, callback in self._wildcards:
+                if (
+                    compiled.fullmatch(message.address)
+                    and items[1 : len(arguments) + 1] == arguments
+                    and id(callback) in live
+                ):
+                    matching_callbacks.append(callback)
+        claimed = []
+        for i, callback in enumerate(matching_callbacks):
+            if not getattr(callback, "once", False):
+                continue
+            if live.pop(id(callback), None) is None:
+                matching_callbacks[i] = None
+            else:
+                claimed.append(callback)
+        if claimed:
+            with self._lock:
+                for callback in claimed:
+                    self._mark_stale(self._keys.pop(id(callback)))
+            matching_callbacks = [x for x in matching_callbacks if x is not None]
+        return matching_callbacks
+
+    def register(self, pattern, callback):
+        """
+        Registers ``callback`` against ``pattern``.
+
+        Returns ``callback``.
+        """
+        pattern = tuple(pattern)
+        with self._lock:
+            self._live[id(callback)] = (callback, pattern)
+            if self._is_wildcard(pattern):
+                compiled = self._compiled_patterns.get(pattern[0])
+                if compiled is None:
+                    compiled = self._compile_address(pattern[0])
+                    self._compiled_patterns[pattern[0]] = compiled
+                self._wildcards += ((compiled, pattern[1:], callback),)
+                self._keys[id(callback)] = None
+            else:
+                bucket = self._index.get(pattern, ())
+                self._index[pattern] = bucket + (callback,)
+                self._keys[id(callback)] = pattern
+                self._maximum_length = max(self._maximum_length, len(pattern))
+        return callback
+
+    def unregister(self, callback):
+        """
+        Unregisters ``callback``.
+        """
+        with self._lock:
+            if self._live.pop(id(callback), None) is None:
+                return
+            self._mark_stale(self._keys.pop(id(callback)))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def patterns(self):
+        """
+        Gets ``(pattern, callback)`` pairs in registration order.
+        """
+        return tuple((pattern, callback) for callback, pattern in self._live.values())
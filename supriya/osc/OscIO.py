@@ -1,12 +1,18 @@
 import collections
+import heapq
+import itertools
+import select
+import socket
 import socketserver
 import threading
 import time
+import traceback
 import typing
 
 from supriya.commands.Requestable import Requestable
 from supriya.commands.Response import Response
 from supriya.osc.OscBundle import OscBundle
+from supriya.osc.OscDispatcher import OscDispatcher
 from supriya.osc.OscMessage import OscMessage
 
 
@@ -73,39 +79,118 @@ class OscIO:
 
     class OscHandler(socketserver.BaseRequestHandler):
         def handle(self):
-            data = self.request[0]
-            message = OscMessage.from_datagram(data)
-            debug_osc = self.server.io_instance.debug_osc
-            debug_udp = self.server.io_instance.debug_udp
-            # TODO: Is it worth the additional thread creation?
-            response = None
-            for callback in self.server.io_instance.match(message):
-                if callback.parse_response:
-                    if response is None:
-                        handler = self.server.io_instance.response_handlers.get(
-                            message.address
-                        )
-                        if handler:
-                            response = handler.from_osc_message(message)
-                    args = response
-                else:
-                    args = message
-                callback.procedure(args)
-            if message.address != "/status.reply":
-                for capture in self.server.io_instance.captures:
-                    capture.messages.append(
-                        OscIO.CaptureEntry(
-                            timestamp=time.time(),
-                            label="R",
-                            message=message,
-                            command=response,
-                        )
+            self.server.io_instance._process_datagram(self.request[0])
+
+    class OscReceiver:
+        """
+        Receives datagrams on a single long-lived thread.
+
+        The socket is drained in batches into a reused buffer, and each batch
+        is dispatched in arrival order on the receiving thread. Callbacks must
+        not block waiting on further responses.
+        """
+
+        def __init__(
+            self, io_instance, batch_size=256, buffer_size=65536, poll_interval=0.5
+        ):
+            self.batch_size = batch_size
+            self.io_instance = io_instance
+            self.is_shutdown = threading.Event()
+            self.poll_interval = poll_interval
+            self.buffer = bytearray(buffer_size)
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.socket.setblocking(False)
+
+        def receive(self):
+            view = memoryview(self.buffer)
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    size, _ = self.socket.recvfrom_into(self.buffer)
+                except OSError:
+                    break
+                batch.append(bytes(view[:size]))
+            return batch
+
+        def serve_forever(self):
+            self.is_shutdown.clear()
+            while not self.is_shutdown.is_set():
+                try:
+                    readable, _, _ = select.select(
+                        [self.socket], [], [], self.poll_interval
                     )
-                if debug_osc:
-                    print("RECV", "{:0.6f}".format(time.time()), message.to_list())
-                    if debug_udp:
-                        for line in str(message).splitlines():
-                            print("    " + line)
+                except (OSError, ValueError):
+                    break
+                if not readable:
+                    continue
+                for datagram in self.receive():
+                    try:
+                        self.io_instance._process_datagram(datagram)
+                    except Exception:
+                        traceback.print_exc()
+
+        def shutdown(self):
+            self.is_shutdown.set()
+            self.socket.close()
+
+    class OscScheduler:
+        """
+        Holds future-stamped messages in a heap until they are due.
+
+        Messages are dispatched in timestamp order on a single thread, and
+        messages sharing a timestamp dispatch in arrival order.
+        """
+
+        def __init__(self, io_instance):
+            self.condition = threading.Condition()
+            self.counter = itertools.count()
+            self.heap = []
+            self.io_instance = io_instance
+            self.is_running = False
+            self.thread = None
+
+        def run(self):
+            while True:
+                with self.condition:
+                    while self.is_running and (
+                        not self.heap or self.heap[0][0] > time.time()
+                    ):
+                        timeout = None
+                        if self.heap:
+                            timeout = self.heap[0][0] - time.time()
+                        self.condition.wait(timeout)
+                    if not self.is_running:
+                        return
+                    due = []
+                    now = time.time()
+                    while self.heap and self.heap[0][0] <= now:
+                        due.append(heapq.heappop(self.heap)[2])
+                for message in due:
+                    try:
+                        self.io_instance._process_message(message)
+                    except Exception:
+                        traceback.print_exc()
+
+        def schedule(self, timestamp, message):
+            with self.condition:
+                heapq.heappush(self.heap, (timestamp, next(self.counter), message))
+                self.condition.notify()
+
+        def start(self):
+            with self.condition:
+                if self.is_running:
+                    return
+                self.is_running = True
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+            self.thread.start()
+
+        def stop(self):
+            with self.condition:
+                self.is_running = False
+                self.heap[:] = []
+                self.condition.notify()
+            self.thread = None
 
     class OscCallback(typing.NamedTuple):
         pattern: typing.Tuple[typing.Union[str, int, float], ...]
@@ -113,26 +198,34 @@ class OscIO:
         once: bool
         parse_response: bool
 
+    _receive_modes = ("serial", "threaded")
+
     def __init__(
         self,
         debug_osc=False,
         debug_udp=False,
         ip_address="127.0.0.1",
         port=57751,
+        receive_mode="threaded",
+        schedule_bundles=False,
         timeout=2,
     ):
         import supriya.commands
 
-        self.callbacks = {}
         self.captures = set()
+        self.datagram_procedures = {}
         self.debug_osc = bool(debug_osc)
         self.debug_udp = bool(debug_udp)
+        self.dispatcher = OscDispatcher()
         self.ip_address = ip_address
         self.lock = threading.RLock()
         self.server = None
         self.server_thread = None
         self.port = port
         self.is_running = False
+        self.receive_mode = receive_mode
+        self.schedule_bundles = bool(schedule_bundles)
+        self.scheduler = self.OscScheduler(self)
         self.timeout = timeout
         self.response_handlers = {
             "/b_info": supriya.commands.BufferInfoResponse,
@@ -156,12 +249,87 @@ class OscIO:
             "/synced": supriya.commands.SyncedResponse,
             "/tr": supriya.commands.TriggerResponse,
         }
+        if receive_mode not in self._receive_modes:
+            raise ValueError(receive_mode)
 
     ### SPECIAL METHODS ###
 
     def __del__(self):
         self.quit()
 
+    ### PRIVATE METHODS ###
+
+    def _iterate_bundle(self, bundle, timestamp=None):
+        if bundle.timestamp is not None:
+            timestamp = max(timestamp or 0.0, bundle.timestamp)
+        for content in bundle.contents:
+            if isinstance(content, OscBundle):
+                yield from self._iterate_bundle(content, timestamp)
+            else:
+                yield timestamp, content
+
+    def _process_bundle(self, bundle):
+        now = time.time()
+        entries = sorted(
+            self._iterate_bundle(bundle),
+            key=lambda entry: entry[0] if entry[0] is not None else 0.0,
+        )
+        for timestamp, message in entries:
+            if self.schedule_bundles and timestamp is not None and now < timestamp:
+                self._schedule_message(timestamp, message)
+            else:
+                self._process_message(message)
+
+    def _process_datagram(self, datagram):
+        if OscBundle.datagram_is_bundle(datagram):
+            self._process_bundle(OscBundle.from_datagram(datagram))
+            return
+        if self.datagram_procedures:
+            address = datagram[: datagram.find(b"\x00")]
+            for procedure in self.datagram_procedures.get(address, ()):
+                try:
+                    handled = procedure(datagram)
+                except Exception:
+                    traceback.print_exc()
+                    continue
+                if handled and not (self.captures or self.debug_osc):
+                    return
+        self._process_message(OscMessage.from_datagram(datagram))
+
+    def _process_message(self, message):
+        response = None
+        for callback in self.match(message):
+            if callback.parse_response:
+                if response is None:
+                    handler = self.response_handlers.get(message.address)
+                    if handler:
+                        response = handler.from_osc_message(message)
+                args = response
+            else:
+                args = message
+            callback.procedure(args)
+        if message.address != "/status.reply":
+            for capture in self.captures:
+                capture.messages.append(
+                    OscIO.CaptureEntry(
+                        timestamp=time.time(),
+                        label="R",
+                        message=message,
+                        command=response,
+                    )
+                )
+            if self.debug_osc:
+                print("RECV", "{:0.6f}".format(time.time()), message.to_list())
+                if self.debug_udp:
+                    for line in str(message).splitlines():
+                        print("    " + line)
+
+    def _schedule_message(self, timestamp, message):
+        self.scheduler.schedule(timestamp, message)
+
+    def _send_datagram(self, datagram):
+        self.server.socket.sendto(datagram, (self.ip_address, self.port))
+
     ### PUBLIC METHODS ###
 
     def boot(self, ip_address=None, port=None):
@@ -172,13 +340,20 @@ class OscIO:
                 self.ip_address = ip_address
             if port:
                 self.port = port
-            self.server = self.OscServer(
-                (self.ip_address, self.port), self.OscHandler, bind_and_activate=False
-            )
-            self.server.io_instance = self
+            if self.receive_mode == "serial":
+                self.server = self.OscReceiver(self)
+            else:
+                self.server = self.OscServer(
+                    (self.ip_address, self.port),
+                    self.OscHandler,
+                    bind_and_activate=False,
+                )
+                self.server.io_instance = self
             self.server_thread = threading.Thread(target=self.server.serve_forever)
             self.server_thread.daemon = True
             self.server_thread.start()
+            if self.schedule_bundles:
+                self.scheduler.start()
             self.is_running = True
 
     def capture(self):
@@ -222,25 +397,14 @@ class OscIO:
             ...
 
         """
-        items = (message.address,) + message.contents
-        matching_callbacks = []
-        with self.lock:
-            callback_map = self.callbacks
-            for item in items:
-                if item not in callback_map:
-                    break
-                callbacks, callback_map = callback_map[item]
-                matching_callbacks.extend(callbacks)
-            for callback in matching_callbacks:
-                if callback.once:
-                    self.unregister(callback)
-        return matching_callbacks
+        return self.dispatcher.match(message)
 
     def quit(self):
         with self.lock:
             if not self.is_running:
                 return
             self.server.shutdown()
+            self.scheduler.stop()
             self.server = None
             self.server_thread = None
             self.is_running = False
@@ -275,28 +439,65 @@ class OscIO:
             once=bool(once),
             parse_response=bool(parse_response),
         )
+        return self.dispatcher.register(callback.pattern, callback)
+
+    def register_datagram(self, address, procedure):
+        """
+        Register a procedure receiving undecoded datagrams.
+
+        `procedure` is called with each datagram received for a message
+        addressed to `address`, outside of any bundle, before it is decoded.
+        Returning true marks the datagram as handled, and skips decoding and
+        dispatching it to callbacks, unless capturing or debugging.
+
+        ::
+
+            >>> io = supriya.osc.OscIO()
+            >>> handle = io.register_datagram('/b_setn', lambda datagram: True)
+            >>> io.datagram_procedures
+            {b'/b_setn': (<function <lambda> at 0x...>,)}
+
+        ::
+
+            >>> io.unregister_datagram(handle)
+            >>> io.datagram_procedures
+            {}
+
+        Returns handle for unregistering.
+        """
+        assert callable(procedure)
+        address = address.encode("utf-8")
         with self.lock:
-            callback_map = self.callbacks
-            for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
-        return callback
+            procedures = self.datagram_procedures.get(address, ())
+            self.datagram_procedures[address] = procedures + (procedure,)
+        return address, procedure
 
     def send(self, message, with_request_name=False):
         if not self.is_running:
             raise RuntimeError
         request = None
+        datagram = None
         if isinstance(message, Requestable):
             request = message
             message = message.to_osc(with_request_name=with_request_name)
+        if isinstance(message, (bytes, bytearray)):
+            # Pre-encoded datagrams are only decoded when someone is looking.
+            datagram = message
+            message = None
+            if self.captures or self.debug_osc:
+                message = OscMessage._codec.decode(datagram)
         prototype = (str, collections.Iterable, OscBundle, OscMessage)
-        if not isinstance(message, prototype):
+        if message is None:
+            pass
+        elif not isinstance(message, prototype):
             raise ValueError(message)
-        if isinstance(message, str):
+        elif isinstance(message, str):
             message = OscMessage(message)
         elif isinstance(message, collections.Iterable):
             message = OscMessage(*message)
-        if not (isinstance(message, OscMessage) and message.address in (2, "/status")):
+        if message is not None and not (
+            isinstance(message, OscMessage) and message.address in (2, "/status")
+        ):
             for capture in self.captures:
                 capture.messages.append(
                     OscIO.CaptureEntry(
@@ -311,8 +512,9 @@ class OscIO:
                 if self.debug_udp:
                     for line in str(message).splitlines():
                         print("    " + line)
-        datagram = message.to_datagram()
-        self.server.socket.sendto(datagram, (self.ip_address, self.port))
+        if datagram is None:
+            datagram = message.to_datagram()
+        self._send_datagram(datagram)
 
     def unregister(self, callback):
         """
@@ -354,17 +556,37 @@ class OscIO:
 
         """
 
-        def delete(pattern, original_callback_map):
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
+        self.dispatcher.unregister(callback)
 
+    def unregister_datagram(self, handle):
+        """
+        Unregister a procedure receiving undecoded datagrams.
+        """
+        address, procedure = handle
         with self.lock:
-            delete(list(callback.pattern), self.callbacks)
+            procedures = tuple(
+                _
+                for _ in self.datagram_procedures.get(address, ())
+                if _ is not procedure
+            )
+            if procedures:
+                self.datagram_procedures[address] = procedures
+            else:
+                self.datagram_procedures.pop(address, None)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def callbacks(self):
+        """
+        Gets a trie of registered callbacks, keyed by pattern item.
+
+        Built on demand from the dispatcher, for introspection only.
+        """
+        callbacks = {}
+        for pattern, callback in self.dispatcher.patterns:
+            callback_map = callbacks
+            for item in pattern:
+                items, callback_map = callback_map.setdefault(item, ([], {}))
+            items.append(callback)
+        return callbacks
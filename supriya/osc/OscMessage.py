@@ -3,6 +3,7 @@ import enum
 import struct
 
 from supriya.osc import format_datagram
+from supriya.osc.OscCodec import OscCodec
 from supriya.system.SupriyaValueObject import SupriyaValueObject
 
 
@@ -29,6 +30,8 @@ class OscMessage(SupriyaValueObject):
 
     __slots__ = ("_address", "_contents")
 
+    _codec = OscCodec()
+
     ### INITIALIZER ###
 
     def __init__(self, address, *contents):
@@ -301,40 +304,11 @@ class OscMessage(SupriyaValueObject):
 
     def to_datagram(self):
         # address can be a string or (in SuperCollider) an int
-        datagram = OscMessage._encode_value(self.address)[1]
-        if self.contents is None:
-            return datagram
-        encoded_type_tags = ","
-        encoded_contents = b""
-        for argument in self.contents:
-            type_tags, encoded_value = OscMessage._encode_value(argument)
-            encoded_type_tags += type_tags
-            if encoded_value is not None:
-                encoded_contents += encoded_value
-        encoded_type_tags = OscMessage._encode_string(encoded_type_tags)[1]
-        datagram += encoded_type_tags
-        datagram += encoded_contents
-        datagram = bytes(datagram)
-        return datagram
+        return OscMessage._codec.encode_message(self.address, self.contents)
 
     @staticmethod
     def from_datagram(datagram):
-        datagram = bytearray(datagram)
-        contents = []
-        offset = 0
-        address, offset = OscMessage._read_string(datagram, offset)
-        type_tags, offset = OscMessage._read_string(datagram, offset)
-        assert type_tags[0] == ","
-        payload = datagram[offset:]
-        payload_offset = 0
-        type_tag_offset = 1
-        while type_tag_offset < len(type_tags):
-            result, type_tag_offset, payload_offset = OscMessage._decode_value(
-                type_tags, type_tag_offset, payload, payload_offset
-            )
-            contents.append(result)
-        osc_message = OscMessage(address, *contents)
-        return osc_message
+        return OscMessage._codec.decode_message(datagram)
 
     def to_list(self):
         result = [self.address]
@@ -37,7 +37,10 @@ def format_datagram(datagram):
     return result
 
 
+from .AsyncOscIO import AsyncOscIO  # noqa
 from .OscBundle import OscBundle  # noqa
 from .OscCallback import OscCallback  # noqa
+from .OscCodec import OscCodec  # noqa
+from .OscDispatcher import OscDispatcher  # noqa
 from .OscIO import OscIO  # noqa
 from .OscMessage import OscMessage  # noqa
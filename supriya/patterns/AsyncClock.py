@@ -0,0 +1,102 @@
+import asyncio
+import time
+import traceback
+
+from supriya.patterns.Clock import Clock
+
+
+class AsyncClock(Clock):
+    """
+    A clock driven by an asyncio event loop.
+
+    Procedures are scheduled with ``loop.call_at()`` against the loop's
+    monotonic clock, and run on the loop's thread, so many players can share
+    one loop without thread switching. Scheduled times remain wall-clock
+    seconds, mapped onto the loop's clock once at construction.
+
+    Must only be used from the loop's own thread.
+
+    ::
+
+        >>> import asyncio
+        >>> import time
+        >>> import supriya.patterns
+        >>> async def main():
+        ...     clock = supriya.patterns.AsyncClock()
+        ...     manifest = []
+        ...     def procedure(execution_time, scheduled_time):
+        ...         manifest.append(round(scheduled_time - now, 6))
+        ...         if len(manifest) < 3:
+        ...             return 0.01
+        ...     now = time.time()
+        ...     clock.schedule(procedure, now + 0.01, absolute=True)
+        ...     await asyncio.sleep(0.1)
+        ...     return manifest
+        ...
+        >>> loop = asyncio.new_event_loop()
+        >>> loop.run_until_complete(main())
+        [0.01, 0.02, 0.03]
+        >>> loop.close()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    _default_clock = None
+
+    __slots__ = ("_loop", "_offset")
+
+    ### INITIALIZER ###
+
+    def __init__(self, loop=None):
+        Clock.__init__(self)
+        self._loop = loop or asyncio.get_event_loop()
+        self._offset = time.time() - self._loop.time()
+
+    ### PRIVATE METHODS ###
+
+    def _call(self, procedure, scheduled_time, registry_key):
+        with self._lock:
+            self._registry.pop(registry_key, None)
+            execution_time = self._loop.time() + self._offset
+            self._record_lateness(execution_time - scheduled_time)
+            try:
+                delta = procedure(execution_time, scheduled_time)
+            except Exception:
+                traceback.print_exc()
+                return
+            if delta is not None:
+                self._push(procedure, scheduled_time + delta, registry_key)
+
+    def _push(self, procedure, scheduled_time, registry_key):
+        handle = self._registry.pop(registry_key, None)
+        if handle is not None:
+            handle.cancel()
+        self._registry[registry_key] = self._loop.call_at(
+            scheduled_time - self._offset,
+            self._call,
+            procedure,
+            scheduled_time,
+            registry_key,
+        )
+
+    ### PUBLIC METHODS ###
+
+    def cancel(self, registry_key):
+        with self._lock:
+            handle = self._registry.pop(registry_key, None)
+            if handle is not None:
+                handle.cancel()
+
+    def reset(self):
+        with self._lock:
+            for handle in self._registry.values():
+                handle.cancel()
+            self._registry.clear()
+            self._reset_statistics()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def loop(self):
+        return self._loop
@@ -0,0 +1,185 @@
+import math
+import time
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class BeatClock(SupriyaObject):
+    """
+    A tempo-aware clock, scheduling procedures in beats.
+
+    Layered on a ``Clock``. Procedures are called with their execution time
+    and the time in seconds of their beat, and may return a delta in beats
+    to be rescheduled.
+
+    Procedures run `lookahead` seconds before their beat. Each wakeup also
+    runs any further beats falling within the next lookahead window, so
+    dense procedures are called in batches rather than once per beat.
+
+    ::
+
+        >>> import supriya.patterns
+        >>> beat_clock = supriya.patterns.BeatClock(tempo=120, start_time=0.0)
+        >>> beat_clock.get_seconds(8)
+        4.0
+
+    ::
+
+        >>> beat_clock.quantize(5.5)
+        6.0
+        >>> beat_clock.quantize(5.5, beat_clock.beats_per_bar)
+        8.0
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_beats",
+        "_beats_per_bar",
+        "_callbacks",
+        "_clock",
+        "_lock",
+        "_lookahead",
+        "_tempo_map",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, tempo=60, beats_per_bar=4, lookahead=0.1, clock=None, start_time=None
+    ):
+        import supriya.patterns
+
+        clock = clock or supriya.patterns.Clock.get_default_clock()
+        assert isinstance(clock, supriya.patterns.Clock)
+        assert 0 < beats_per_bar and 0 <= lookahead
+        if start_time is None:
+            start_time = time.time()
+        self._beats = {}
+        self._beats_per_bar = beats_per_bar
+        self._callbacks = {}
+        self._clock = clock
+        # Share the clock's lock: callbacks already run while holding it, and
+        # wakeups are pushed straight onto its heap, even when already due.
+        self._lock = clock._lock
+        self._lookahead = float(lookahead)
+        self._tempo_map = supriya.patterns.TempoMap(tempo=tempo, start_time=start_time)
+
+    ### PRIVATE METHODS ###
+
+    def _get_wakeup_time(self, beat):
+        return self._tempo_map.beat_to_seconds(beat) - self._lookahead
+
+    def _new_callback(self, procedure, registry_key):
+        def callback(execution_time, scheduled_time):
+            window_stop = scheduled_time + self._lookahead * 2
+            beat = self._beats[registry_key]
+            while True:
+                event_time = self._tempo_map.beat_to_seconds(beat)
+                delta = procedure(execution_time, event_time)
+                if delta is None:
+                    self._beats.pop(registry_key)
+                    self._callbacks.pop(registry_key)
+                    return None
+                beat += delta
+                if window_stop < self._tempo_map.beat_to_seconds(beat):
+                    break
+            self._beats[registry_key] = beat
+            return self._get_wakeup_time(beat) - scheduled_time
+
+        return callback
+
+    ### PUBLIC METHODS ###
+
+    def cancel(self, registry_key):
+        with self._lock:
+            if registry_key in self._callbacks:
+                self._beats.pop(registry_key)
+                self._callbacks.pop(registry_key)
+                self._clock.cancel((self, registry_key))
+
+    def get_beat(self, seconds=None):
+        """
+        Gets the beat at `seconds`, defaulting to now.
+        """
+        if seconds is None:
+            seconds = time.time()
+        with self._lock:
+            return self._tempo_map.seconds_to_beat(seconds)
+
+    def get_next_beat(self, quantization=None):
+        """
+        Gets the earliest beat which can still be scheduled a full
+        lookahead ahead, quantized to `quantization` beats.
+        """
+        beat = self.get_beat(time.time() + self._lookahead)
+        return self.quantize(beat, quantization)
+
+    def get_seconds(self, beat):
+        """
+        Gets the time in seconds of `beat`.
+        """
+        with self._lock:
+            return self._tempo_map.beat_to_seconds(beat)
+
+    def quantize(self, beat, quantization=1):
+        """
+        Rounds `beat` up to the next multiple of `quantization` beats.
+        """
+        if not quantization:
+            return beat
+        return float(math.ceil(round(beat / quantization, 9)) * quantization)
+
+    def schedule(self, procedure, beat=None, quantization=None, registry_key=None):
+        """
+        Schedules `procedure` at `beat`, or at the next schedulable beat,
+        quantized to `quantization` beats.
+
+        Returns the scheduled beat.
+        """
+        registry_key = registry_key or procedure
+        if beat is None:
+            beat = self.get_next_beat(quantization)
+        elif quantization:
+            beat = self.quantize(beat, quantization)
+        with self._lock:
+            callback = self._new_callback(procedure, registry_key)
+            self._beats[registry_key] = beat
+            self._callbacks[registry_key] = callback
+            wakeup_time = self._get_wakeup_time(beat)
+            self._clock._push(callback, wakeup_time, (self, registry_key))
+        return beat
+
+    def set_tempo(self, tempo, beat=None, ramp_beats=0):
+        """
+        Changes the tempo to `tempo` beats per minute from `beat`, defaulting
+        to the next schedulable beat, ramping linearly over `ramp_beats`.
+
+        Pending procedures are rescheduled against the new tempo map.
+        """
+        with self._lock:
+            if beat is None:
+                beat = self.get_next_beat()
+            self._tempo_map.set_tempo(tempo, beat=beat, ramp_beats=ramp_beats)
+            for registry_key, callback in tuple(self._callbacks.items()):
+                wakeup_time = self._get_wakeup_time(self._beats[registry_key])
+                self._clock._push(callback, wakeup_time, (self, registry_key))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def beats_per_bar(self):
+        return self._beats_per_bar
+
+    @property
+    def clock(self):
+        return self._clock
+
+    @property
+    def lookahead(self):
+        return self._lookahead
+
+    @property
+    def tempo_map(self):
+        return self._tempo_map
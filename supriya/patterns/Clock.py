@@ -1,61 +1,138 @@
+import bisect
+import heapq
+import itertools
+import math
 import threading
 import time
-from queue import PriorityQueue
+import traceback
+import typing
 
 from supriya.system.SupriyaObject import SupriyaObject
 
 
 class Clock(SupriyaObject):
+    """
+    A clock.
+
+    Scheduled procedures are kept in a deadline heap and executed by a single
+    scheduler thread, which sleeps on a condition variable until the earliest
+    deadline. The thread is started on demand and exits once nothing remains
+    scheduled.
+
+    Procedures are called with their execution and scheduled times, and may
+    return a delta in seconds to be rescheduled relative to their scheduled
+    time.
+    """
 
     ### CLASS VARIABLES ###
 
     _default_clock = None
 
-    __slots__ = ("_lock", "_queue", "_timer", "_registry")
+    _lateness_bins = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, math.inf)
+
+    __slots__ = (
+        "_condition",
+        "_counter",
+        "_lateness_counts",
+        "_lateness_maximum",
+        "_lateness_total",
+        "_lock",
+        "_queue",
+        "_registry",
+        "_thread",
+        "_tombstone_count",
+    )
+
+    class Statistics(typing.NamedTuple):
+        callback_count: int
+        mean_lateness: float
+        maximum_lateness: float
+        lateness_histogram: typing.Tuple[typing.Tuple[float, int], ...]
 
     ### INITIALIZER ###
 
     def __init__(self):
         self._lock = threading.RLock()
-        self._queue = PriorityQueue()
-        self._timer = None
+        self._condition = threading.Condition(self._lock)
+        self._counter = itertools.count()
+        self._queue = []
         self._registry = {}
+        self._thread = None
+        self._tombstone_count = 0
+        self._reset_statistics()
 
     ### PRIVATE METHODS ###
 
+    def _compact(self):
+        # Tombstones are normally discarded as they reach the head of the
+        # heap; rebuild it once they make up most of its entries.
+        if self._tombstone_count * 2 <= len(self._queue):
+            return
+        self._queue = [entry for entry in self._queue if self._is_live(entry)]
+        heapq.heapify(self._queue)
+        self._tombstone_count = 0
+
     def _execute(self, execution_time):
-        with self._lock:
-            while not self._queue.empty():
-                pair = self._queue.get()
-                if execution_time < pair[0]:
-                    self._queue.put(pair)
-                    break
-                scheduled_time, registry_key = pair
-                if registry_key not in self._registry:
-                    continue
-                procedure = self._registry[registry_key]
+        while self._queue and self._queue[0][0] <= execution_time:
+            entry = heapq.heappop(self._queue)
+            if not self._is_live(entry):
+                self._tombstone_count -= 1
+                continue
+            scheduled_time, _, registry_key, procedure = entry
+            self._registry.pop(registry_key)
+            self._record_lateness(time.time() - scheduled_time)
+            try:
                 delta = procedure(execution_time, scheduled_time)
-                if delta is not None:
-                    rescheduled_time = scheduled_time + delta
-                    self.schedule(
-                        procedure,
-                        rescheduled_time,
-                        absolute=True,
-                        registry_key=registry_key,
-                    )
-            if not self._queue.empty():
-                self._new_timer()
-
-    def _new_timer(self):
-        if self._timer is not None:
-            self._timer.cancel()
-        pair = self._queue.get()
-        self._queue.put(pair)
-        scheduled_time, _ = pair
-        now = time.time()
-        delta = scheduled_time - now
-        self._timer = threading.Timer(delta, self._execute, (scheduled_time,))
-        self._timer.start()
+            except Exception:
+                traceback.print_exc()
+                continue
+            if delta is not None:
+                self._push(procedure, scheduled_time + delta, registry_key)
+
+    def _is_live(self, entry):
+        return self._registry.get(entry[2]) is entry
+
+    def _push(self, procedure, scheduled_time, registry_key):
+        entry = (scheduled_time, next(self._counter), registry_key, procedure)
+        if self._registry.pop(registry_key, None) is not None:
+            self._tombstone_count += 1
+        self._registry[registry_key] = entry
+        heapq.heappush(self._queue, entry)
+        self._compact()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        elif self._queue[0] is entry:
+            self._condition.notify()
+
+    def _record_lateness(self, lateness):
+        lateness = max(lateness, 0.0)
+        self._lateness_counts[bisect.bisect_left(self._lateness_bins, lateness)] += 1
+        self._lateness_maximum = max(self._lateness_maximum, lateness)
+        self._lateness_total += lateness
+
+    def _reset_statistics(self):
+        self._lateness_counts = [0] * len(self._lateness_bins)
+        self._lateness_maximum = 0.0
+        self._lateness_total = 0.0
+
+    def _run(self):
+        with self._condition:
+            try:
+                while True:
+                    while self._queue and not self._is_live(self._queue[0]):
+                        heapq.heappop(self._queue)
+                        self._tombstone_count -= 1
+                    if not self._queue:
+                        return
+                    scheduled_time = self._queue[0][0]
+                    delta = scheduled_time - time.time()
+                    if 0 < delta:
+                        self._condition.wait(delta)
+                    else:
+                        self._execute(scheduled_time)
+            finally:
+                self._thread = None
 
     ### PUBLIC METHODS ###
 
@@ -63,6 +140,8 @@ class Clock(SupriyaObject):
         with self._lock:
             if registry_key in self._registry:
                 self._registry.pop(registry_key)
+                self._tombstone_count += 1
+                self._compact()
 
     @classmethod
     def get_default_clock(cls):
@@ -72,11 +151,11 @@ class Clock(SupriyaObject):
 
     def reset(self):
         with self._lock:
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
             self._registry.clear()
-            self._queue = PriorityQueue()
+            self._queue = []
+            self._tombstone_count = 0
+            self._reset_statistics()
+            self._condition.notify()
 
     def schedule(
         self, procedure, scheduled_time=0.0, absolute=False, registry_key=None
@@ -97,7 +176,31 @@ class Clock(SupriyaObject):
                         registry_key=registry_key,
                     )
             else:
-                self._registry[registry_key] = procedure
-                self._queue.put((scheduled_time, registry_key))
-                self._new_timer()
+                self._push(procedure, scheduled_time, registry_key)
         return now
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def statistics(self):
+        """
+        Lateness statistics for procedures executed by the scheduler thread.
+
+        Lateness is the time in seconds between a procedure's scheduled time
+        and the moment it was called. The histogram pairs each bin's upper
+        bound with its count.
+        """
+        with self._lock:
+            counts = list(self._lateness_counts)
+            maximum_lateness = self._lateness_maximum
+            total_lateness = self._lateness_total
+        callback_count = sum(counts)
+        mean_lateness = 0.0
+        if callback_count:
+            mean_lateness = total_lateness / callback_count
+        return self.Statistics(
+            callback_count=callback_count,
+            mean_lateness=mean_lateness,
+            maximum_lateness=maximum_lateness,
+            lateness_histogram=tuple(zip(self._lateness_bins, counts)),
+        )
@@ -53,6 +53,22 @@ class Event(SupriyaValueObject):
     def _expand(
         self, settings, synthdef, uuids, realtime=True, synth_parameters_only=False
     ):
+        if not any(
+            isinstance(value, collections.Sequence)
+            or (isinstance(value, uuid.UUID) and value in uuids)
+            for value in settings.values()
+        ):
+            # Nothing to look up or expand, so there is exactly one channel.
+            if synth_parameters_only:
+                parameter_names = synthdef.parameter_names
+                return [
+                    {
+                        key: value
+                        for key, value in settings.items()
+                        if key in parameter_names
+                    }
+                ]
+            return [settings.copy()]
         settings = settings.copy()
         for key, value in settings.items():
             if isinstance(value, uuid.UUID) and value in uuids:
@@ -95,6 +111,17 @@ class Event(SupriyaValueObject):
     ):
         raise NotImplementedError
 
+    def _replace(self, **kwargs):
+        """
+        Templates a new event, like ``utils.new()``.
+
+        Every event keeps its initializer arguments in its settings, so the
+        initializer's signature need not be inspected.
+        """
+        settings = dict(self._settings, delta=self.delta)
+        settings.update(kwargs)
+        return type(self)(**settings)
+
     ### PUBLIC METHODS ###
 
     def as_dict(self):
@@ -16,20 +16,24 @@ class EventPattern(Pattern):
         import supriya.patterns
 
         if not isinstance(expr, supriya.patterns.Event):
-            expr = supriya.patterns.NoteEvent(**expr)
+            if expr.get("uuid") is None:
+                expr = dict(expr, uuid=uuid.uuid4())
+            return supriya.patterns.NoteEvent(**expr)
         if expr.get("uuid") is None:
             expr = utils.new(expr, uuid=uuid.uuid4())
         return expr
 
     ### PUBLIC METHODS ###
 
-    def play(self, clock=None, server=None):
+    def play(self, clock=None, server=None, quantization=None, lookahead=None):
         import supriya.patterns
         import supriya.realtime
 
         event_player = supriya.patterns.RealtimeEventPlayer(
             self,
             clock=clock,
+            lookahead=lookahead,
+            quantization=quantization,
             server=server or supriya.realtime.Server.get_default_server(),
         )
         event_player.start()
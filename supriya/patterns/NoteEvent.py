@@ -103,10 +103,9 @@ class NoteEvent(Event):
         first_visit = False
         if synth_uuid not in uuids:
             first_visit = True
-            node_ids = {
-                server.node_id_allocator.allocate_node_id(): None
-                for _ in range(len(dictionaries))
-            }
+            node_ids = dict.fromkeys(
+                server.node_id_allocator.allocate_node_ids(len(dictionaries))
+            )
             uuids[synth_uuid] = node_ids
         start_product = self._build_start_bundle(
             dictionaries, first_visit, index, synth_uuid, synthdef, timestamp, uuids
@@ -1,9 +1,9 @@
 import abc
 import collections
-import inspect
 import itertools
 import re
-from typing import Dict, Generator, Iterator
+import threading
+from typing import Generator
 
 from uqbar.enums import IntEnumeration
 
@@ -21,7 +21,14 @@ class Pattern(SupriyaValueObject):
 
     __slots__ = ()
 
-    _rngs: Dict[int, Iterator[float]] = {}
+    _frozen_patterns = collections.OrderedDict()  # type: ignore
+
+    _maximum_frozen_pattern_count = 64
+
+    # The innermost enclosing Pseed's RNG, set by Pseed while it advances
+    # its child pattern. Thread-local, so concurrent players cannot see each
+    # other's RNGs.
+    _rng_context = threading.local()
 
     class PatternState(IntEnumeration):
         CONTINUE = 0
@@ -125,9 +132,16 @@ class Pattern(SupriyaValueObject):
         should_stop = self.PatternState.CONTINUE
         state = self._setup_state()
         iterator = self._iterate(state)
+        # Most value patterns pass their output through untouched.
+        should_coerce = (
+            type(self)._coerce_iterator_output is not Pattern._coerce_iterator_output
+        )
         try:
             initial_expr = next(iterator)
-            initial_expr = self._coerce_iterator_output_recursively(initial_expr, state)
+            if should_coerce:
+                initial_expr = self._coerce_iterator_output_recursively(
+                    initial_expr, state
+                )
         except StopIteration:
             return
         peripheral_starts, peripheral_stops = self._setup_peripherals(
@@ -144,7 +158,8 @@ class Pattern(SupriyaValueObject):
             while True:
                 try:
                     expr = iterator.send(should_stop)
-                    expr = self._coerce_iterator_output_recursively(expr, state)
+                    if should_coerce:
+                        expr = self._coerce_iterator_output_recursively(expr, state)
                     should_stop = yield expr
                 except StopIteration:
                     break
@@ -212,24 +227,10 @@ class Pattern(SupriyaValueObject):
 
     @classmethod
     def _get_rng(cls):
-        from supriya.patterns import Pseed, RandomNumberGenerator
+        from supriya.patterns import RandomNumberGenerator
 
-        pseed_file_path = Pseed._file_path
-        identifier = None
-        try:
-            frame = inspect.currentframe()
-            while frame is not None:
-                file_path = frame.f_code.co_filename
-                function_name = frame.f_code.co_name
-                if file_path == pseed_file_path and function_name == "_iterate":
-                    identifier = id(frame)
-                    break
-                frame = frame.f_back
-        finally:
-            del (frame)
-        if identifier in cls._rngs:
-            rng = cls._rngs[identifier]
-        else:
+        rng = getattr(cls._rng_context, "rng", None)
+        if rng is None:
             rng = RandomNumberGenerator.get_stdlib_rng()
         return rng
 
@@ -276,6 +277,36 @@ class Pattern(SupriyaValueObject):
 
     ### PUBLIC METHODS ###
 
+    def freeze(self):
+        """
+        Evaluates this finite pattern once into a ``Pfreeze`` event table.
+
+        Frozen patterns are cached by value, so freezing an equal pattern
+        again returns the same table.
+
+        ::
+
+            >>> pattern = supriya.patterns.Pbind(
+            ...     duration=0.25,
+            ...     frequency=supriya.patterns.Pseq([440, 550, 660], 1),
+            ... )
+            >>> pattern.freeze() is pattern.freeze()
+            True
+
+        """
+        import supriya.patterns
+
+        try:
+            frozen_pattern = self._frozen_patterns.pop(self, None)
+        except TypeError:
+            return supriya.patterns.Pfreeze(self)
+        if frozen_pattern is None:
+            frozen_pattern = supriya.patterns.Pfreeze(self)
+        self._frozen_patterns[self] = frozen_pattern
+        while len(self._frozen_patterns) > self._maximum_frozen_pattern_count:
+            self._frozen_patterns.popitem(last=False)
+        return frozen_pattern
+
     @classmethod
     def from_dict(cls, dict_, namespaces=None):
         import supriya.patterns
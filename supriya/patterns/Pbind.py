@@ -128,14 +128,14 @@ class Pbind(EventPattern):
 
     def _iterate(self, state=None):
         patterns = self._coerce_pattern_pairs(self._patterns)
+        names = tuple(sorted(patterns))
+        iterators = tuple(patterns[name] for name in names)
         while True:
-            expr = {}
-            for name, pattern in sorted(patterns.items()):
-                try:
-                    expr[name] = next(pattern)
-                except StopIteration:
-                    return
-            expr = self._coerce_iterator_output(expr)
+            try:
+                values = [next(iterator) for iterator in iterators]
+            except StopIteration:
+                return
+            expr = self._coerce_iterator_output(dict(zip(names, values)))
             should_stop = yield expr
             if should_stop:
                 return
@@ -0,0 +1,143 @@
+import itertools
+
+from supriya.patterns.EventPattern import EventPattern
+
+
+class Pfreeze(EventPattern):
+    """
+    A finite event pattern, evaluated once into a columnar event table.
+
+    Playing a frozen pattern indexes into its table rather than re-running
+    the source pattern's generators. Random values, and event UUIDs, are
+    fixed at freeze time.
+
+    ::
+
+        >>> pattern = supriya.patterns.Pfreeze(
+        ...     supriya.patterns.Pbind(
+        ...         duration=supriya.patterns.Pseq([0.5, 0.25, 0.25], 1),
+        ...         frequency=supriya.patterns.Pseq([440, 550, 660], 1),
+        ...     )
+        ... )
+        >>> len(pattern)
+        3
+
+    ::
+
+        >>> pattern.onsets
+        (0.0, 0.5, 0.75)
+
+    ::
+
+        >>> pattern.columns["frequency"]
+        (440, 550, 660)
+
+    ::
+
+        >>> pattern[1]
+        NoteEvent(
+            delta=0.25,
+            duration=0.25,
+            frequency=550,
+            uuid=UUID('...'),
+            )
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_columns", "_deltas", "_durations", "_onsets", "_pattern")
+
+    # Marks settings absent from an event, as distinct from None.
+    _missing = object()
+
+    ### INITIALIZER ###
+
+    def __init__(self, pattern):
+        import supriya.patterns
+
+        assert isinstance(pattern, supriya.patterns.Pattern)
+        if pattern.is_infinite:
+            raise ValueError(pattern)
+        events = []
+        for event in pattern:
+            if not isinstance(event, supriya.patterns.NoteEvent):
+                raise ValueError(event)
+            events.append(event)
+        names = sorted(set(itertools.chain.from_iterable(_.settings for _ in events)))
+        self._pattern = pattern
+        self._columns = {
+            name: tuple(_.settings.get(name, self._missing) for _ in events)
+            for name in names
+        }
+        self._deltas = tuple(_.delta for _ in events)
+        self._durations = tuple(_.get("duration") for _ in events)
+        onsets, offset = [], 0.0
+        for delta in self._deltas:
+            onsets.append(offset)
+            offset += delta or 0.0
+        self._onsets = tuple(onsets)
+
+    ### SPECIAL METHODS ###
+
+    def __getitem__(self, index):
+        import supriya.patterns
+
+        settings = {}
+        for name, column in self._columns.items():
+            value = column[index]
+            if value is not self._missing:
+                settings[name] = value
+        return supriya.patterns.NoteEvent(delta=self._deltas[index], **settings)
+
+    def __len__(self):
+        return len(self._deltas)
+
+    ### PRIVATE METHODS ###
+
+    def _iterate(self, state=None):
+        for index in range(len(self)):
+            should_stop = yield self[index]
+            if should_stop:
+                return
+
+    ### PUBLIC METHODS ###
+
+    def freeze(self):
+        return self
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def arity(self):
+        return self._pattern.arity
+
+    @property
+    def columns(self):
+        """
+        Gets the per-setting columns, one value per event.
+
+        Settings an event does not have are marked with a private sentinel
+        rather than None, and are left out of that event on playback.
+        """
+        return dict(self._columns)
+
+    @property
+    def deltas(self):
+        return self._deltas
+
+    @property
+    def durations(self):
+        return self._durations
+
+    @property
+    def is_infinite(self):
+        return False
+
+    @property
+    def onsets(self):
+        return self._onsets
+
+    @property
+    def pattern(self):
+        return self._pattern
@@ -1,3 +1,5 @@
+import collections
+
 from supriya.patterns.Pattern import Pattern
 
 
@@ -26,6 +28,18 @@ class Pwhite(Pattern):
             return (number * (maximum - minimum)) + minimum
 
         rng = self._get_rng()
+        if not isinstance(self._minimum, collections.Sequence) and not isinstance(
+            self._maximum, collections.Sequence
+        ):
+            # Scalar bounds: draw straight from the RNG without per-value
+            # recursion.
+            minimum, maximum = sorted([self._minimum, self._maximum])
+            span = maximum - minimum
+            for _ in self._loop(self._repetitions):
+                should_stop = yield (next(rng) * span) + minimum
+                if should_stop:
+                    return
+            return
         for _ in self._loop(self._repetitions):
             expr = self._process_recursive(self._minimum, self._maximum, procedure)
             should_stop = yield expr
@@ -1,9 +1,48 @@
+import itertools
 import random
 
 from supriya.system.SupriyaObject import SupriyaObject
 
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
 
 class RandomNumberGenerator(SupriyaObject):
+    """
+    A seeded linear congruential random number generator.
+
+    Values are generated in blocks, vectorized with NumPy when it is
+    available, and are identical either way.
+
+    ::
+
+        >>> import itertools
+        >>> import supriya.patterns
+        >>> rng = supriya.patterns.RandomNumberGenerator(seed=0)
+        >>> [round(x, 6) for x in itertools.islice(rng, 4)]
+        [6e-06, 0.655154, 0.304814, 0.674961]
+
+    ::
+
+        >>> block, seed = rng.generate_block(0, 4)
+        >>> [round(x, 6) for x in block]
+        [6e-06, 0.655154, 0.304814, 0.674961]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    _block_size = 4096
+
+    _coefficients: dict = {}
+
+    _increment = 12345
+
+    _mask = 0x7FFFFFFF
+
+    _multiplier = 1_103_515_245
 
     ### INITIALIZER ###
 
@@ -13,17 +52,65 @@ class RandomNumberGenerator(SupriyaObject):
     ### SPECIAL METHODS ###
 
     def __iter__(self):
-        seed = self._seed
-        while True:
-            seed = (seed * 1_103_515_245 + 12345) & 0x7FFFFFFF
-            yield float(seed) / 0x7FFFFFFF
+        return itertools.chain.from_iterable(self.iterate_blocks())
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _get_coefficients(cls, block_size):
+        # Jumping k steps ahead is itself an affine map, seed * a(k) + c(k),
+        # so a whole block can be computed from one seed at once. All terms
+        # are below 2 ** 31, so products fit in 64 bits.
+        if block_size not in cls._coefficients:
+            multipliers, increments = [], []
+            multiplier, increment = 1, 0
+            for _ in range(block_size):
+                multiplier = (multiplier * cls._multiplier) & cls._mask
+                increment = (increment * cls._multiplier + cls._increment) & cls._mask
+                multipliers.append(multiplier)
+                increments.append(increment)
+            cls._coefficients[block_size] = (
+                numpy.array(multipliers, dtype=numpy.uint64),
+                numpy.array(increments, dtype=numpy.uint64),
+            )
+        return cls._coefficients[block_size]
 
     ### PUBLIC METHODS ###
 
+    @classmethod
+    def generate_block(cls, seed, block_size=None):
+        """
+        Generates the next `block_size` values after `seed`.
+
+        Returns a list of floats and the seed to continue from.
+        """
+        block_size = block_size or cls._block_size
+        seed &= cls._mask
+        if numpy is None:
+            multiplier, increment, mask = cls._multiplier, cls._increment, cls._mask
+            seeds = []
+            for _ in range(block_size):
+                seed = (seed * multiplier + increment) & mask
+                seeds.append(seed)
+            return [float(x) / mask for x in seeds], seed
+        multipliers, increments = cls._get_coefficients(block_size)
+        seeds = multipliers * numpy.uint64(seed) + increments
+        seeds &= numpy.uint64(cls._mask)
+        block = (seeds.astype(numpy.float64) / cls._mask).tolist()
+        return block, int(seeds[-1])
+
     @staticmethod
     def get_stdlib_rng():
+        return iter(random.random, None)
+
+    def iterate_blocks(self, block_size=None):
+        """
+        Iterates over blocks of values.
+        """
+        seed = self._seed
         while True:
-            yield random.random()
+            block, seed = self.generate_block(seed, block_size)
+            yield block
 
     ### PUBLIC PROPERTIES ###
 
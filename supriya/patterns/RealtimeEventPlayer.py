@@ -1,11 +1,14 @@
+import asyncio
+import collections
+import heapq
 import itertools
+import struct
 import time
-from queue import PriorityQueue
 
 import supriya.commands
+import supriya.osc
 import supriya.realtime
 import supriya.system
-from supriya import utils
 from supriya.patterns.EventPlayer import EventPlayer
 
 
@@ -13,19 +16,46 @@ class RealtimeEventPlayer(EventPlayer):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_clock", "_iterator", "_pattern", "_server", "_uuids")
+    __slots__ = (
+        "_clock",
+        "_iterator",
+        "_lookahead",
+        "_pattern",
+        "_quantization",
+        "_sent_timestamp",
+        "_server",
+        "_uuids",
+    )
+
+    # Ethernet MTU, less IP and UDP headers.
+    _maximum_datagram_size = 1472
 
     ### INITIALIZER ###
 
-    def __init__(self, pattern, server=None, event_template=None, clock=None):
+    def __init__(
+        self,
+        pattern,
+        server=None,
+        event_template=None,
+        clock=None,
+        quantization=None,
+        lookahead=None,
+    ):
         import supriya.patterns
 
         EventPlayer.__init__(self, pattern, event_template)
         clock = clock or supriya.patterns.Clock.get_default_clock()
-        assert isinstance(clock, supriya.patterns.Clock)
+        assert isinstance(clock, (supriya.patterns.BeatClock, supriya.patterns.Clock))
+        if lookahead:
+            # Beat clocks batch their own wakeups, in beats.
+            assert not isinstance(clock, supriya.patterns.BeatClock)
+            lookahead = float(lookahead)
         self._server = server or supriya.realtime.Server.get_default_server()
         self._clock = clock
+        self._lookahead = lookahead
+        self._quantization = quantization
         self._iterator = None
+        self._sent_timestamp = None
         self._uuids = {}
 
     ### SPECIAL METHODS ###
@@ -38,8 +68,28 @@ class RealtimeEventPlayer(EventPlayer):
                 timestamp=scheduled_time,
                 uuids=self._uuids,
             )
+        if communicate and self._lookahead:
+            return self._send_lookahead(scheduled_time)
         event_products, delta = next(self._iterator)
+        requests = self._collect_requests(event_products)
+        if communicate:
+            # Stamp the latency in up front, rather than copying the bundle.
+            timestamp = scheduled_time + self._get_latency()
+            osc_bundle = supriya.commands.RequestBundle(
+                timestamp=timestamp, contents=requests
+            ).to_osc()
+            self._server.send_message(osc_bundle)
+            return delta
+        consolidated_bundle = supriya.commands.RequestBundle(
+            timestamp=scheduled_time, contents=requests
+        )
+        return consolidated_bundle, delta
+
+    ### PRIVATE METHODS ###
+
+    def _collect_requests(self, event_products):
         node_free_ids, requests = set(), []
+        bus_free_ids = collections.defaultdict(list)
         for event_product in event_products:
             if not event_product.event:
                 continue
@@ -54,30 +104,20 @@ class RealtimeEventPlayer(EventPlayer):
                     if isinstance(
                         proxy, (supriya.realtime.Bus, supriya.realtime.BusGroup)
                     ):
-                        allocator = supriya.realtime.Bus._get_allocator(
-                            calculation_rate=proxy.calculation_rate, server=self._server
-                        )
-                        allocator.free(proxy_id)
+                        bus_free_ids[proxy.calculation_rate].append(proxy_id)
                 self._uuids.pop(event_product.uuid)
+        for calculation_rate, bus_ids in bus_free_ids.items():
+            allocator = supriya.realtime.Bus._get_allocator(
+                calculation_rate=calculation_rate, server=self._server
+            )
+            allocator.free_many(bus_ids)
         if node_free_ids:
             node_free_ids = sorted(node_free_ids)
             request = supriya.commands.NodeFreeRequest(node_ids=node_free_ids)
             requests.append(request)
-        consolidated_bundle = supriya.commands.RequestBundle(
-            timestamp=scheduled_time, contents=requests
-        )
-        if communicate:
-            osc_bundle = consolidated_bundle.to_osc()
-            osc_bundle = utils.new(
-                osc_bundle, timestamp=osc_bundle.timestamp + self._server.latency
-            )
-            self._server.send_message(osc_bundle)
-            return delta
-        return consolidated_bundle, delta
-
-    ### PRIVATE METHODS ###
+        return requests
 
-    def _collect_stop_requests(self):
+    def _collect_stop_requests(self, timestamp=None):
         import supriya.nonrealtime
 
         requests = []
@@ -102,28 +142,35 @@ class RealtimeEventPlayer(EventPlayer):
             requests.append(request)
         if not requests:
             return
-        return supriya.commands.RequestBundle(contents=requests)
+        return supriya.commands.RequestBundle(timestamp=timestamp, contents=requests)
+
+    def _get_latency(self):
+        import supriya.patterns
+
+        latency = self._server.latency
+        if isinstance(self._clock, supriya.patterns.BeatClock):
+            # Beat clocks already call ahead of time by their lookahead.
+            latency = max(latency - self._clock.lookahead, 0.0)
+        return latency
 
     @staticmethod
     def _iterate_inner(pattern, server, timestamp, uuids):
-        queue = PriorityQueue()
+        # A heap of (sort key, product) pairs. Sort keys are unique, so event
+        # products themselves are never compared.
+        queue = []
         for index, event in enumerate(pattern):
             for event_product in event._perform_realtime(
                 index=(index, 0), server=server, timestamp=timestamp, uuids=uuids
             ):
-                queue.put(event_product)
-            while not queue.empty():
-                event_product = queue.get()
-                if event_product.timestamp < (timestamp + event.delta):
-                    yield event_product
-                else:
-                    queue.put(event_product)
-                    break
-            timestamp += event.delta
-        while not queue.empty():
-            event_product = queue.get()
-            yield event_product
-        assert queue.empty()
+                heapq.heappush(
+                    queue, (event_product._get_sort_bundle(), event_product)
+                )
+            stop_timestamp = timestamp + event.delta
+            while queue and queue[0][1].timestamp < stop_timestamp:
+                yield heapq.heappop(queue)[1]
+            timestamp = stop_timestamp
+        while queue:
+            yield heapq.heappop(queue)[1]
 
     @staticmethod
     def _iterate_outer(pattern, server, timestamp, uuids):
@@ -143,6 +190,57 @@ class RealtimeEventPlayer(EventPlayer):
         _, event_products = pairs.pop()
         yield event_products, None
 
+    @classmethod
+    def _pack_datagrams(cls, timestamp, datagrams):
+        # Nest as many timestamped bundles as fit in one packet, into an outer
+        # bundle stamped with the earliest of them.
+        prefix = supriya.osc.OscBundle._bundle_prefix
+        prefix += supriya.osc.OscBundle._write_date(timestamp)
+        packets, packet, size = [], [], len(prefix)
+        for datagram in datagrams:
+            if packet and cls._maximum_datagram_size < size + 4 + len(datagram):
+                packets.append(packet)
+                packet, size = [], len(prefix)
+            packet.append(datagram)
+            size += 4 + len(datagram)
+        if packet:
+            packets.append(packet)
+        for packet in packets:
+            if len(packet) == 1:
+                yield packet[0]
+                continue
+            contents = [prefix]
+            for datagram in packet:
+                contents.append(struct.pack(">i", len(datagram)))
+                contents.append(datagram)
+            yield b"".join(contents)
+
+    def _send_lookahead(self, scheduled_time):
+        latency = self._get_latency()
+        stop_time = scheduled_time + self._lookahead
+        timestamp, datagrams, first_timestamp = scheduled_time, [], None
+        while True:
+            event_products, delta = next(self._iterator)
+            requests = self._collect_requests(event_products)
+            if requests:
+                osc_bundle = supriya.commands.RequestBundle(
+                    timestamp=timestamp + latency, contents=requests
+                ).to_osc()
+                datagrams.append(osc_bundle.to_datagram())
+                if first_timestamp is None:
+                    first_timestamp = timestamp + latency
+                self._sent_timestamp = timestamp + latency
+            if delta is None:
+                break
+            timestamp += delta
+            if stop_time <= timestamp:
+                break
+        for datagram in self._pack_datagrams(first_timestamp, datagrams):
+            self._server.send_message(datagram)
+        if delta is None:
+            return None
+        return timestamp - scheduled_time
+
     ### PUBLIC METHODS ###
 
     def notify(self, topic, event):
@@ -151,22 +249,64 @@ class RealtimeEventPlayer(EventPlayer):
 
     @supriya.system.PubSub.subscribe_before("server-quitting")
     def start(self):
+        import supriya.patterns
+
         if not self._server.is_running:
             return
-        timestamp = time.time()
+        if isinstance(self._clock, supriya.patterns.BeatClock):
+            # Pattern deltas and durations are measured in beats.
+            timestamp = self._clock.get_next_beat(self._quantization)
+        else:
+            timestamp = time.time()
         self._uuids.clear()
+        self._sent_timestamp = None
         self._iterator = self._iterate_outer(
             pattern=self._pattern,
             server=self._server,
             timestamp=timestamp,
             uuids=self._uuids,
         )
-        self._clock.schedule(self, scheduled_time=timestamp, absolute=True)
+        if isinstance(self._clock, supriya.patterns.BeatClock):
+            self._clock.schedule(self, beat=timestamp)
+        else:
+            self._clock.schedule(self, scheduled_time=timestamp, absolute=True)
+
+    async def start_async(self):
+        """
+        Starts playback from within a running event loop.
+
+        The player's clock, or the clock beneath its beat clock, must be an
+        ``AsyncClock`` bound to that loop.
+        """
+        import supriya.patterns
+
+        clock = self._clock
+        if isinstance(clock, supriya.patterns.BeatClock):
+            clock = clock.clock
+        assert isinstance(clock, supriya.patterns.AsyncClock)
+        assert clock.loop is asyncio.get_event_loop()
+        self.start()
 
     @supriya.system.PubSub.unsubscribe_after("server-quitting")
     def stop(self):
         self._clock.cancel(self)
         self._iterator = None
-        bundle = self._collect_stop_requests()
+        # Lookahead players may already have sent bundles stamped later than
+        # now, so release their nodes no earlier than the last of them.
+        timestamp, self._sent_timestamp = self._sent_timestamp, None
+        if timestamp is not None and timestamp <= time.time():
+            timestamp = None
+        bundle = self._collect_stop_requests(timestamp=timestamp)
         if bundle and self._server.is_running:
             self._server.send_message(bundle.to_osc())
+
+    async def stop_async(self, timeout=1.0):
+        """
+        Stops playback, then waits until the server has processed the
+        release bundle.
+        """
+        self.stop()
+        if not self._server.is_running:
+            return
+        request = supriya.commands.SyncRequest(sync_id=self._server.next_sync_id)
+        await request.communicate_async(server=self._server, timeout=timeout)
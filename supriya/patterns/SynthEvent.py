@@ -105,8 +105,8 @@ class SynthEvent(Event):
                 synth_parameters_only=True,
             )
             synths = uuids[node_uuid] = {}
-            for dictionary in dictionaries:
-                node_id = server.node_id_allocator.allocate_node_id()
+            node_ids = server.node_id_allocator.allocate_node_ids(len(dictionaries))
+            for node_id, dictionary in zip(node_ids, dictionaries):
                 synth = supriya.realtime.Synth(synthdef, **dictionary)
                 synths[node_id] = synth
                 request = supriya.commands.SynthNewRequest(
@@ -0,0 +1,138 @@
+import bisect
+import math
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class TempoMap(SupriyaObject):
+    """
+    A piecewise tempo map, converting between beats and seconds.
+
+    Tempo changes may be immediate or ramped linearly over a number of
+    beats.
+
+    ::
+
+        >>> import supriya.patterns
+        >>> tempo_map = supriya.patterns.TempoMap(tempo=120)
+        >>> tempo_map.beat_to_seconds(4)
+        2.0
+
+    ::
+
+        >>> tempo_map.set_tempo(60, beat=4)
+        >>> tempo_map.beat_to_seconds(6)
+        4.0
+        >>> tempo_map.seconds_to_beat(4.0)
+        6.0
+
+    ::
+
+        >>> tempo_map.set_tempo(120, beat=8, ramp_beats=4)
+        >>> tempo_map.get_tempo(10)
+        90.0
+        >>> round(tempo_map.beat_to_seconds(12), 6)
+        8.772589
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_segment_beats", "_segment_seconds", "_segments")
+
+    ### INITIALIZER ###
+
+    def __init__(self, tempo=60, start_time=0.0):
+        self._segment_beats = []
+        self._segment_seconds = []
+        self._segments = []
+        self._append_segment(0.0, float(start_time), float(tempo), math.inf, None)
+
+    ### PRIVATE METHODS ###
+
+    def _append_segment(self, beat, seconds, tempo, stop_beat, stop_tempo):
+        # Segments are (start beat, start seconds, start tempo in beats per
+        # second, stop beat, stop tempo in beats per second or none if
+        # constant).
+        tempo /= 60
+        if stop_tempo is not None:
+            stop_tempo /= 60
+        self._segment_beats.append(beat)
+        self._segment_seconds.append(seconds)
+        self._segments.append((beat, seconds, tempo, stop_beat, stop_tempo))
+
+    def _get_segment_by_beat(self, beat):
+        index = max(bisect.bisect_right(self._segment_beats, beat) - 1, 0)
+        return self._segments[index]
+
+    def _get_segment_by_seconds(self, seconds):
+        index = max(bisect.bisect_right(self._segment_seconds, seconds) - 1, 0)
+        return self._segments[index]
+
+    @staticmethod
+    def _get_slope(segment):
+        start_beat, _, tempo, stop_beat, stop_tempo = segment
+        if stop_tempo is None:
+            return 0.0
+        return (stop_tempo - tempo) / (stop_beat - start_beat)
+
+    ### PUBLIC METHODS ###
+
+    def beat_to_seconds(self, beat):
+        """
+        Gets the time in seconds of `beat`.
+        """
+        segment = self._get_segment_by_beat(beat)
+        start_beat, start_seconds, tempo, _, _ = segment
+        slope = self._get_slope(segment)
+        beats = beat - start_beat
+        if not slope:
+            return start_seconds + beats / tempo
+        return start_seconds + math.log1p(slope * beats / tempo) / slope
+
+    def get_tempo(self, beat):
+        """
+        Gets the tempo in beats per minute at `beat`.
+        """
+        segment = self._get_segment_by_beat(beat)
+        return (segment[2] + self._get_slope(segment) * (beat - segment[0])) * 60
+
+    def seconds_to_beat(self, seconds):
+        """
+        Gets the beat at `seconds`.
+        """
+        segment = self._get_segment_by_seconds(seconds)
+        start_beat, start_seconds, tempo, _, _ = segment
+        slope = self._get_slope(segment)
+        elapsed = seconds - start_seconds
+        if not slope:
+            return start_beat + elapsed * tempo
+        return start_beat + math.expm1(slope * elapsed) * tempo / slope
+
+    def set_tempo(self, tempo, beat=0.0, ramp_beats=0):
+        """
+        Changes the tempo to `tempo` beats per minute from `beat`, ramping
+        linearly over `ramp_beats`.
+
+        Replaces any tempo changes at or after `beat`.
+        """
+        beat, tempo, ramp_beats = float(beat), float(tempo), float(ramp_beats)
+        assert 0 < tempo and 0 <= ramp_beats
+        seconds = self.beat_to_seconds(beat)
+        current_tempo = self.get_tempo(beat)
+        index = bisect.bisect_left(self._segment_beats, beat)
+        del self._segment_beats[index:]
+        del self._segment_seconds[index:]
+        del self._segments[index:]
+        if self._segments:
+            start_beat, start_seconds, start_tempo, _, stop_tempo = self._segments[-1]
+            if stop_tempo is not None:
+                stop_tempo = current_tempo / 60
+            self._segments[-1] = (
+                start_beat, start_seconds, start_tempo, beat, stop_tempo
+            )
+        if ramp_beats:
+            self._append_segment(beat, seconds, current_tempo, beat + ramp_beats, tempo)
+            beat += ramp_beats
+            seconds = self.beat_to_seconds(beat)
+        self._append_segment(beat, seconds, tempo, math.inf, None)
@@ -1,6 +1,8 @@
 """
 Tools for modeling patterns.
 """
+from .AsyncClock import AsyncClock  # noqa
+from .BeatClock import BeatClock  # noqa
 from .BusEvent import BusEvent  # noqa
 from .Clock import Clock  # noqa
 from .CompositeEvent import CompositeEvent  # noqa
@@ -17,6 +19,7 @@ from .Pbindf import Pbindf  # noqa
 from .Pbinop import Pbinop  # noqa
 from .Pbus import Pbus  # noqa
 from .Pchain import Pchain  # noqa
+from .Pfreeze import Pfreeze  # noqa
 from .Pfx import Pfx  # noqa
 from .Pgpar import Pgpar  # noqa
 from .Pgroup import Pgroup  # noqa
@@ -30,3 +33,4 @@ from .Pwhite import Pwhite  # noqa
 from .RandomNumberGenerator import RandomNumberGenerator  # noqa
 from .RealtimeEventPlayer import RealtimeEventPlayer  # noqa
 from .SynthEvent import SynthEvent  # noqa
+from .TempoMap import TempoMap  # noqa
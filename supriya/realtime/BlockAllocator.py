@@ -1,6 +1,9 @@
+import bisect
+import heapq
+import math
 import threading
+import typing
 
-from supriya import utils
 from supriya.system.SupriyaObject import SupriyaObject
 
 
@@ -41,120 +44,264 @@ class BlockAllocator(SupriyaObject):
         >>> allocator.allocate(8)
         8
 
+    Free blocks are indexed by address, for coalescing, and by size, so that
+    allocation never scans the whole free list.
+
+    The `first_fit` policy, the default, picks the lowest-addressed block
+    large enough. The `best_fit` policy picks the smallest block large
+    enough, which keeps large blocks intact:
+
+    ::
+
+        >>> allocator = supriya.realtime.BlockAllocator(
+        ...     heap_maximum=16,
+        ...     policy='best_fit',
+        ...     )
+        >>> allocator.allocate_at(2, 4)
+        2
+        >>> allocator.allocate(2)
+        0
+        >>> allocator.statistics
+        Statistics(free_block_count=1, free_size=10, largest_free_block_size=10, used_block_count=2, used_size=6, fragmentation=0.0)
+
     """
 
     ### CLASS VARIABLES ###
 
     __documentation_section__ = "Server Internals"
 
-    __slots__ = ("_free_heap", "_heap_maximum", "_heap_minimum", "_lock", "_used_heap")
+    __slots__ = (
+        "_free_blocks",
+        "_free_blocks_by_size",
+        "_free_offsets",
+        "_free_stops",
+        "_heap_maximum",
+        "_heap_minimum",
+        "_lock",
+        "_policy",
+        "_size_classes",
+        "_stale_count",
+        "_used_blocks",
+    )
 
-    ### INITIALIZER ###
+    class Statistics(typing.NamedTuple):
+        free_block_count: int
+        free_size: float
+        largest_free_block_size: float
+        used_block_count: int
+        used_size: int
+        fragmentation: float
+
+    _maximum_size_class = 32
 
-    def __init__(self, heap_maximum=None, heap_minimum=0):
-        import supriya.realtime
-        import supriya.time
+    _policies = ("best_fit", "first_fit")
 
-        self._free_heap = supriya.time.TimespanCollection(accelerated=True)
+    ### INITIALIZER ###
+
+    def __init__(self, heap_maximum=None, heap_minimum=0, policy="first_fit"):
+        if policy not in self._policies:
+            raise ValueError(policy)
+        self._free_blocks = {}
+        self._free_blocks_by_size = []
+        self._free_offsets = []
+        self._free_stops = {}
         self._heap_maximum = heap_maximum
         self._heap_minimum = heap_minimum
         self._lock = threading.Lock()
-        self._used_heap = supriya.time.TimespanCollection(accelerated=True)
-        free_block = supriya.realtime.Block(
-            start_offset=heap_minimum, stop_offset=heap_maximum, used=False
+        self._policy = policy
+        self._size_classes = [[] for _ in range(self._maximum_size_class + 1)]
+        self._stale_count = 0
+        self._used_blocks = {}
+        stop_offset = math.inf if heap_maximum is None else int(heap_maximum)
+        if int(heap_minimum) < stop_offset:
+            self._insert_free_block(int(heap_minimum), stop_offset)
+
+    ### PRIVATE METHODS ###
+
+    def _allocate(self, desired_block_size):
+        if self._policy == "best_fit":
+            block_id = self._find_best_fit(desired_block_size)
+        else:
+            block_id = self._find_first_fit(desired_block_size)
+        if block_id is None:
+            return None
+        stop_offset = self._remove_free_block(block_id)
+        split_offset = block_id + desired_block_size
+        if split_offset < stop_offset:
+            self._insert_free_block(split_offset, stop_offset)
+        self._used_blocks[block_id] = split_offset
+        return block_id
+
+    def _find_best_fit(self, desired_block_size):
+        index = bisect.bisect_left(self._free_blocks_by_size, (desired_block_size,))
+        if index < len(self._free_blocks_by_size):
+            return self._free_blocks_by_size[index][1]
+        return None
+
+    def _find_first_fit(self, desired_block_size):
+        # Every block in a size class above the desired size's class fits, so
+        # the lowest-addressed candidate of each is its heap's top. Only the
+        # desired size's own class needs checking block by block.
+        size_class = self._get_size_class(desired_block_size)
+        block_id = None
+        for heap in self._size_classes[size_class + 1 :]:
+            while heap and self._free_blocks.get(heap[0][0]) != heap[0][1]:
+                heapq.heappop(heap)
+                self._stale_count -= 1
+            if heap and (block_id is None or heap[0][0] < block_id):
+                block_id = heap[0][0]
+        index = bisect.bisect_left(self._free_blocks_by_size, (desired_block_size,))
+        for size, start_offset in self._free_blocks_by_size[index:]:
+            if self._get_size_class(size) != size_class:
+                break
+            if block_id is None or start_offset < block_id:
+                block_id = start_offset
+        return block_id
+
+    def _free(self, block_id):
+        if block_id not in self._used_blocks:
+            raise ValueError(block_id)
+        start_offset = block_id
+        stop_offset = self._used_blocks.pop(block_id)
+        previous_start_offset = self._free_stops.get(start_offset)
+        if previous_start_offset is not None:
+            self._remove_free_block(previous_start_offset)
+            start_offset = previous_start_offset
+        if stop_offset in self._free_blocks:
+            stop_offset = self._remove_free_block(stop_offset)
+        self._insert_free_block(start_offset, stop_offset)
+
+    def _get_size_class(self, size):
+        if size == math.inf:
+            return self._maximum_size_class
+        return min(int(size).bit_length(), self._maximum_size_class)
+
+    def _insert_free_block(self, start_offset, stop_offset):
+        size = stop_offset - start_offset
+        self._free_blocks[start_offset] = stop_offset
+        self._free_stops[stop_offset] = start_offset
+        bisect.insort(self._free_offsets, start_offset)
+        bisect.insort(self._free_blocks_by_size, (size, start_offset))
+        heapq.heappush(
+            self._size_classes[self._get_size_class(size)], (start_offset, stop_offset)
         )
-        self._free_heap.insert(free_block)
+
+    def _remove_free_block(self, start_offset):
+        stop_offset = self._free_blocks.pop(start_offset)
+        del self._free_stops[stop_offset]
+        del self._free_offsets[bisect.bisect_left(self._free_offsets, start_offset)]
+        size_key = (stop_offset - start_offset, start_offset)
+        del self._free_blocks_by_size[
+            bisect.bisect_left(self._free_blocks_by_size, size_key)
+        ]
+        # Size class heaps are cleaned lazily, and rebuilt once mostly stale.
+        self._stale_count += 1
+        if len(self._free_blocks) + 64 < self._stale_count:
+            for heap in self._size_classes:
+                heap[:] = [x for x in heap if self._free_blocks.get(x[0]) == x[1]]
+                heapq.heapify(heap)
+            self._stale_count = 0
+        return stop_offset
 
     ### PUBLIC METHODS ###
 
     def allocate(self, desired_block_size=1):
         desired_block_size = int(desired_block_size)
         assert 0 < desired_block_size
-        block_id = None
         with self._lock:
-            free_block = None
-            for block in self._free_heap:
-                if desired_block_size <= block.duration:
-                    free_block = block
-                    break
-            if free_block is not None:
-                split_offset = free_block.start_offset + desired_block_size
-                self._free_heap.remove(free_block)
-                if desired_block_size < free_block.duration:
-                    new_free_block = utils.new(
-                        free_block, start_offset=split_offset, used=False
-                    )
-                    self._free_heap.insert(new_free_block)
-                    used_block = utils.new(
-                        free_block, stop_offset=split_offset, used=True
-                    )
-                else:
-                    used_block = utils.new(free_block, used=True)
-                self._used_heap.insert(used_block)
-                block_id = used_block.start_offset
-        return block_id
+            return self._allocate(desired_block_size)
 
     def allocate_at(self, index=None, desired_block_size=1):
-        import supriya.realtime
-
         index = int(index)
         desired_block_size = int(desired_block_size)
-        block_id = None
         with self._lock:
-            start_offset = index
-            stop_offset = index + desired_block_size
-            start_cursor = self._free_heap.get_simultaneity_at(start_offset)
-            starting_blocks = sorted(
-                start_cursor.start_timespans + start_cursor.overlap_timespans
-            )
-            stop_cursor = self._free_heap.get_simultaneity_at(stop_offset)
-            stop_blocks = sorted(
-                stop_cursor.overlap_timespans + stop_cursor.stop_timespans
-            )
-            if starting_blocks == stop_blocks:
-                assert len(starting_blocks) == 1
-                free_block = starting_blocks[0]
-                used_block = supriya.realtime.Block(
-                    start_offset=start_offset, stop_offset=stop_offset, used=True
+            position = bisect.bisect_right(self._free_offsets, index) - 1
+            if position < 0:
+                return None
+            start_offset = self._free_offsets[position]
+            stop_offset = self._free_blocks[start_offset]
+            split_offset = index + desired_block_size
+            if stop_offset < split_offset:
+                return None
+            self._remove_free_block(start_offset)
+            if start_offset < index:
+                self._insert_free_block(start_offset, index)
+            if split_offset < stop_offset:
+                self._insert_free_block(split_offset, stop_offset)
+            self._used_blocks[index] = split_offset
+        return index
+
+    def allocate_many(self, count, desired_block_size=1):
+        """
+        Allocates `count` blocks of `desired_block_size` under one lock.
+
+        Blocks are carved from a single contiguous range when one is free,
+        and allocated one by one otherwise. Each block can be freed on its
+        own.
+
+        ::
+
+            >>> allocator = supriya.realtime.BlockAllocator(heap_maximum=16)
+            >>> allocator.allocate_many(3, 2)
+            [0, 2, 4]
+
+        ::
+
+            >>> allocator.free_many([0, 4])
+            >>> allocator.allocate_many(4, 2)
+            [4, 6, 8, 10]
+
+        ::
+
+            >>> allocator.allocate_many(4, 2) is None
+            True
+
+        Returns list of block IDs, or none if not all blocks fit.
+        """
+        count = int(count)
+        desired_block_size = int(desired_block_size)
+        assert 0 < desired_block_size
+        if count <= 0:
+            return []
+        with self._lock:
+            block_id = self._allocate(count * desired_block_size)
+            if block_id is not None:
+                block_ids = list(
+                    range(
+                        block_id,
+                        block_id + count * desired_block_size,
+                        desired_block_size,
+                    )
                 )
-                self._used_heap.insert(used_block)
-                self._free_heap.remove(free_block)
-                free_blocks = free_block - used_block
-                for free_block in free_blocks:
-                    self._free_heap.insert(free_block)
-                block_id = index
-        return block_id
+                for block_id in block_ids:
+                    self._used_blocks[block_id] = block_id + desired_block_size
+                return block_ids
+            block_ids = []
+            for _ in range(count):
+                block_id = self._allocate(desired_block_size)
+                if block_id is None:
+                    for block_id in block_ids:
+                        self._free(block_id)
+                    return None
+                block_ids.append(block_id)
+            return block_ids
 
     def free(self, block_id):
-        import supriya.realtime
-
         block_id = int(block_id)
         with self._lock:
-            cursor = self._used_heap.get_simultaneity_at(block_id)
-            blocks = sorted(
-                set(cursor.start_timespans) or set(cursor.overlap_timespans)
-            )
-            assert len(blocks) == 1
-            used_block = blocks[0]
-            self._used_heap.remove(used_block)
-            start_offset = used_block.start_offset
-            stopping_blocks = self._free_heap.find_timespans_stopping_at(start_offset)
-            if stopping_blocks:
-                assert len(stopping_blocks) == 1
-                stopping_block = stopping_blocks[0]
-                self._free_heap.remove(stopping_block)
-                start_offset = stopping_block.start_offset
-            stop_offset = used_block.stop_offset
-            starting_blocks = self._free_heap.find_timespans_starting_at(stop_offset)
-            if starting_blocks:
-                assert len(starting_blocks) == 1
-                starting_block = starting_blocks[0]
-                self._free_heap.remove(starting_block)
-                stop_offset = starting_block.stop_offset
-            free_block = supriya.realtime.Block(
-                start_offset=start_offset, stop_offset=stop_offset, used=False
-            )
-            self._free_heap.insert(free_block)
+            self._free(block_id)
+
+    def free_many(self, block_ids):
+        """
+        Frees `block_ids` under one lock.
+        """
+        block_ids = [int(block_id) for block_id in block_ids]
+        with self._lock:
+            unknown_block_ids = set(block_ids).difference(self._used_blocks)
+            if unknown_block_ids:
+                raise ValueError(sorted(unknown_block_ids))
+            for block_id in block_ids:
+                self._free(block_id)
 
     ### PUBLIC PROPERTIES ###
 
@@ -171,3 +318,48 @@ class BlockAllocator(SupriyaObject):
         Minimum allocatable index.
         """
         return self._heap_minimum
+
+    @property
+    def policy(self):
+        """
+        Allocation policy: `first_fit` or `best_fit`.
+        """
+        return self._policy
+
+    @property
+    def statistics(self):
+        """
+        Free and used block statistics.
+
+        Fragmentation is the share of free space outside the largest free
+        block, ignoring any unbounded block at the top of the heap.
+
+        ::
+
+            >>> allocator = supriya.realtime.BlockAllocator()
+            >>> block_ids = [allocator.allocate(4) for _ in range(4)]
+            >>> allocator.free(block_ids[0])
+            >>> allocator.free(block_ids[2])
+            >>> allocator.statistics
+            Statistics(free_block_count=3, free_size=inf, largest_free_block_size=inf, used_block_count=2, used_size=8, fragmentation=0.5)
+
+        """
+        with self._lock:
+            sizes = [size for size, _ in self._free_blocks_by_size]
+            used_size = sum(
+                stop_offset - start_offset
+                for start_offset, stop_offset in self._used_blocks.items()
+            )
+            used_block_count = len(self._used_blocks)
+        bounded_sizes = [size for size in sizes if size != math.inf]
+        fragmentation = 0.0
+        if bounded_sizes:
+            fragmentation = 1 - max(bounded_sizes) / sum(bounded_sizes)
+        return self.Statistics(
+            free_block_count=len(sizes),
+            free_size=sum(sizes),
+            largest_free_block_size=max(sizes, default=0),
+            used_block_count=used_block_count,
+            used_size=used_size,
+            fragmentation=fragmentation,
+        )
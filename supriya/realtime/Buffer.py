@@ -1,4 +1,8 @@
 import collections
+import os
+import struct
+import tempfile
+import threading
 
 import supriya.exceptions
 from supriya.realtime.ServerObjectProxy import ServerObjectProxy
@@ -43,6 +47,10 @@ class Buffer(ServerObjectProxy):
 
     __slots__ = ("_buffer_group", "_buffer_id", "_buffer_id_was_set_manually")
 
+    _file_transfer_threshold = 65536
+
+    _local_ip_addresses = frozenset(["127.0.0.1", "::1", "localhost"])
+
     ### INITIALIZER ###
 
     def __init__(self, buffer_group_or_index=None):
@@ -204,6 +212,36 @@ class Buffer(ServerObjectProxy):
                 raise ValueError
             self._buffer_id = buffer_id
 
+    @staticmethod
+    def _decode_set_contiguous(datagram):
+        # Decodes a `/b_setn` reply's samples straight from its big-endian
+        # float32 payload. Returns None for anything shaped otherwise.
+        import numpy
+
+        end = datagram.find(b"\x00", 8)
+        offset = 8 + (end - 8) // 4 * 4 + 4
+        if end < 0 or len(datagram) < offset + 12:
+            return None
+        buffer_id, start, count = struct.unpack_from(">iii", datagram, offset)
+        offset += 12
+        if len(datagram) != offset + count * 4:
+            return None
+        if datagram[8:end] != b",iii" + b"f" * count:
+            return None
+        samples = numpy.frombuffer(datagram, dtype=">f4", count=count, offset=offset)
+        return buffer_id, start, samples
+
+    @staticmethod
+    def _encode_set_contiguous(address, buffer_id, starting_sample_index, samples):
+        # `samples` is a big-endian float32 array, appended to the header as-is.
+        import supriya.osc
+
+        header = supriya.osc.OscMessage._codec.encode_header(
+            address, "iii" + "f" * len(samples)
+        )
+        arguments = struct.pack(">iii", buffer_id, starting_sample_index, len(samples))
+        return b"".join((header, arguments, samples.tobytes()))
+
     def _register_with_local_server(self):
         if self.buffer_id not in self.server._buffers:
             self.server._buffers[self.buffer_id] = set()
@@ -251,12 +289,31 @@ class Buffer(ServerObjectProxy):
             )
         return request
 
+    def _send_numpy(self, samples, chunk_size=1633, sync=True, window=16):
+        import supriya.commands
+
+        request_id = supriya.commands.BufferSetContiguousRequest.request_id
+        if self.server.debug_request_names:
+            address = request_id.request_name
+        else:
+            address = int(request_id)
+        starts = range(0, len(samples), chunk_size)
+        for i, start in enumerate(starts):
+            if i and not i % window:
+                self.server.sync()
+            datagram = self._encode_set_contiguous(
+                address, self.buffer_id, start, samples[start : start + chunk_size]
+            )
+            self.server.send_message(datagram)
+        if sync:
+            self.server.sync()
+
     def _unregister_with_local_server(self):
         buffer_id = self.buffer_id
         buffers = self.server._buffers[buffer_id]
         buffers.remove(self)
         if not buffers:
-            del (self.server._buffers[buffer_id])
+            del self.server._buffers[buffer_id]
         return buffer_id
 
     def _unregister_with_remote_server(self, buffer_id):
@@ -268,6 +325,39 @@ class Buffer(ServerObjectProxy):
         )
         return request
 
+    @staticmethod
+    def _write_wav(file_pointer, array, sample_rate):
+        # 32-bit float WAV: the header, then the samples in a single write.
+        frame_count, channel_count = array.shape
+        data_size = array.size * 4
+        fmt = struct.pack(
+            "<HHIIHHH",
+            3,  # WAVE_FORMAT_IEEE_FLOAT
+            channel_count,
+            sample_rate,
+            sample_rate * channel_count * 4,
+            channel_count * 4,
+            32,
+            0,
+        )
+        header = b"".join(
+            (
+                b"RIFF",
+                struct.pack("<I", 4 + 8 + len(fmt) + 8 + 4 + 8 + data_size),
+                b"WAVE",
+                b"fmt ",
+                struct.pack("<I", len(fmt)),
+                fmt,
+                b"fact",
+                struct.pack("<II", 4, frame_count),
+                b"data",
+                struct.pack("<I", data_size),
+            )
+        )
+        file_pointer.write(header)
+        file_pointer.flush()
+        array.astype("<f4", copy=False).tofile(file_pointer)
+
     ### PUBLIC METHODS ###
 
     def allocate(self, channel_count=1, frame_count=1, server=None, sync=True):
@@ -872,6 +962,64 @@ class Buffer(ServerObjectProxy):
         )
         request.communicate(server=self.server, sync=sync)
 
+    @classmethod
+    def from_numpy(cls, array, chunk_size=1633, server=None, sync=True, window=16):
+        """
+        Allocates buffer on `server` with contents copied from `array`.
+
+        One-dimensional arrays allocate single-channel buffers.
+        Two-dimensional arrays are read as frames by channels.
+
+        Samples are packed from a big-endian float32 view of `array` straight
+        into `/b_setn` datagrams of at most `chunk_size` samples, keeping each
+        under scsynth's 8KiB UDP packet limit. At most `window` datagrams are
+        in flight between syncs.
+
+        ::
+
+            >>> import numpy
+            >>> server = supriya.realtime.Server().boot()
+            >>> array = numpy.array([[0.0, 0.5], [1.0, -0.5], [0.25, -1.0]])
+            >>> buffer_ = supriya.realtime.Buffer.from_numpy(array)
+            >>> buffer_.query()
+            BufferInfoResponse(
+                items=(
+                    Item(buffer_id=0, frame_count=3, channel_count=2, sample_rate=44100.0),
+                    ),
+                )
+
+        ::
+
+            >>> buffer_.get_contiguous([(0, 6)]).as_dict()[0]
+            (0.0, 0.5, 1.0, -0.5, 0.25, -1.0)
+
+        ::
+
+            >>> buffer_ = buffer_.free()
+
+        Returns buffer.
+        """
+        import numpy
+
+        array = numpy.asarray(array, dtype=">f4")
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+        if array.ndim != 2 or not array.size:
+            raise ValueError(array.shape)
+        frame_count, channel_count = array.shape
+        buffer_ = cls().allocate(
+            channel_count=channel_count,
+            frame_count=frame_count,
+            server=server,
+            sync=True,
+        )
+        if not buffer_.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        buffer_._send_numpy(
+            array.ravel(), chunk_size=chunk_size, sync=sync, window=window
+        )
+        return buffer_
+
     def get(self, indices=None):
         """
         Gets sample values at `indices`.
@@ -1002,6 +1150,105 @@ class Buffer(ServerObjectProxy):
         response = self.get_contiguous(index_count_pairs=index_count_pairs)
         return response
 
+    @classmethod
+    def load_array(
+        cls, array, sample_rate=44100, server=None, sync=True, transfer=None
+    ):
+        """
+        Allocates buffer on `server` with contents copied from `array`.
+
+        Arrays are read like in `from_numpy`, and transferred one of two ways:
+
+        - ``'file'``: `array` is written to a temporary 32-bit float WAV file
+          and loaded with a single `/b_allocRead`. The file is removed once
+          the server answers with `/done` or `/fail`.
+
+        - ``'osc'``: `array` is streamed via `from_numpy`. Buffers transferred
+          this way take the server's sample rate, not `sample_rate`.
+
+        By default, the file transfer is used for arrays of at least 65536
+        samples when the server is local, and OSC otherwise.
+
+        ::
+
+            >>> import numpy
+            >>> server = supriya.realtime.Server().boot()
+            >>> array = numpy.zeros((100000, 2))
+            >>> array[::1000] = 0.5
+            >>> buffer_ = supriya.realtime.Buffer.load_array(array, 48000)
+            >>> buffer_.query()
+            BufferInfoResponse(
+                items=(
+                    Item(buffer_id=0, frame_count=100000, channel_count=2, sample_rate=48000.0),
+                    ),
+                )
+
+        ::
+
+            >>> buffer_.get_contiguous([(1998, 4)]).as_dict()[1998]
+            (0.0, 0.0, 0.5, 0.5)
+
+        ::
+
+            >>> buffer_ = buffer_.free()
+
+        Returns buffer.
+        """
+        import numpy
+        import supriya.realtime
+
+        server = server or supriya.realtime.Server.get_default_server()
+        array = numpy.asarray(array, dtype="<f4")
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+        if array.ndim != 2 or not array.size:
+            raise ValueError(array.shape)
+        if transfer is None:
+            if (
+                server.ip_address in cls._local_ip_addresses
+                and cls._file_transfer_threshold <= array.size
+            ):
+                transfer = "file"
+            else:
+                transfer = "osc"
+        if transfer == "osc":
+            return cls.from_numpy(array, server=server, sync=sync)
+        elif transfer != "file":
+            raise ValueError(transfer)
+        file_descriptor, file_path = tempfile.mkstemp(suffix=".wav")
+        try:
+            with open(file_descriptor, "wb") as file_pointer:
+                cls._write_wav(file_pointer, array, int(sample_rate))
+        except Exception:
+            os.remove(file_path)
+            raise
+        buffer_ = cls()
+        callbacks = []
+
+        def remove_file():
+            for callback in callbacks:
+                server.osc_io.unregister(callback)
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+        def procedure(message):
+            if buffer_.buffer_id in message.contents[1:]:
+                remove_file()
+
+        for address in ("/done", "/fail"):
+            callback = server.osc_io.register(
+                pattern=(address, "/b_allocRead"), procedure=procedure
+            )
+            callbacks.append(callback)
+        try:
+            buffer_.allocate_from_file(file_path, server=server, sync=sync)
+        finally:
+            if not buffer_.is_allocated:
+                remove_file()
+        return buffer_
+
     def normalize(self, as_wavetable=None, new_maximum=1.0, sync=False):
         request = supriya.commands.BufferNormalizeRequest(
             as_wavetable=as_wavetable, buffer_id=self, new_maximum=new_maximum
@@ -1251,6 +1498,110 @@ class Buffer(ServerObjectProxy):
         )
         request.communicate(server=self.server, sync=sync)
 
+    def to_numpy(self, chunk_size=1633, retries=3, timeout=1.0, window=16):
+        """
+        Copies buffer contents into a NumPy array.
+
+        Contents are requested via `/b_getn` in chunks of at most
+        `chunk_size` samples, with up to `window` requests in flight at once.
+        Chunks not answered within `timeout` seconds are requested again, up
+        to `retries` times in a row. Replies are decoded straight from their
+        datagrams' float32 payloads.
+
+        ::
+
+            >>> server = supriya.realtime.Server().boot()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(
+            ...     channel_count=2,
+            ...     frame_count=3,
+            ...     )
+            >>> buffer_.set_contiguous([(0, [0.0, 0.5, 1.0, -0.5, 0.25, -1.0])])
+            >>> buffer_.to_numpy().tolist()
+            [[0.0, 0.5], [1.0, -0.5], [0.25, -1.0]]
+
+        ::
+
+            >>> buffer_ = buffer_.free()
+
+        ::
+
+            >>> buffer_.to_numpy()
+            Traceback (most recent call last):
+            ...
+            supriya.exceptions.BufferNotAllocated
+
+        Returns float32 array of shape `(frame_count, channel_count)`.
+        """
+        import numpy
+        import supriya.commands
+
+        if not self.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        buffer_id = self.buffer_id
+        channel_count, frame_count = self.channel_count, self.frame_count
+        sample_count = channel_count * frame_count
+        samples = numpy.zeros(sample_count, dtype=numpy.float32)
+        pending = {
+            start: min(chunk_size, sample_count - start)
+            for start in range(0, sample_count, chunk_size)
+        }
+        unsent = collections.deque(pending)
+        in_flight = set()
+        condition = threading.Condition()
+
+        def store(start, values):
+            # Only this call's own outstanding chunks are taken, leaving other
+            # replies for whoever else is reading the buffer.
+            with condition:
+                if pending.get(start) != len(values):
+                    return False
+                del pending[start]
+                samples[start : start + len(values)] = values
+                condition.notify()
+                return True
+
+        def datagram_procedure(datagram):
+            decoded = self._decode_set_contiguous(datagram)
+            if decoded is None or decoded[0] != buffer_id:
+                return False
+            return store(*decoded[1:])
+
+        def procedure(message):
+            # Replies arriving inside bundles are decoded as usual.
+            store(message.contents[1], message.contents[3:])
+
+        osc_io = self.server.osc_io
+        handle = osc_io.register_datagram("/b_setn", datagram_procedure)
+        callback = osc_io.register(pattern=("/b_setn", buffer_id), procedure=procedure)
+        try:
+            with condition:
+                failure_count = 0
+                while pending:
+                    while unsent and len(in_flight) < window:
+                        start = unsent.popleft()
+                        if start not in pending:
+                            continue
+                        request = supriya.commands.BufferGetContiguousRequest(
+                            buffer_id=buffer_id,
+                            index_count_pairs=[(start, pending[start])],
+                        )
+                        self.server.send_message(request)
+                        in_flight.add(start)
+                    remaining = len(pending)
+                    if condition.wait_for(lambda: len(pending) < remaining, timeout):
+                        in_flight.intersection_update(pending)
+                        failure_count = 0
+                        continue
+                    failure_count += 1
+                    if retries < failure_count:
+                        raise supriya.exceptions.RequestTimeout
+                    unsent.extendleft(sorted(in_flight, reverse=True))
+                    in_flight.clear()
+        finally:
+            osc_io.unregister(callback)
+            osc_io.unregister_datagram(handle)
+        return samples.reshape(frame_count, channel_count)
+
     def write(
         self,
         file_path,
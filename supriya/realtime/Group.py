@@ -47,10 +47,18 @@ class Group(Node, UniqueTreeContainer):
 
         self._control_interface = supriya.realtime.GroupInterface(client=self)
         Node.__init__(self, name=name, node_id_is_permanent=node_id_is_permanent)
-        UniqueTreeContainer.__init__(self, children=children, name=name)
+        UniqueTreeContainer.__init__(self, name=name)
+        self._children = supriya.realtime.SiblingList()
+        if children is not None:
+            self[:] = children
 
     ### SPECIAL METHODS ###
 
+    def __contains__(self, expr):
+        if isinstance(expr, str):
+            return expr in self._named_children
+        return expr in self._children
+
     def __graph__(self):
         graph = super().__graph__()
         parent_node = graph[self._get_graphviz_name()]
@@ -153,13 +161,13 @@ class Group(Node, UniqueTreeContainer):
         import supriya.commands
         import supriya.realtime
 
-        nodes = set()
+        nodes = {}
         paused_nodes = set()
         synthdefs = set()
         requests = []
         iterator = Group._iterate_setitem_expr(self, expr, start)
         for node, target_node, add_action in iterator:
-            nodes.add(node)
+            nodes[node] = None
             if node.is_allocated:
                 if add_action == supriya.AddAction.ADD_TO_HEAD:
                     request = supriya.commands.GroupHeadRequest(
@@ -217,6 +225,7 @@ class Group(Node, UniqueTreeContainer):
         new_nodes, paused_nodes, requests, synthdefs = self._collect_requests_and_synthdefs(
             expr, start
         )
+        self._reserve_node_ids(new_nodes, self.server)
         nodes_to_free = [_ for _ in old_nodes if _ not in new_nodes]
         if nodes_to_free:
             requests.insert(
@@ -280,6 +289,7 @@ class Group(Node, UniqueTreeContainer):
             requests,
             synthdefs,
         ) = self._collect_requests_and_synthdefs(self)
+        self._reserve_node_ids([self, *nodes], server)
         requests = [group_new_request, *requests]
         if self.is_paused:
             paused_nodes.add(self)
@@ -291,6 +301,12 @@ class Group(Node, UniqueTreeContainer):
         Node.free(self)
         return self
 
+    def index(self, expr):
+        if expr not in self._children:
+            message = "{!r} not in {!r}.".format(expr, self)
+            raise ValueError(message)
+        return self._children.index(expr)
+
     @property
     def controls(self):
         return self._control_interface
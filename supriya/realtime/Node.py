@@ -158,31 +158,17 @@ class Node(ServerObjectProxy, UniqueTreeNode):
         elif response.action == NodeAction.NODE_MOVED:
             new_parent = self.server._nodes[response.parent_group_id]
             if new_parent is self.parent:
-                new_index = 0
-                if response.previous_node_id is not None:
-                    previous_node = self.server._nodes[response.previous_node_id]
-                    new_index = new_parent.index(previous_node) + 1
-                elif response.next_node_id is not None:
-                    next_node = self.server._nodes[response.next_node_id]
-                    new_index = new_parent.index(next_node)
-                old_index = self.parent.index(self)
-                if new_index != self.parent.index(self):
-                    if new_index < old_index:
-                        self.parent._children.remove(self)
-                        self.parent._children.insert(new_index, self)
-                    else:
-                        self.parent._children.insert(new_index, self)
-                        self.parent._children.pop(old_index)
+                new_parent._children.remove(self)
             else:
                 self._set_parent(new_parent)
-                index = 0
-                if response.previous_node_id is not None:
-                    previous_node = self.server._nodes[response.previous_node_id]
-                    index = new_parent.index(previous_node) + 1
-                elif response.next_node_id is not None:
-                    next_node = self.server._nodes[response.next_node_id]
-                    index = new_parent.index(next_node)
-                new_parent._children.insert(index, self)
+            if response.previous_node_id is not None:
+                previous_node = self.server._nodes[response.previous_node_id]
+                new_parent._children.insert_after(previous_node, self)
+            elif response.next_node_id is not None:
+                next_node = self.server._nodes[response.next_node_id]
+                new_parent._children.insert_before(next_node, self)
+            else:
+                new_parent._children.insert(0, self)
 
     def _move_node(self, *, add_action, node):
         target_node = self
@@ -196,14 +182,11 @@ class Node(ServerObjectProxy, UniqueTreeNode):
         elif add_action == AddAction.ADD_TO_TAIL:
             parent_node._children.append(node)
         elif add_action == AddAction.ADD_BEFORE:
-            index = parent_node.index(target_node)
-            parent_node._children.insert(index, node)
+            parent_node._children.insert_before(target_node, node)
         elif add_action == AddAction.ADD_AFTER:
-            index = parent_node.index(target_node)
-            parent_node._children.insert(index + 1, node)
+            parent_node._children.insert_after(target_node, node)
         elif add_action == AddAction.REPLACE:
-            index = parent_node.index(target_node)
-            parent_node._children[index] = node
+            parent_node._children.insert_before(target_node, node)
             target_node._set_parent(None)
             target_node._unregister_with_local_server()
 
@@ -211,7 +194,9 @@ class Node(ServerObjectProxy, UniqueTreeNode):
         self, node_id=None, node_id_is_permanent=False, server=None
     ):
         id_allocator = server.node_id_allocator
-        if node_id is None:
+        if node_id is None and self._node_id is not None:
+            node_id = self._node_id  # reserved by _reserve_node_ids()
+        elif node_id is None:
             if node_id_is_permanent:
                 node_id = id_allocator.allocate_permanent_node_id()
             else:
@@ -234,6 +219,18 @@ class Node(ServerObjectProxy, UniqueTreeNode):
             for parent in self.parentage[1:]:
                 parent._control_interface.add_controls(name_dictionary)
 
+    @staticmethod
+    def _reserve_node_ids(nodes, server):
+        # Takes the allocator's lock once for a whole tree of new nodes.
+        nodes = [
+            node
+            for node in nodes
+            if node.node_id is None and not node.node_id_is_permanent
+        ]
+        node_ids = server.node_id_allocator.allocate_node_ids(len(nodes))
+        for node, node_id in zip(nodes, node_ids):
+            node._node_id = node_id
+
     def _run(self, run_flag):
         self._is_paused = not bool(run_flag)
 
@@ -36,6 +36,11 @@ class NodeIdAllocator(SupriyaObject):
         >>> allocator.allocate_permanent_node_id()
         2
 
+    ::
+
+        >>> allocator.allocate_node_ids(4)
+        [1003, 1004, 1005, 1006]
+
     """
 
     ### CLASS VARIABLES ###
@@ -77,6 +82,30 @@ class NodeIdAllocator(SupriyaObject):
             x = x | self._mask
         return x
 
+    def allocate_node_ids(self, count):
+        """
+        Allocates `count` node IDs under one lock.
+
+        Returns list of node IDs.
+        """
+        count = int(count)
+        with self._lock:
+            start = self._temp
+            if start + count - 1 <= 0x03FFFFFF:
+                self._temp = start + count
+                if 0x03FFFFFF < self._temp:
+                    self._temp = (self._temp % 0x03FFFFFF) + self._initial_node_id
+                return [x | self._mask for x in range(start, start + count)]
+            node_ids = []
+            for _ in range(count):
+                x = self._temp
+                temp = x + 1
+                if 0x03FFFFFF < temp:
+                    temp = (temp % 0x03FFFFFF) + self._initial_node_id
+                self._temp = temp
+                node_ids.append(x | self._mask)
+            return node_ids
+
     def allocate_permanent_node_id(self):
         x = None
         with self._lock:
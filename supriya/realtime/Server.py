@@ -410,8 +410,10 @@ class Server(SupriyaObject):
                 node._set_parent(parent)
                 if response.previous_node_id:
                     previous_child = self._nodes[response.previous_node_id]
-                    index = parent.index(previous_child)
-                    parent._children.insert(index + 1, node)
+                    parent._children.insert_after(previous_child, node)
+                elif response.next_node_id:
+                    next_child = self._nodes[response.next_node_id]
+                    parent._children.insert_before(next_child, node)
                 else:
                     parent._children.append(node)
 
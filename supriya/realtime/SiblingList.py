@@ -0,0 +1,176 @@
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class SiblingList(SupriyaObject):
+    """
+    An indexed, doubly-linked list of sibling nodes.
+
+    Backs ``Group._children``. Membership tests and inserting, removing or
+    moving a node relative to a known sibling are O(1). Positional access
+    is served from a tuple snapshot, rebuilt lazily after mutation.
+
+    ::
+
+        >>> import supriya.realtime
+        >>> group_a = supriya.realtime.Group(name="a")
+        >>> group_b = supriya.realtime.Group(name="b")
+        >>> group_c = supriya.realtime.Group(name="c")
+        >>> siblings = supriya.realtime.SiblingList([group_a, group_c])
+        >>> siblings.insert_after(group_a, group_b)
+        >>> [_.name for _ in siblings]
+        ['a', 'b', 'c']
+
+    ::
+
+        >>> siblings.remove(group_a)
+        >>> siblings.insert_after(group_c, group_a)
+        >>> [_.name for _ in siblings]
+        ['b', 'c', 'a']
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Server Internals"
+
+    __slots__ = ("_head", "_next", "_previous", "_sequence", "_tail")
+
+    ### INITIALIZER ###
+
+    def __init__(self, nodes=None):
+        self._head = None
+        self._next = {}
+        self._previous = {}
+        self._sequence = ()
+        self._tail = None
+        if nodes is not None:
+            self.extend(nodes)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, node):
+        return node in self._next
+
+    def __delitem__(self, i):
+        nodes = list(self._get_sequence())
+        del nodes[i]
+        self._replace_all(nodes)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self._get_sequence()[i])
+        return self._get_sequence()[i]
+
+    def __iter__(self):
+        return iter(self._get_sequence())
+
+    def __len__(self):
+        return len(self._next)
+
+    def __repr__(self):
+        return "<{}: {!r}>".format(type(self).__name__, list(self))
+
+    def __setitem__(self, i, expr):
+        nodes = list(self._get_sequence())
+        nodes[i] = expr
+        self._replace_all(nodes)
+
+    ### PRIVATE METHODS ###
+
+    def _get_sequence(self):
+        if self._sequence is None:
+            nodes, node = [], self._head
+            while node is not None:
+                nodes.append(node)
+                node = self._next[node]
+            self._sequence = tuple(nodes)
+        return self._sequence
+
+    def _link(self, node, previous_node, next_node):
+        if node in self._next:
+            raise ValueError("{!r} already in {!r}.".format(node, self))
+        self._previous[node] = previous_node
+        self._next[node] = next_node
+        if previous_node is None:
+            self._head = node
+        else:
+            self._next[previous_node] = node
+        if next_node is None:
+            self._tail = node
+        else:
+            self._previous[next_node] = node
+        self._sequence = None
+
+    def _replace_all(self, nodes):
+        self._head = self._tail = None
+        self._next.clear()
+        self._previous.clear()
+        self._sequence = None
+        self.extend(nodes)
+
+    ### PUBLIC METHODS ###
+
+    def append(self, node):
+        self._link(node, self._tail, None)
+
+    def extend(self, nodes):
+        for node in nodes:
+            self.append(node)
+
+    def index(self, node):
+        if node not in self._next:
+            raise ValueError("{!r} not in {!r}.".format(node, self))
+        for i, x in enumerate(self._get_sequence()):
+            if x is node:
+                return i
+
+    def insert(self, i, node):
+        sequence = self._get_sequence()
+        if i < 0:
+            i = max(len(sequence) + i, 0)
+        if len(sequence) <= i:
+            self.append(node)
+        else:
+            self.insert_before(sequence[i], node)
+
+    def insert_after(self, anchor, node):
+        """
+        Inserts `node` immediately after sibling `anchor`.
+        """
+        self._link(node, anchor, self._next[anchor])
+
+    def insert_before(self, anchor, node):
+        """
+        Inserts `node` immediately before sibling `anchor`.
+        """
+        self._link(node, self._previous[anchor], anchor)
+
+    def pop(self, i=-1):
+        node = self._get_sequence()[i]
+        self.remove(node)
+        return node
+
+    def remove(self, node):
+        if node not in self._next:
+            raise ValueError("{!r} not in {!r}.".format(node, self))
+        previous_node = self._previous.pop(node)
+        next_node = self._next.pop(node)
+        if previous_node is None:
+            self._head = next_node
+        else:
+            self._next[previous_node] = next_node
+        if next_node is None:
+            self._tail = previous_node
+        else:
+            self._previous[next_node] = previous_node
+        self._sequence = None
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def head(self):
+        return self._head
+
+    @property
+    def tail(self):
+        return self._tail
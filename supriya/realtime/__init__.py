@@ -24,6 +24,7 @@ from .ServerMeters import ServerMeters  # noqa
 from .ServerObjectProxy import ServerObjectProxy  # noqa
 from .ServerOptions import ServerOptions  # noqa
 from .ServerRecorder import ServerRecorder  # noqa
+from .SiblingList import SiblingList  # noqa
 from .StatusWatcher import StatusWatcher  # noqa
 from .Synth import Synth  # noqa
 from .SynthControl import SynthControl  # noqa
@@ -15,6 +15,30 @@ import supriya.cli
 pytest_plugins = ["helpers_namespace"]
 
 
+# ### HOOKS ### #
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", help="run tests marked as benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks only run with --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing comparisons, only run with --benchmark"
+    )
+
+
 # ### FIXTURES ### #
 
 
@@ -0,0 +1,97 @@
+import io
+import os
+import pathlib
+import tarfile
+
+import pytest
+import uqbar.io
+
+import supriya.cli
+
+
+def write_render(directory_path, name, size, accessed):
+    output_file_path = directory_path / "{}.aiff".format(name)
+    output_file_path.write_bytes(b"x" * size)
+    os.utime(str(output_file_path), (accessed, accessed))
+
+
+@pytest.fixture
+def cache_path(tmpdir):
+    cache_path = pathlib.Path(tmpdir) / "cache"
+    cache_path.mkdir()
+    write_render(cache_path, "session-a", 1500, 86400 * 365)
+    write_render(cache_path, "session-b", 500, 86400 * 366)
+    return cache_path
+
+
+def run_script(command):
+    string_io = io.StringIO()
+    script = supriya.cli.ManageCacheScript()
+    with uqbar.io.RedirectedStreams(stdout=string_io):
+        try:
+            script(command)
+        except SystemExit as e:
+            raise RuntimeError("SystemExit: {}".format(e.code))
+    return string_io.getvalue()
+
+
+def test_inspect(cache_path):
+    pytest.helpers.compare_strings(
+        """
+        Inspecting .../cache ...
+            session-b.aiff [500 B, accessed 1971-01-0..., created 1971-01-0...]
+            session-a.aiff [1.5 KB, accessed 1971-01-0..., created 1971-01-0...]
+            2 entries, 2.0 KB total.
+        """,
+        run_script(["--cache-path", str(cache_path)]),
+    )
+    assert (cache_path / "manifest.json").exists()
+
+
+def test_export_import(cache_path, tmpdir):
+    archive_path = tmpdir / "renders.tar.gz"
+    pytest.helpers.compare_strings(
+        """
+        Exporting .../cache ...
+            Exported session-b
+            Wrote .../renders.tar.gz
+        """,
+        run_script(
+            [
+                "--cache-path",
+                str(cache_path),
+                "--export",
+                str(archive_path),
+                "session-b",
+            ]
+        ),
+    )
+    with tarfile.open(str(archive_path)) as archive:
+        assert sorted(archive.getnames()) == ["manifest.json", "session-b.aiff"]
+    pytest.helpers.compare_strings(
+        """
+        Importing .../renders.tar.gz ...
+            Imported session-b
+        """,
+        run_script(
+            ["--cache-path", str(tmpdir / "other"), "--import", str(archive_path)]
+        ),
+    )
+    assert (pathlib.Path(tmpdir) / "other" / "session-b.aiff").read_bytes() == (
+        b"x" * 500
+    )
+
+
+def test_prune(cache_path):
+    pytest.helpers.compare_strings(
+        """
+        Pruning .../cache ...
+            Pruned session-a
+        """,
+        run_script(["--cache-path", str(cache_path), "--prune", "--max-size", "1K"]),
+    )
+    assert sorted(_.name for _ in cache_path.iterdir()) == [
+        "manifest.json",
+        "manifest.lock",
+        "session-b.aiff",
+    ]
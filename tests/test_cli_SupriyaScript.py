@@ -19,7 +19,8 @@ def test():
     pytest.helpers.compare_strings(
         """
         usage: supriya-script [-h] [--version]
-                              {help,list,asset,material,project,session,synthdef} ...
+                              {help,list,asset,cache,material,project,session,synthdef}
+                              ...
 
         Entry-point to Supriya developer scripts catalog.
 
@@ -28,10 +29,11 @@ def test():
           --version             show program's version number and exit
 
         subcommands:
-          {help,list,asset,material,project,session,synthdef}
+          {help,list,asset,cache,material,project,session,synthdef}
             help                print subcommand help
             list                list subcommands
             asset               manage project package assets
+            cache               manage the render cache
             material            manage project package materials
             project             manage project packages
             session             manage project package sessions
@@ -0,0 +1,151 @@
+import asyncio
+import socket
+import threading
+
+import pytest
+
+import supriya.commands
+import supriya.osc
+
+
+class StandIn(asyncio.DatagramProtocol):
+    """
+    A tiny scsynth stand-in which answers sync, notify and buffer queries.
+    """
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.get_extra_info("socket").setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 2 ** 20
+        )
+
+    def datagram_received(self, data, remote_address):
+        if supriya.osc.OscBundle.datagram_is_bundle(data):
+            return
+        message = supriya.osc.OscMessage.from_datagram(data)
+        address, contents = message.address, message.contents
+        if address == "/sync":
+            reply = supriya.osc.OscMessage("/synced", *contents)
+        elif address == "/notify":
+            reply = supriya.osc.OscMessage("/done", "/notify")
+        elif address == "/b_query":
+            reply = supriya.osc.OscMessage("/b_info", contents[0], 512, 1, 44100.0)
+        else:
+            return
+        self.transport.sendto(reply.to_datagram(), remote_address)
+
+
+class PseudoServer:
+    def __init__(self, osc_io):
+        self._lock = threading.Lock()
+        self._sync_id = 0
+        self.is_running = True
+        self.osc_io = osc_io
+
+    def send_message(self, message, with_request_name=False):
+        self.osc_io.send(message, with_request_name=True)
+
+    @property
+    def next_sync_id(self):
+        self._sync_id += 1
+        return self._sync_id
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+
+async def make_stand_in():
+    loop = asyncio.get_event_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        StandIn, local_addr=("127.0.0.1", 0)
+    )
+    return transport
+
+
+def test_gather(event_loop):
+    async def main():
+        stand_in = await make_stand_in()
+        osc_io = supriya.osc.AsyncOscIO()
+        await osc_io.boot(*stand_in.get_extra_info("sockname"))
+        server = PseudoServer(osc_io)
+        requests = [supriya.commands.BufferQueryRequest([i]) for i in range(200)]
+        requests += [supriya.commands.SyncRequest(i) for i in range(200)]
+        responses = await asyncio.gather(
+            *(request.communicate_async(server=server) for request in requests)
+        )
+        notify = await supriya.commands.NotifyRequest(True).communicate_async(
+            server=server
+        )
+        osc_io.quit()
+        stand_in.close()
+        return responses, notify, osc_io.callbacks
+
+    responses, notify, callbacks = event_loop.run_until_complete(main())
+    assert [response.buffer_id for response in responses[:200]] == list(range(200))
+    assert [response.sync_id for response in responses[200:]] == list(range(200))
+    assert notify.action == ("/notify",)
+    assert not callbacks
+
+
+def test_request_bundle(event_loop):
+    async def main():
+        stand_in = await make_stand_in()
+        osc_io = supriya.osc.AsyncOscIO()
+        await osc_io.boot(*stand_in.get_extra_info("sockname"))
+        server = PseudoServer(osc_io)
+        request_bundle = supriya.commands.RequestBundle(
+            contents=[supriya.commands.BufferQueryRequest([0])]
+        )
+        with osc_io.capture() as transcript:
+            response = await request_bundle.communicate_async(server=server)
+        osc_io.quit()
+        stand_in.close()
+        return response, transcript
+
+    response, transcript = event_loop.run_until_complete(main())
+    # The stand-in ignores bundles, so the bundle's trailing sync times out.
+    assert response is None
+    assert len(transcript.sent_messages) == 1
+
+
+def test_timeout(event_loop):
+    async def main():
+        stand_in = await make_stand_in()
+        osc_io = supriya.osc.AsyncOscIO()
+        await osc_io.boot(*stand_in.get_extra_info("sockname"))
+        server = PseudoServer(osc_io)
+        request = supriya.commands.BufferCloseRequest(buffer_id=1)
+        response = await request.communicate_async(server=server, timeout=0.1)
+        osc_io.quit()
+        stand_in.close()
+        return response, osc_io.callbacks
+
+    response, callbacks = event_loop.run_until_complete(main())
+    assert response is None
+    assert not callbacks
+
+
+def test_threaded_osc_io(event_loop):
+    async def main():
+        stand_in = await make_stand_in()
+        osc_io = supriya.osc.OscIO()
+        osc_io.boot(*stand_in.get_extra_info("sockname"))
+        server = PseudoServer(osc_io)
+        responses = await asyncio.gather(
+            *(
+                supriya.commands.SyncRequest(i).communicate_async(server=server)
+                for i in range(50)
+            )
+        )
+        osc_io.quit()
+        stand_in.close()
+        return responses
+
+    responses = event_loop.run_until_complete(main())
+    assert [response.sync_id for response in responses] == list(range(50))
@@ -0,0 +1,126 @@
+import json
+import os
+
+import pytest
+
+import supriya.nonrealtime
+
+
+def write_render(directory_path, name, size, accessed):
+    osc_file_path = directory_path / "{}.osc".format(name)
+    osc_file_path.write_bytes(b"y" * 10)
+    output_file_path = directory_path / "{}.aiff".format(name)
+    output_file_path.write_bytes(b"x" * size)
+    for file_path in (osc_file_path, output_file_path):
+        os.utime(str(file_path), (accessed, accessed))
+    return output_file_path
+
+
+@pytest.fixture
+def render_cache(tmpdir):
+    render_cache = supriya.nonrealtime.RenderCache(tmpdir / "cache")
+    render_cache.directory_path.mkdir()
+    return render_cache
+
+
+def test_add(render_cache):
+    output_file_path = write_render(render_cache.directory_path, "session-a", 100, 0)
+    entry = render_cache.add(output_file_path)
+    assert entry["file_name"] == "session-a.aiff"
+    assert entry["size"] == 110
+    # Files found before they were indexed date from their modification.
+    assert entry["created"] == 0
+    assert "session-a" in render_cache
+    assert list(render_cache) == ["session-a"]
+    with open(str(render_cache.manifest_path)) as file_pointer:
+        assert json.load(file_pointer) == {"session-a": entry}
+    # A second add records an access, keeping the creation time.
+    created = entry["created"]
+    entry = render_cache.add(output_file_path)
+    assert entry["created"] == created
+    assert entry["accessed"] >= created
+
+
+def test_atomic_path(render_cache):
+    file_path = render_cache.directory_path / "session-a.aiff"
+    with render_cache.atomic_path(file_path) as temporary_path:
+        assert temporary_path.parent == render_cache.directory_path
+        temporary_path.write_bytes(b"x")
+        assert not file_path.exists()
+    assert file_path.read_bytes() == b"x"
+    with pytest.raises(RuntimeError):
+        with render_cache.atomic_path(file_path) as temporary_path:
+            temporary_path.write_bytes(b"partial")
+            raise RuntimeError
+    assert file_path.read_bytes() == b"x"
+    assert sorted(_.name for _ in render_cache.directory_path.iterdir()) == [
+        "session-a.aiff"
+    ]
+
+
+def test_export_import(render_cache, tmpdir):
+    for i, name in enumerate(["session-a", "session-b", "session-c"]):
+        render_cache.add(write_render(render_cache.directory_path, name, 100, i))
+    archive_path = tmpdir / "renders.tar.gz"
+    assert render_cache.export(archive_path, names=["session-a", "session-c.aiff"]) == [
+        "session-a",
+        "session-c",
+    ]
+    other_cache = supriya.nonrealtime.RenderCache(tmpdir / "other")
+    assert other_cache.import_(archive_path) == ["session-a", "session-c"]
+    assert list(other_cache) == ["session-a", "session-c"]
+    assert sorted(_.name for _ in other_cache.directory_path.glob("session-*")) == [
+        "session-a.aiff",
+        "session-a.osc",
+        "session-c.aiff",
+        "session-c.osc",
+    ]
+    assert other_cache.entries["session-a"] == render_cache.entries["session-a"]
+    assert other_cache.import_(archive_path) == []
+
+
+def test_max_size():
+    assert supriya.nonrealtime.RenderCache(max_size=1024).max_size == 1024
+    assert supriya.nonrealtime.RenderCache(max_size="1.5K").max_size == 1500
+    assert supriya.nonrealtime.RenderCache(max_size="500MB").max_size == 500000000
+    with pytest.raises(ValueError):
+        supriya.nonrealtime.RenderCache(max_size="lots")
+
+
+def test_prune(render_cache):
+    for i, name in enumerate(["session-a", "session-b", "session-c", "session-d"]):
+        output_file_path = write_render(render_cache.directory_path, name, 90, 0)
+        render_cache.add(output_file_path)
+    # Least recently used first, skipping kept entries.
+    assert render_cache.prune(max_size=250, keep=["session-a"]) == [
+        "session-b",
+        "session-c",
+    ]
+    assert list(render_cache) == ["session-a", "session-d"]
+    assert not list(render_cache.directory_path.glob("session-b.*"))
+    # Missing files are dropped without being counted as evictions.
+    (render_cache.directory_path / "session-d.aiff").unlink()
+    (render_cache.directory_path / "session-d.osc").unlink()
+    assert render_cache.prune() == []
+    assert list(render_cache) == ["session-a"]
+    assert render_cache.prune(max_entries=1) == []
+    assert render_cache.prune(max_age=0) == ["session-a"]
+    assert len(render_cache) == 0
+
+
+def test_rebuild(render_cache):
+    write_render(render_cache.directory_path, "session-a", 100, 1000)
+    render_cache.add(write_render(render_cache.directory_path, "session-b", 50, 0))
+    assert render_cache.entries["session-b"]["accessed"] > 0
+    render_cache.manifest_path.write_text("{")
+    # Unreadable manifests fall back to scanning the directory.
+    assert render_cache.entries["session-a"]["accessed"] == 1000
+    entries = render_cache.rebuild()
+    assert sorted(entries) == ["session-a", "session-b"]
+    assert entries["session-a"] == {
+        "accessed": 1000,
+        "created": 1000,
+        "file_name": "session-a.aiff",
+        "size": 110,
+    }
+    assert entries["session-b"]["accessed"] == 0
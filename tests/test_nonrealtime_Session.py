@@ -1,3 +1,6 @@
+import collections
+import time
+
 import pytest
 
 import supriya.nonrealtime
@@ -94,3 +97,83 @@ def test_04():
         ),
         supriya.osc.OscBundle(timestamp=2.0, contents=(supriya.osc.OscMessage(0),)),
     ]
+
+
+def test_05():
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        synth = session.add_synth(duration=2)
+    with session.at(1):
+        synth["amplitude"] = 0.25
+        synth["amplitude"] = 0.5
+    assert synth._events == {"amplitude": [(1.0, 0.5)]}
+    assert session.to_lists(duration=2)[1] == [
+        1.0,
+        [["/n_set", 1000, "amplitude", 0.5]],
+    ]
+
+
+def collect_node_settings_by_tree_scan(session, offset, state, id_mapping):
+    result = collections.OrderedDict()
+    if state.nodes_to_children is None:
+        state = session._find_state_before(offset, with_node_tree=True)
+    for node in state._iterate_nodes(session.root_node, state.nodes_to_children):
+        settings = {}
+        for key, events in node._events.items():
+            for event_offset, value in events:
+                if event_offset == offset:
+                    settings[key] = id_mapping.get(value, value)
+        if settings:
+            result[node] = settings
+    return result
+
+
+def collect_node_settings(node_count):
+    """
+    Collects node settings at every offset, by tree scan and by index.
+
+    Returns the number of offsets, along with each approach's timing.
+    """
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        group = session.add_group(duration=node_count * 0.01 + 10)
+    for i in range(node_count):
+        with session.at(i * 0.01):
+            synth = group.add_synth(duration=5)
+        with session.at(i * 0.01 + 1):
+            synth["amplitude"] = 0.5
+    id_mapping = session._build_id_mapping()
+    states = [
+        (offset, session._find_state_at(offset, clone_if_missing=True))
+        for offset in session.offsets[1:]
+    ]
+    start_time = time.time()
+    expected = [
+        collect_node_settings_by_tree_scan(session, offset, state, id_mapping)
+        for offset, state in states
+    ]
+    tree_scan_time = time.time() - start_time
+    start_time = time.time()
+    actual = [
+        session._collect_node_settings(offset, state, id_mapping)
+        for offset, state in states
+    ]
+    indexed_time = time.time() - start_time
+    assert actual == expected
+    assert sum(len(_) for _ in actual) == node_count
+    return len(states), tree_scan_time, indexed_time
+
+
+def test_collect_node_settings():
+    collect_node_settings(50)
+
+
+@pytest.mark.benchmark
+def test_benchmark():
+    offset_count, tree_scan_time, indexed_time = collect_node_settings(300)
+    print()
+    print(
+        "{} offsets: {:.3f}s tree scan, {:.3f}s indexed".format(
+            offset_count, tree_scan_time, indexed_time
+        )
+    )
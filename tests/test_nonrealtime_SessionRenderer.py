@@ -0,0 +1,539 @@
+import aifc
+import configparser
+import hashlib
+import os
+import pathlib
+import stat
+import sys
+import textwrap
+import tracemalloc
+
+import pytest
+
+import supriya.exceptions
+import supriya.nonrealtime
+
+
+def test_write_datagrams(nonrealtime_paths):
+    inner_session = pytest.helpers.make_test_session()
+    session = supriya.nonrealtime.Session(input_=inner_session)
+    with session.at(0):
+        session.add_synth(duration=10)
+    renderer = supriya.nonrealtime.SessionRenderer(session)
+    expected_datagram = b"".join(
+        renderer._build_datagram(osc_bundle) for osc_bundle in renderer.to_osc_bundles()
+    )
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=nonrealtime_paths.render_directory_path
+    )
+    renderer._collect_prerender_tuples(session, write_datagrams=True)
+    assert [_[0] for _ in renderer.prerender_tuples] == [inner_session, session]
+    _, datagram_file_path, input_, osc_bundles = renderer.prerender_tuples[-1]
+    assert input_ is inner_session
+    assert osc_bundles is None
+    assert datagram_file_path.parent == nonrealtime_paths.render_directory_path
+    assert datagram_file_path.read_bytes() == expected_datagram
+    assert renderer.renderable_prefixes[inner_session].name == (
+        "session-7b3f85710f19667f73f745b8ac8080a0"
+    )
+    md5 = hashlib.md5(expected_datagram)
+    for value in (
+        renderer.session_input_paths[session],
+        session.options.input_bus_channel_count,
+        session.options.output_bus_channel_count,
+        renderer.sample_rate,
+        renderer.header_format,
+        renderer.sample_format,
+    ):
+        md5.update(str(value).encode())
+    assert renderer.renderable_prefixes[session].name == "session-{}".format(
+        md5.hexdigest()
+    )
+    renderer._remove_datagram_files()
+    assert not list(nonrealtime_paths.render_directory_path.iterdir())
+
+
+def install_fake_scsynth(monkeypatch, directory_path, source):
+    bin_directory_path = directory_path / "bin"
+    bin_directory_path.mkdir()
+    scsynth_path = bin_directory_path / "scsynth"
+    scsynth_path.write_text("#!{}\n{}".format(sys.executable, textwrap.dedent(source)))
+    scsynth_path.chmod(scsynth_path.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv(
+        "PATH", "{}{}{}".format(bin_directory_path, os.pathsep, os.environ["PATH"])
+    )
+
+
+@pytest.fixture
+def fake_scsynth(monkeypatch, nonrealtime_paths):
+    """
+    Puts a fake scsynth on PATH which logs when it starts and stops, then
+    writes a dummy output file.
+    """
+    log_file_path = nonrealtime_paths.test_directory_path / "scsynth.log"
+    install_fake_scsynth(
+        monkeypatch,
+        nonrealtime_paths.test_directory_path,
+        """\
+        import sys, time
+        name, start = sys.argv[4], time.time()
+        time.sleep(0.25)
+        with open(sys.argv[4], "w") as file_pointer:
+            file_pointer.write("fake")
+        with open({!r}, "a") as file_pointer:
+            file_pointer.write("{{}} {{}} {{}}\\n".format(name, start, time.time()))
+        """.format(str(log_file_path)),
+    )
+
+    def read_log():
+        intervals = {}
+        for line in log_file_path.read_text().splitlines():
+            name, start, stop = line.rsplit(" ", 2)
+            intervals[pathlib.Path(name).stem] = (float(start), float(stop))
+        return intervals
+
+    return read_log
+
+
+def make_stemmed_session(frequencies=(440, 441, 442)):
+    stem_sessions = []
+    for i, frequency in enumerate(frequencies):
+        stem_session = supriya.nonrealtime.Session(0, 1, name="stem-{}".format(i))
+        with stem_session.at(0):
+            stem_session.add_synth(duration=1, frequency=frequency)
+        stem_sessions.append(stem_session)
+    session = supriya.nonrealtime.Session(0, 1)
+    with session.at(0):
+        for stem_session in stem_sessions:
+            session.cue_soundfile(stem_session, duration=1)
+    return session, stem_sessions
+
+
+def test_render_parallel(fake_scsynth, nonrealtime_paths):
+    session, stem_sessions = make_stemmed_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        max_workers=3,
+    )
+    exit_code, transcript, output_file_path = renderer.render(
+        nonrealtime_paths.output_file_path
+    )
+    assert exit_code == 0
+    assert output_file_path.read_text() == "fake"
+    intervals = fake_scsynth()
+    stem_intervals = [
+        intervals[renderer.renderable_prefixes[_].name] for _ in stem_sessions
+    ]
+    master_interval = intervals[renderer.renderable_prefixes[session].name]
+    # Stems render concurrently, and the master waits for every stem.
+    assert max(_[0] for _ in stem_intervals) < min(_[1] for _ in stem_intervals)
+    assert max(_[1] for _ in stem_intervals) <= master_interval[0]
+    # Transcripts are grouped per session, in dependency order.
+    sequential_render_directory_path = (
+        nonrealtime_paths.test_directory_path / "sequential"
+    )
+    sequential_render_directory_path.mkdir()
+    _, sequential_transcript, _ = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=sequential_render_directory_path
+    ).render(nonrealtime_paths.output_file_path)
+    assert transcript == sequential_transcript
+
+
+def test_render_parallel_error(fake_scsynth, monkeypatch, nonrealtime_paths):
+    session, stem_sessions = make_stemmed_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        max_workers=2,
+    )
+    render_datagram = supriya.nonrealtime.SessionRenderer._render_datagram
+
+    def fail_second_stem(self, session, *args, **kwargs):
+        if session is stem_sessions[1]:
+            return 1
+        return render_datagram(self, session, *args, **kwargs)
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer, "_render_datagram", fail_second_stem
+    )
+    with pytest.raises(supriya.exceptions.NonrealtimeRenderError):
+        renderer.render(nonrealtime_paths.output_file_path)
+    intervals = fake_scsynth()
+    # The master is never started, but every other stem still finishes.
+    assert renderer.renderable_prefixes[session].name not in intervals
+    assert len(intervals) == 2
+    assert "    SuperCollider errored!" in renderer.transcript
+    assert not list(nonrealtime_paths.render_directory_path.glob("*.tmp"))
+
+
+def test_render_parallel_duplicates(fake_scsynth, nonrealtime_paths):
+    session, stem_sessions = make_stemmed_session(frequencies=[440, 440, 550])
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        max_workers=3,
+    )
+    renderer.render(nonrealtime_paths.output_file_path)
+    assert (
+        renderer.renderable_prefixes[stem_sessions[0]]
+        == renderer.renderable_prefixes[stem_sessions[1]]
+    )
+    # Identical stems render once, the second waiting on the first.
+    log_file_path = nonrealtime_paths.test_directory_path / "scsynth.log"
+    assert len(log_file_path.read_text().splitlines()) == 3
+    assert len(fake_scsynth()) == 3
+    prefix = renderer.renderable_prefixes[stem_sessions[1]].name
+    assert "    Skipped {}.osc. Output already exists.".format(prefix) in (
+        renderer.transcript
+    )
+
+
+def test_render_cache(fake_scsynth, nonrealtime_paths):
+    render_cache = supriya.nonrealtime.RenderCache(
+        nonrealtime_paths.render_directory_path, max_entries=4
+    )
+    session, stem_sessions = make_stemmed_session()
+    renderer = supriya.nonrealtime.SessionRenderer(session, render_cache=render_cache)
+    assert renderer.render_directory_path == render_cache.directory_path
+    renderer.render()
+    names = [renderer.renderable_prefixes[_].name for _ in stem_sessions + [session]]
+    assert list(render_cache) == sorted(names)
+    for name in names:
+        entry = render_cache.entries[name]
+        assert entry["file_name"] == "{}.aiff".format(name)
+        osc_file_path = render_cache.directory_path / "{}.osc".format(name)
+        assert entry["size"] == len("fake") + osc_file_path.stat().st_size
+    # Renders go to temporary files, moved into place once complete.
+    assert not list(render_cache.directory_path.glob("*.tmp"))
+    commands = [_.split() for _ in renderer.transcript if "Command:" in _]
+    assert [_[5].rpartition("-")[0] + ".aiff" for _ in commands] == [
+        "{}.aiff".format(name) for name in names
+    ]
+    assert all(_[5].endswith(".tmp") for _ in commands)
+    # Rendering past the cache's bounds evicts the least recently used
+    # render, but never those just used.
+    other_session = supriya.nonrealtime.Session(0, 1)
+    with other_session.at(0):
+        other_session.cue_soundfile(stem_sessions[0], duration=1)
+    other_renderer = supriya.nonrealtime.SessionRenderer(
+        other_session, render_cache=render_cache
+    )
+    other_renderer.render()
+    other_name = other_renderer.renderable_prefixes[other_session].name
+    assert list(render_cache) == sorted([names[0], names[2], names[3], other_name])
+    assert not list(render_cache.directory_path.glob("{}.*".format(names[1])))
+
+
+def test_render_cache_default(fake_scsynth, monkeypatch, nonrealtime_paths):
+    output_path = nonrealtime_paths.output_directory_path
+    monkeypatch.setattr(supriya, "output_path", output_path)
+    session = supriya.nonrealtime.Session(0, 1)
+    with session.at(0):
+        session.add_synth(duration=1)
+    # Default renders are uncached, rendering straight to their output path.
+    renderer = supriya.nonrealtime.SessionRenderer(session)
+    assert renderer.render_cache is None
+    renderer.render()
+    name = renderer.renderable_prefixes[session].name
+    assert renderer.transcript[2:] == [
+        "Rendering {}.osc.".format(name),
+        "    Command: scsynth -N {name}.osc _ {name}.aiff 44100 aiff int24 "
+        "-i 0 -o 1".format(name=name),
+        "    Rendered {}.osc with exit code 0.".format(name),
+    ]
+    assert sorted(_.name for _ in output_path.iterdir()) == [
+        "{}.aiff".format(name),
+        "{}.osc".format(name),
+    ]
+    # Unless supriya's configuration file has a [cache] section.
+    config = configparser.ConfigParser()
+    config.read_dict({"cache": {"max_entries": "4"}})
+    monkeypatch.setattr(supriya, "config", config)
+    renderer = supriya.nonrealtime.SessionRenderer(session)
+    assert renderer.render_cache.directory_path == output_path
+    assert renderer.render_cache.max_entries == 4
+
+
+@pytest.fixture
+def ramp_scsynth(monkeypatch, nonrealtime_paths):
+    """
+    Puts a fake scsynth on PATH which renders a mono AIFF whose frames count
+    up from zero, as long as its score.
+    """
+    install_fake_scsynth(
+        monkeypatch,
+        nonrealtime_paths.test_directory_path,
+        """\
+        import aifc, math, struct, sys
+        with open(sys.argv[2], "rb") as file_pointer:
+            datagram = file_pointer.read()
+        index, duration = 0, 0.0
+        while index < len(datagram):
+            size, = struct.unpack(">i", datagram[index : index + 4])
+            timetag, = struct.unpack(">q", datagram[index + 12 : index + 20])
+            duration = timetag / 2 ** 32
+            index += 4 + size
+        sample_rate = int(sys.argv[5])
+        sample_width = {"int16": 2, "int24": 3}.get(sys.argv[7], 4)
+        frame_count = int(math.ceil(round(duration * sample_rate) / 64)) * 64
+        writer = aifc.open(sys.argv[4], "wb")
+        writer.aiff()
+        writer.setparams((1, sample_width, sample_rate, 0, b"NONE", b""))
+        writer.writeframes(
+            b"".join(i.to_bytes(sample_width, "big") for i in range(frame_count))
+        )
+        writer.close()
+        """,
+    )
+
+
+def make_partitionable_session():
+    session = supriya.nonrealtime.Session(0, 1)
+    with session.at(0):
+        group = session.add_group(duration=4)
+        session.add_buffer(frame_count=16)
+    for start_offset, stop_offset in [(0, 0.9), (1, 2.5), (2.6, 3), (3.1, 4)]:
+        with session.at(start_offset):
+            synth = group.add_synth(duration=stop_offset - start_offset)
+        with session.at((start_offset + stop_offset) / 2):
+            synth["frequency"] = 550
+    return session
+
+
+@pytest.mark.parametrize(
+    "partitions, partition_tail, expected",
+    [
+        (1, 0.0, [(0, 0, None)]),
+        (2, 0.0, [(0, 0, 88192), (44096, 88192, None)]),
+        (4, 0.0, [(0, 0, 44096), (44096, 44096, 132288), (114624, 132288, None)]),
+        (4, 0.2, [(0, 0, None)]),
+    ],
+)
+def test_build_partitions(partitions, partition_tail, expected):
+    session = make_partitionable_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, partition_tail=partition_tail, partitions=partitions
+    )
+    assert renderer._build_partitions(session, 4.0, 64) == expected
+
+
+def test_build_partition_bundles():
+    session = make_partitionable_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, partition_tail=0.0, partitions=4
+    )
+    osc_bundles = renderer.to_osc_bundles()
+    window_bundles = renderer._build_partition_bundles(osc_bundles, 2.0, None)
+    # Synths started before the window are left out, along with anything
+    # addressing them, while its group and buffer are replayed at its start.
+    assert [
+        (
+            round(_.timestamp, 6),
+            [
+                message.to_list()[:2]
+                for message in _.contents
+                if message.address != "/d_recv"
+            ],
+        )
+        for _ in window_bundles
+    ] == [
+        (0.0, [["/b_alloc", 0], ["/g_new", 1000]]),
+        (0.6, [["/s_new", "da0982184cc8fa54cf9d288a0fe1f6ca"]]),
+        (0.8, [["/n_set", 1003]]),
+        (1.0, [["/n_set", 1003]]),
+        (1.1, [["/s_new", "da0982184cc8fa54cf9d288a0fe1f6ca"]]),
+        (1.55, [["/n_set", 1004]]),
+        (2.0, [["/n_free", 1000], ["/n_set", 1004], ["/b_free", 0], [0]]),
+    ]
+    window_bundles = renderer._build_partition_bundles(osc_bundles, 0.0, 44096 / 44100)
+    assert window_bundles[-1].timestamp == 44096 / 44100
+    assert window_bundles[-1].contents[-1].to_list() == [0]
+
+
+def test_render_partitions(nonrealtime_paths, ramp_scsynth):
+    session = make_partitionable_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        partition_tail=0.0,
+        partitions=4,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    exit_code, transcript, output_file_path = renderer.render()
+    assert exit_code == 0
+    prefix = renderer.renderable_prefixes[session]
+    assert transcript[:2] == [
+        "Writing {}.osc.".format(prefix),
+        "    Wrote {}.osc.".format(prefix),
+    ]
+    assert transcript[2] == "Partitioning {}.osc into 3 windows.".format(prefix)
+    assert transcript[-2:] == [
+        "Stitching {}.aiff.".format(prefix),
+        "    Stitched {}.aiff.".format(prefix),
+    ]
+    assert sorted(
+        _.name for _ in nonrealtime_paths.render_directory_path.iterdir()
+    ) == [
+        "{}.aiff".format(prefix),
+        "{}.osc".format(prefix),
+    ]
+    # Each window's frames count up from the window's start, including its
+    # pre-roll.
+    expected_frames = []
+    for start_frame, cut_frame, stop_frame in [
+        (0, 0, 44096),
+        (44096, 44096, 132288),
+        (114624, 132288, 176448),
+    ]:
+        expected_frames.extend(range(cut_frame - start_frame, stop_frame - start_frame))
+    reader = aifc.open(str(output_file_path), "rb")
+    try:
+        assert reader.getnchannels() == 1
+        assert reader.getsampwidth() == 3
+        frames = reader.readframes(reader.getnframes())
+    finally:
+        reader.close()
+    assert [
+        int.from_bytes(frames[i : i + 3], "big") for i in range(0, len(frames), 3)
+    ] == expected_frames
+
+
+def test_render_partitions_unpartitionable(nonrealtime_paths, ramp_scsynth):
+    session = make_partitionable_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        partition_tail=0.0,
+        partitions=4,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        sample_format="float",
+    )
+    _, transcript, _ = renderer.render()
+    assert not any(_.startswith("Partitioning") for _ in transcript)
+
+
+def test_render_partitions_gated(nonrealtime_paths, ramp_scsynth):
+    session = make_partitionable_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        partitions=4,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    exit_code, transcript, output_file_path = renderer.render()
+    assert exit_code == 0
+    # Gated synths are released, not freed, when they stop, so the session
+    # renders whole unless told how long their releases last.
+    prefix = renderer.renderable_prefixes[session]
+    assert transcript[2] == (
+        "Not partitioning {}.osc: gated synths need a partition tail.".format(prefix)
+    )
+    assert not any(_.startswith("Partitioning") for _ in transcript)
+    assert not any(_.startswith("Stitching") for _ in transcript)
+
+
+def test_render_partitions_recording(nonrealtime_paths, ramp_scsynth):
+    session = make_partitionable_session()
+    with session.at(0):
+        buffer_ = session.add_buffer(channel_count=1, frame_count=32768)
+        buffer_.write("recording.aiff", frame_count=0, leave_open=True)
+    with session.at(4):
+        buffer_.close()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        partition_tail=0.0,
+        partitions=4,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    exit_code, transcript, _ = renderer.render()
+    assert exit_code == 0
+    prefix = renderer.renderable_prefixes[session]
+    assert transcript[2] == (
+        "Not partitioning {}.osc: it writes buffers to disk.".format(prefix)
+    )
+    assert not any(_.startswith("Partitioning") for _ in transcript)
+    # Windows after the first would drop the /b_write before their start.
+    _, _, _, osc_bundles = renderer.prerender_tuples[-1]
+    assert renderer._build_partition_bundles(osc_bundles, 2.0, None) is None
+
+
+def test_stitch_partitions_unreadable(nonrealtime_paths):
+    file_path = nonrealtime_paths.render_directory_path / "window.aiff"
+    file_path.write_bytes(b"fake")
+    renderer = supriya.nonrealtime.SessionRenderer(
+        make_partitionable_session(), partition_tail=0.0, partitions=2
+    )
+    with pytest.raises(ValueError):
+        renderer._stitch_partitions(
+            [(0, 0, None)],
+            [file_path],
+            nonrealtime_paths.render_directory_path / "output.aiff",
+        )
+
+
+def test_build_partitions_ungated():
+    # Ungated synths are freed when they stop, so no tail is added to them.
+    session = supriya.nonrealtime.Session(0, 1)
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        supriya.ugens.Out.ar(
+            bus=0, source=supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+        )
+    synthdef = builder.build()
+    for start_offset, stop_offset in [(0, 0.9), (1, 2.5), (2.6, 3), (3.1, 4)]:
+        with session.at(start_offset):
+            session.add_synth(synthdef=synthdef, duration=stop_offset - start_offset)
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, partition_tail=0.2, partitions=4
+    )
+    assert renderer._build_partitions(session, 4.0, 64) == [
+        (0, 0, 44096),
+        (44096, 44096, 132288),
+        (114624, 132288, None),
+    ]
+
+
+def stream_datagrams(render_directory_path, synth_count):
+    """
+    Writes a session's datagram file.
+
+    Returns the file's size and the peak memory traced while writing it.
+    """
+    session = supriya.nonrealtime.Session()
+    for i in range(synth_count):
+        with session.at(i * 0.1):
+            session.add_synth(duration=0.1, frequency=440 + i)
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=render_directory_path
+    )
+    tracemalloc.start()
+    renderer._collect_prerender_tuples(session, write_datagrams=True)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _, datagram_file_path, _, _ = renderer.prerender_tuples[-1]
+    size = datagram_file_path.stat().st_size
+    renderer._remove_datagram_files()
+    return size, peak
+
+
+def test_stream_datagrams(nonrealtime_paths):
+    # Peak memory grows far slower than the file written.
+    sizes, peaks = zip(
+        *[
+            stream_datagrams(nonrealtime_paths.render_directory_path, synth_count)
+            for synth_count in (200, 800)
+        ]
+    )
+    assert sizes[1] > 3 * sizes[0]
+    assert peaks[1] < 2 * peaks[0]
+
+
+@pytest.mark.benchmark
+def test_benchmark(nonrealtime_paths):
+    print()
+    for synth_count in (500, 2000):
+        size, peak = stream_datagrams(
+            nonrealtime_paths.render_directory_path, synth_count
+        )
+        print(
+            "{} synths: {:.1f} KB written, {:.1f} KB peak".format(
+                synth_count, size / 1e3, peak / 1e3
+            )
+        )
@@ -1,3 +1,8 @@
+import time
+import tracemalloc
+
+import pytest
+
 import supriya.nonrealtime
 
 
@@ -14,3 +19,76 @@ def test_iterate_nodes():
     root = "A"
     iterator = supriya.nonrealtime.State._iterate_nodes(root, nodes)
     assert list(iterator) == ["A", "B", "C", "E", "G", "F", "D"]
+
+
+def test_apply_transitions_node_trees():
+    """
+    Node trees move into persistent dictionaries once they hold more than
+    256 nodes, and back into dicts once they hold 128 or fewer.
+    """
+    apply_transitions = supriya.nonrealtime.State._apply_transitions
+    nodes_to_children, nodes_to_parents = {"root": None}, {"root": None}
+    for i in range(300):
+        transitions = {
+            i: supriya.nonrealtime.NodeTransition(
+                source=i, action="ADD_TO_TAIL", target="root"
+            )
+        }
+        nodes_to_children, nodes_to_parents = apply_transitions(
+            transitions, nodes_to_children, nodes_to_parents
+        )
+        expected_class = dict
+        if 256 < len(nodes_to_children):
+            expected_class = supriya.nonrealtime.PersistentDict
+        assert type(nodes_to_children) is expected_class
+        assert type(nodes_to_parents) is expected_class
+    assert len(nodes_to_children) == 301
+    for i in range(300):
+        previous_class = type(nodes_to_children)
+        nodes_to_children, nodes_to_parents = apply_transitions(
+            None, nodes_to_children, nodes_to_parents, stop_nodes=[i]
+        )
+        expected_class = previous_class
+        if len(nodes_to_children) <= 128:
+            expected_class = dict
+        assert type(nodes_to_children) is expected_class
+        assert type(nodes_to_parents) is expected_class
+        assert nodes_to_children["root"] == (tuple(range(i + 1, 300)) or None)
+        assert nodes_to_parents == dict(
+            [("root", None)] + [(j, "root") for j in range(i + 1, 300)]
+        )
+    assert nodes_to_children == {"root": None}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("concurrency", [64, 400])
+def test_benchmark(concurrency, monkeypatch):
+    """
+    Builds a session with persistent node trees, then with plain dicts only.
+    """
+
+    def build_session():
+        session = supriya.nonrealtime.Session()
+        for i in range(500):
+            with session.at(i * 0.01):
+                session.add_synth(duration=concurrency * 0.01)
+        return session
+
+    print()
+    for name in ("persistent", "dict"):
+        if name == "dict":
+            monkeypatch.setattr(
+                supriya.nonrealtime.State, "_persistent_node_count", float("inf")
+            )
+        tracemalloc.start()
+        start_time = time.time()
+        session = build_session()
+        build_time = time.time() - start_time
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            "{} concurrent, {}: {:.2f}s, {:.1f} MB".format(
+                concurrency, name, build_time, memory / 1e6
+            )
+        )
+        del session
@@ -0,0 +1,181 @@
+import enum
+import timeit
+
+import pytest
+
+import supriya.osc
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = "green"
+
+
+def legacy_to_datagram(osc_message):
+    """
+    The per-argument ``_encode_value`` path the codec replaces.
+    """
+    OscMessage = supriya.osc.OscMessage
+    datagram = OscMessage._encode_value(osc_message.address)[1]
+    encoded_type_tags = ","
+    encoded_contents = b""
+    for argument in osc_message.contents:
+        type_tags, encoded_value = OscMessage._encode_value(argument)
+        encoded_type_tags += type_tags
+        if encoded_value is not None:
+            encoded_contents += encoded_value
+    datagram += OscMessage._encode_string(encoded_type_tags)[1]
+    datagram += encoded_contents
+    return bytes(datagram)
+
+
+def legacy_from_datagram(datagram):
+    OscMessage = supriya.osc.OscMessage
+    datagram = bytearray(datagram)
+    contents = []
+    address, offset = OscMessage._read_string(datagram, 0)
+    type_tags, offset = OscMessage._read_string(datagram, offset)
+    payload = datagram[offset:]
+    payload_offset, type_tag_offset = 0, 1
+    while type_tag_offset < len(type_tags):
+        result, type_tag_offset, payload_offset = OscMessage._decode_value(
+            type_tags, type_tag_offset, payload, payload_offset
+        )
+        contents.append(result)
+    return OscMessage(address, *contents)
+
+
+@pytest.mark.parametrize(
+    "osc_message",
+    [
+        supriya.osc.OscMessage("/g_new", 0, 0),
+        supriya.osc.OscMessage("/s_new", "default", 1000, 0, 1, "amplitude", 0.5),
+        supriya.osc.OscMessage("/abcd", "", "a", "abc", "abcd", "abcde"),
+        supriya.osc.OscMessage("/flags", True, False, None, True),
+        supriya.osc.OscMessage("/array", [1, 2.5, ["x", [4]]], 3),
+        supriya.osc.OscMessage("/blob", bytearray(b"\x01\x02\x03"), 7),
+        supriya.osc.OscMessage("/enum", Color.RED, Color.GREEN),
+        supriya.osc.OscMessage(
+            "/bundle",
+            supriya.osc.OscBundle(
+                timestamp=1401557034.5,
+                contents=[supriya.osc.OscMessage("/one", 1, "two")],
+            ),
+        ),
+        supriya.osc.OscMessage(2),
+        supriya.osc.OscMessage(21, 1000, "foo", 1.0),
+    ],
+)
+def test_encode(osc_message):
+    assert osc_message.to_datagram() == legacy_to_datagram(osc_message)
+
+
+@pytest.mark.parametrize(
+    "osc_message",
+    [
+        supriya.osc.OscMessage("/n_go", 1000, 1, -1, -1, 0),
+        supriya.osc.OscMessage("/b_info", 1, 44100, 2, 44100.0),
+        supriya.osc.OscMessage("/abcd", "", "a", "abc", "abcd", "abcde"),
+        supriya.osc.OscMessage("/flags", True, False, None, True),
+        supriya.osc.OscMessage("/array", [1, 2.5, ["x", [4]]], 3),
+        supriya.osc.OscMessage(
+            "/nested", supriya.osc.OscMessage("/inner", 1, "two", [3.0])
+        ),
+    ],
+)
+def test_decode(osc_message):
+    datagram = osc_message.to_datagram()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(datagram) == legacy_from_datagram(
+        datagram
+    )
+    assert supriya.osc.OscMessage.from_datagram(bytearray(datagram)) == osc_message
+
+
+def test_decode_raw_blob():
+    osc_message = supriya.osc.OscMessage("/d_recv", bytearray(b"SCgf\x00\x00\x00\x02"))
+    decoded = supriya.osc.OscMessage.from_datagram(osc_message.to_datagram())
+    assert decoded.contents == (bytearray(b"SCgf\x00\x00\x00\x02"),)
+    assert isinstance(decoded.contents[0], bytearray)
+
+
+def test_bundle():
+    osc_bundle = supriya.osc.OscBundle(
+        timestamp=1401557034.5,
+        contents=[
+            supriya.osc.OscMessage("/one", 1, "a"),
+            supriya.osc.OscBundle(
+                timestamp=None, contents=[supriya.osc.OscMessage("/two", 2.5)]
+            ),
+            supriya.osc.OscMessage("/three", [1, 2, 3]),
+        ],
+    )
+    datagram = osc_bundle.to_datagram()
+    assert datagram[:8] == b"#bundle\x00"
+    assert supriya.osc.OscBundle.from_datagram(datagram) == osc_bundle
+    assert supriya.osc.OscCodec().decode(datagram) == osc_bundle
+    with pytest.raises(ValueError):
+        supriya.osc.OscBundle.from_datagram(osc_bundle.contents[0].to_datagram())
+
+
+def test_cache_size():
+    codec = supriya.osc.OscCodec(cache_size=4)
+    for i in range(10):
+        datagram = codec.encode_message("/foo{}".format(i), (i,))
+        assert codec.decode(datagram) == supriya.osc.OscMessage("/foo{}".format(i), i)
+    assert len(codec._encoders) <= 4
+
+
+def test_unencodable():
+    with pytest.raises(TypeError):
+        supriya.osc.OscMessage("/foo", object()).to_datagram()
+
+
+def build_benchmark_messages(count):
+    return [
+        supriya.osc.OscMessage(
+            "/s_new", "default", 1000 + i, 0, 1, "amplitude", 0.5, "frequency", 440.0
+        )
+        for i in range(count)
+    ] + [
+        supriya.osc.OscMessage("/n_set", 1000 + i, "frequency", 220.0 + i, "gate", 1)
+        for i in range(count)
+    ]
+
+
+def test_legacy():
+    messages = build_benchmark_messages(100)
+    datagrams = [legacy_to_datagram(message) for message in messages]
+    assert [message.to_datagram() for message in messages] == datagrams
+    assert [
+        supriya.osc.OscMessage.from_datagram(datagram) for datagram in datagrams
+    ] == [legacy_from_datagram(datagram) for datagram in datagrams]
+
+
+@pytest.mark.benchmark
+def test_benchmark():
+    messages = build_benchmark_messages(2000)
+    datagrams = [legacy_to_datagram(message) for message in messages]
+    timings = {}
+    for name, encode, decode in [
+        ("legacy", legacy_to_datagram, legacy_from_datagram),
+        (
+            "codec",
+            supriya.osc.OscMessage.to_datagram,
+            supriya.osc.OscMessage.from_datagram,
+        ),
+    ]:
+        encode_time = min(
+            timeit.repeat(lambda: [encode(x) for x in messages], number=1, repeat=5)
+        )
+        decode_time = min(
+            timeit.repeat(lambda: [decode(x) for x in datagrams], number=1, repeat=5)
+        )
+        timings[name] = (encode_time, decode_time)
+    print()
+    for name, (encode_time, decode_time) in timings.items():
+        print(
+            "{:>6}: encode {:.1f} msg/s, decode {:.1f} msg/s".format(
+                name, len(messages) / encode_time, len(datagrams) / decode_time
+            )
+        )
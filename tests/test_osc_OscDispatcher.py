@@ -0,0 +1,179 @@
+import threading
+import timeit
+
+import pytest
+
+import supriya.osc
+
+
+def make_callback(pattern, once=False):
+    return supriya.osc.OscIO.OscCallback(
+        pattern=tuple(pattern), procedure=print, once=once, parse_response=False
+    )
+
+
+def register(dispatcher, pattern, once=False):
+    return dispatcher.register(pattern, make_callback(pattern, once=once))
+
+
+def test_prefix_order():
+    dispatcher = supriya.osc.OscDispatcher()
+    one = register(dispatcher, ["/done", "/b_allocRead", 1])
+    two = register(dispatcher, ["/done"])
+    three = register(dispatcher, ["/done", "/b_allocRead"])
+    register(dispatcher, ["/done", "/b_allocRead", 2])
+    message = supriya.osc.OscMessage("/done", "/b_allocRead", 1)
+    assert dispatcher.match(message) == [two, three, one]
+    assert dispatcher.match(supriya.osc.OscMessage("/done")) == [two]
+    assert dispatcher.match(supriya.osc.OscMessage("/fail")) == []
+
+
+def test_once():
+    dispatcher = supriya.osc.OscDispatcher()
+    once = register(dispatcher, ["/synced", 1], once=True)
+    always = register(dispatcher, ["/synced"])
+    message = supriya.osc.OscMessage("/synced", 1)
+    assert dispatcher.match(message) == [always, once]
+    assert dispatcher.match(message) == [always]
+    assert len(dispatcher) == 1
+    assert ("/synced", 1) not in dispatcher._index
+
+
+def test_once_concurrent():
+    dispatcher = supriya.osc.OscDispatcher()
+    callbacks = [register(dispatcher, ["/synced", 1], once=True) for _ in range(500)]
+    message = supriya.osc.OscMessage("/synced", 1)
+    results = []
+
+    def worker():
+        for _ in range(10):
+            results.extend(dispatcher.match(message))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(map(id, results)) == sorted(map(id, callbacks))
+    assert not len(dispatcher)
+    assert not dispatcher._index
+
+
+def test_unregister():
+    dispatcher = supriya.osc.OscDispatcher()
+    callbacks = [register(dispatcher, ["/n_go"]) for _ in range(10)]
+    for callback in callbacks[:7]:
+        dispatcher.unregister(callback)
+    dispatcher.unregister(callbacks[0])
+    assert dispatcher.match(supriya.osc.OscMessage("/n_go", 1000)) == callbacks[7:]
+    # Buckets compact once half their entries are stale.
+    assert len(dispatcher._index[("/n_go",)]) < 2 * 3
+    for callback in callbacks[7:]:
+        dispatcher.unregister(callback)
+    assert not dispatcher._index
+
+
+@pytest.mark.parametrize(
+    "pattern, address, expected",
+    [
+        ("/n_*", "/n_go", True),
+        ("/n_*", "/n_go/foo", False),
+        ("/n_g?", "/n_go", True),
+        ("/n_g?", "/n_gone", False),
+        ("/[bc]_set", "/b_set", True),
+        ("/[bc]_set", "/n_set", False),
+        ("/[!bc]_set", "/n_set", True),
+        ("/[a-c]_set", "/c_set", True),
+        ("/{n_go,n_end}", "/n_end", True),
+        ("/{n_go,n_end}", "/n_off", False),
+        ("/*/b", "/a/b", True),
+    ],
+)
+def test_wildcards(pattern, address, expected):
+    dispatcher = supriya.osc.OscDispatcher()
+    callback = register(dispatcher, [pattern])
+    result = dispatcher.match(supriya.osc.OscMessage(address, 1000))
+    assert result == ([callback] if expected else [])
+
+
+def test_wildcard_arguments():
+    dispatcher = supriya.osc.OscDispatcher()
+    callback = register(dispatcher, ["/n_*", 1000], once=True)
+    assert dispatcher.match(supriya.osc.OscMessage("/n_go", 1001)) == []
+    assert dispatcher.match(supriya.osc.OscMessage("/n_go", 1000)) == [callback]
+    assert dispatcher.match(supriya.osc.OscMessage("/n_go", 1000)) == []
+    assert dispatcher._wildcards == ()
+
+
+def test_unhashable_arguments():
+    dispatcher = supriya.osc.OscDispatcher()
+    callback = register(dispatcher, ["/b_setn", 1, 2])
+    message = supriya.osc.OscMessage("/b_setn", bytearray(b"\x00"), 2)
+    assert dispatcher.match(message) == []
+    assert dispatcher.match(supriya.osc.OscMessage("/b_setn", 1, 2)) == [callback]
+
+
+def test_many_pending():
+    count = 1000
+    patterns = [("/synced", i) for i in range(count)]
+    dispatcher = supriya.osc.OscDispatcher()
+    for address in ("/n_go", "/n_end", "/n_move", "/tr", "/status.reply"):
+        register(dispatcher, [address])
+    callbacks = [register(dispatcher, pattern, once=True) for pattern in patterns]
+    for i, callback in enumerate(callbacks):
+        message = supriya.osc.OscMessage("/synced", i)
+        assert dispatcher.match(message) == [callback]
+    assert not dispatcher._index.keys() & set(patterns)
+    for callback in callbacks:
+        dispatcher.register(callback.pattern, callback)
+    for callback in callbacks:
+        dispatcher.unregister(callback)
+    assert len(dispatcher) == 5
+
+
+@pytest.mark.benchmark
+def test_benchmark():
+    count = 10000
+    patterns = [("/synced", i) for i in range(count)]
+    messages = [supriya.osc.OscMessage("/synced", i) for i in range(count)]
+    dispatcher = supriya.osc.OscDispatcher()
+    for address in ("/n_go", "/n_end", "/n_move", "/tr", "/status.reply"):
+        register(dispatcher, [address])
+    callbacks = [make_callback(pattern, once=True) for pattern in patterns]
+    register_time = timeit.timeit(
+        lambda: [dispatcher.register(x.pattern, x) for x in callbacks], number=1
+    )
+    idle_match_time = min(
+        timeit.repeat(
+            lambda: dispatcher.match(supriya.osc.OscMessage("/n_go", 1000)),
+            number=count,
+            repeat=3,
+        )
+    )
+    match_time = timeit.timeit(
+        lambda: [dispatcher.match(x) for x in messages], number=1
+    )
+    for callback in callbacks:
+        dispatcher.register(callback.pattern, callback)
+    unregister_time = timeit.timeit(
+        lambda: [dispatcher.unregister(x) for x in callbacks], number=1
+    )
+    # Dispatch should not scale with the number of pending callbacks.
+    small = supriya.osc.OscDispatcher()
+    register(small, ["/n_go"])
+    small_match_time = min(
+        timeit.repeat(
+            lambda: small.match(supriya.osc.OscMessage("/n_go", 1000)),
+            number=count,
+            repeat=3,
+        )
+    )
+    print()
+    for name, timing in [
+        ("register", register_time),
+        ("match (non-matching, 1 pending)", small_match_time),
+        ("match (non-matching, 10k pending)", idle_match_time),
+        ("match + claim once", match_time),
+        ("unregister", unregister_time),
+    ]:
+        print("{:>34}: {:.2f} us/op".format(name, timing / count * 1e6))
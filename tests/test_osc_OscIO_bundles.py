@@ -0,0 +1,156 @@
+import asyncio
+import socket
+import time
+
+import pytest
+
+import supriya.osc
+
+
+def make_bundle(now):
+    return supriya.osc.OscBundle(
+        timestamp=now - 1,
+        contents=[
+            supriya.osc.OscMessage("/tr", 1000, 2),
+            supriya.osc.OscBundle(
+                timestamp=now - 3,  # clamped to the enclosing timestamp
+                contents=[supriya.osc.OscMessage("/tr", 1000, 3)],
+            ),
+            supriya.osc.OscBundle(
+                timestamp=now - 0.5,
+                contents=[
+                    supriya.osc.OscMessage("/tr", 1000, 4),
+                    supriya.osc.OscMessage("/tr", 1000, 5),
+                ],
+            ),
+            supriya.osc.OscBundle(
+                timestamp=None, contents=[supriya.osc.OscMessage("/tr", 1000, 1)]
+            ),
+        ],
+    )
+
+
+def test_timestamp_roundtrip():
+    now = time.time()
+    for timestamp in (now, now + 0.05, now + 0.000123, 1401557034.5):
+        datagram = supriya.osc.OscBundle(timestamp=timestamp).to_datagram()
+        decoded = supriya.osc.OscBundle.from_datagram(datagram)
+        assert abs(decoded.timestamp - timestamp) < 1e-6
+
+
+def test_dispatch_order():
+    osc_io = supriya.osc.OscIO()
+    received = []
+    osc_io.register(pattern="/tr", procedure=lambda x: received.append(x.contents[1]))
+    with osc_io.capture() as transcript:
+        osc_io._process_datagram(make_bundle(time.time()).to_datagram())
+    # The unstamped bundle inherits its parent's timestamp.
+    assert received == [2, 3, 1, 4, 5]
+    assert len(transcript.received_messages) == 5
+
+
+def test_dispatch_message():
+    osc_io = supriya.osc.OscIO()
+    received = []
+    osc_io.register(pattern="/tr", procedure=received.append)
+    osc_io._process_datagram(supriya.osc.OscMessage("/tr", 1000, 1).to_datagram())
+    assert received == [supriya.osc.OscMessage("/tr", 1000, 1)]
+
+
+def test_scheduler():
+    osc_io = supriya.osc.OscIO(schedule_bundles=True)
+    received = []
+    osc_io.register(
+        pattern="/tr", procedure=lambda x: received.append((time.time(), x.contents[1]))
+    )
+    osc_io.scheduler.start()
+    try:
+        now = time.time()
+        bundle = supriya.osc.OscBundle(
+            contents=[
+                supriya.osc.OscBundle(
+                    timestamp=now + 0.2,
+                    contents=[supriya.osc.OscMessage("/tr", 1000, 3)],
+                ),
+                supriya.osc.OscBundle(
+                    timestamp=now + 0.1,
+                    contents=[supriya.osc.OscMessage("/tr", 1000, 2)],
+                ),
+                supriya.osc.OscMessage("/tr", 1000, 1),
+            ]
+        )
+        osc_io._process_datagram(bundle.to_datagram())
+        assert [value for _, value in received] == [1]
+        time.sleep(0.4)
+    finally:
+        osc_io.scheduler.stop()
+    assert [value for _, value in received] == [1, 2, 3]
+    assert received[1][0] >= now + 0.1
+    assert received[2][0] >= now + 0.2
+
+
+def test_scheduler_stop():
+    osc_io = supriya.osc.OscIO(schedule_bundles=True)
+    received = []
+    osc_io.register(pattern="/tr", procedure=received.append)
+    osc_io.scheduler.start()
+    bundle = supriya.osc.OscBundle(
+        timestamp=time.time() + 0.1, contents=[supriya.osc.OscMessage("/tr", 1000)]
+    )
+    osc_io._process_datagram(bundle.to_datagram())
+    osc_io.scheduler.stop()
+    time.sleep(0.2)
+    assert not received
+
+
+@pytest.mark.parametrize("receive_mode", ["serial", "threaded"])
+def test_udp(receive_mode):
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(2)
+    osc_io = supriya.osc.OscIO(receive_mode=receive_mode)
+    received = []
+    osc_io.register(pattern="/tr", procedure=lambda x: received.append(x.contents[1]))
+    try:
+        osc_io.boot(*peer.getsockname())
+        osc_io.send(supriya.osc.OscMessage("/notify", 1))
+        _, address = peer.recvfrom(1024)
+        peer.sendto(make_bundle(time.time()).to_datagram(), address)
+        start_time = time.time()
+        while len(received) < 5 and time.time() - start_time < 2:
+            time.sleep(0.01)
+    finally:
+        osc_io.quit()
+        peer.close()
+    assert received == [2, 3, 1, 4, 5]
+
+
+def test_async_scheduler():
+    async def main():
+        osc_io = supriya.osc.AsyncOscIO(schedule_bundles=True)
+        received = []
+        osc_io.register(
+            pattern="/tr", procedure=lambda x: received.append(x.contents[1])
+        )
+        now = time.time()
+        bundle = supriya.osc.OscBundle(
+            contents=[
+                supriya.osc.OscBundle(
+                    timestamp=now + 0.1,
+                    contents=[supriya.osc.OscMessage("/tr", 1000, 2)],
+                ),
+                supriya.osc.OscMessage("/tr", 1000, 1),
+            ]
+        )
+        osc_io._process_datagram(bundle.to_datagram())
+        immediate = list(received)
+        await asyncio.sleep(0.2)
+        return immediate, received
+
+    loop = asyncio.new_event_loop()
+    try:
+        immediate, received = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assert immediate == [1]
+    assert received == [1, 2]
@@ -0,0 +1,46 @@
+import supriya.osc
+
+
+def test_register_datagram():
+    osc_io = supriya.osc.OscIO()
+    received, datagrams = [], []
+    osc_io.register(pattern="/b_setn", procedure=received.append)
+
+    def procedure(datagram):
+        datagrams.append(datagram)
+        return datagram.endswith(b"\x00\x00\x00\x01")
+
+    handle = osc_io.register_datagram("/b_setn", procedure)
+    handled = supriya.osc.OscMessage("/b_setn", 0, 0, 1, 1).to_datagram()
+    unhandled = supriya.osc.OscMessage("/b_setn", 0, 0, 1, 2).to_datagram()
+    for datagram in [handled, unhandled]:
+        osc_io._process_datagram(datagram)
+    # Handled datagrams skip decoding and the callbacks.
+    assert datagrams == [handled, unhandled]
+    assert [_.contents for _ in received] == [(0, 0, 1, 2)]
+    # Captures still see everything.
+    with osc_io.capture() as transcript:
+        osc_io._process_datagram(handled)
+    assert len(transcript.received_messages) == 1
+    assert len(received) == 2
+    osc_io.unregister_datagram(handle)
+    assert osc_io.datagram_procedures == {}
+    osc_io._process_datagram(handled)
+    assert len(datagrams) == 3
+    assert len(received) == 3
+
+
+def test_register_datagram_bundled():
+    osc_io = supriya.osc.OscIO()
+    received, datagrams = [], []
+    osc_io.register(pattern="/b_setn", procedure=received.append)
+    osc_io.register_datagram("/b_setn", lambda x: datagrams.append(x) or True)
+    osc_io.register_datagram("/b_set", lambda x: datagrams.append(x) or True)
+    bundle = supriya.osc.OscBundle(
+        contents=[supriya.osc.OscMessage("/b_setn", 0, 0, 1, 1)]
+    )
+    osc_io._process_datagram(bundle.to_datagram())
+    osc_io._process_datagram(supriya.osc.OscMessage("/b_setn", 0).to_datagram())
+    # Bundled messages are decoded as usual, and addresses match exactly.
+    assert len(datagrams) == 1
+    assert len(received) == 1
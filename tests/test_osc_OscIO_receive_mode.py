@@ -0,0 +1,77 @@
+import socket
+import threading
+import time
+
+import pytest
+
+import supriya.osc
+
+
+@pytest.fixture
+def peer():
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(2)
+    yield peer
+    peer.close()
+
+
+def connect(osc_io, peer):
+    osc_io.boot(*peer.getsockname())
+    osc_io.send(supriya.osc.OscMessage("/notify", 1))
+    _, address = peer.recvfrom(1024)
+    return address
+
+
+def wait_for(predicate, timeout=5):
+    start_time = time.time()
+    while not predicate() and time.time() - start_time < timeout:
+        time.sleep(0.01)
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        supriya.osc.OscIO(receive_mode="forking")
+
+
+@pytest.mark.parametrize("receive_mode", ["serial", "threaded"])
+def test_roundtrip(peer, receive_mode):
+    osc_io = supriya.osc.OscIO(receive_mode=receive_mode)
+    received = []
+    osc_io.register(pattern="/done", procedure=received.append)
+    try:
+        address = connect(osc_io, peer)
+        peer.sendto(supriya.osc.OscMessage("/done", "/notify").to_datagram(), address)
+        wait_for(lambda: received)
+    finally:
+        osc_io.quit()
+    assert received == [supriya.osc.OscMessage("/done", "/notify")]
+
+
+def test_serial_flood(peer):
+    message_count = 10000
+    osc_io = supriya.osc.OscIO(receive_mode="serial")
+    received = []
+    thread_counts = []
+
+    def procedure(message):
+        received.append(message.contents[1])
+        if not len(received) % 500:
+            thread_counts.append(threading.active_count())
+
+    osc_io.register(pattern="/tr", procedure=procedure)
+    try:
+        address = connect(osc_io, peer)
+        baseline_thread_count = threading.active_count()
+        for i in range(message_count):
+            peer.sendto(
+                supriya.osc.OscMessage("/tr", 1000, i, 0.5).to_datagram(), address
+            )
+            if not i % 100:
+                time.sleep(0.001)
+        wait_for(lambda: len(received) == message_count)
+    finally:
+        osc_io.quit()
+    assert received == sorted(received)
+    assert len(received) == message_count
+    assert max(thread_counts) <= baseline_thread_count
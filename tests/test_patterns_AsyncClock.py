@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import supriya.osc
+import supriya.patterns
+
+
+class Event:
+    def __init__(self, manifest, delta=0.25, count=4):
+        self.count = count
+        self.delta = delta
+        self.manifest = manifest
+
+    def __call__(self, execution_time, scheduled_time):
+        self.manifest.append(scheduled_time)
+        self.count -= 1
+        if not self.count:
+            return
+        return self.delta
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_01():
+    """
+    Absolute scheduling with constant deltas.
+    """
+
+    async def main():
+        manifest = []
+        clock = supriya.patterns.AsyncClock()
+        now = time.time()
+        clock.schedule(Event(manifest), now + 0.1, absolute=True)
+        await asyncio.sleep(1.0)
+        return [round(_ - now, 6) for _ in manifest]
+
+    assert run(main()) == [0.1, 0.35, 0.6, 0.85]
+
+
+def test_02():
+    """
+    Canceling and resetting.
+    """
+
+    async def main():
+        manifest_a, manifest_b = [], []
+        event_a, event_b = Event(manifest_a), Event(manifest_b)
+        clock = supriya.patterns.AsyncClock()
+        now = clock.schedule(event_a)
+        clock.schedule(event_b, registry_key="b")
+        await asyncio.sleep(0.4)
+        clock.cancel(event_a)
+        await asyncio.sleep(0.2)
+        clock.reset()
+        await asyncio.sleep(0.4)
+        return (
+            [round(_ - now, 2) for _ in manifest_a],
+            [round(_ - now, 2) for _ in manifest_b],
+        )
+
+    assert run(main()) == ([0.0, 0.25], [0.0, 0.25, 0.5])
+
+
+def test_03():
+    """
+    Beat clocks layer on async clocks.
+    """
+
+    async def main():
+        manifest = []
+        clock = supriya.patterns.AsyncClock()
+        now = time.time()
+        beat_clock = supriya.patterns.BeatClock(
+            tempo=120, lookahead=0.05, clock=clock, start_time=now
+        )
+        beat_clock.schedule(Event(manifest, delta=1), beat=1)
+        await asyncio.sleep(2.5)
+        return [round(_ - now, 6) for _ in manifest]
+
+    assert run(main()) == [0.5, 1.0, 1.5, 2.0]
+
+
+def test_04(server):
+    """
+    Players start and stop on the event loop.
+    """
+    pattern = supriya.patterns.Pbind(
+        delta=0.1, duration=1.0, frequency=supriya.patterns.Pseq([440, 550, 660])
+    )
+
+    async def main():
+        clock = supriya.patterns.AsyncClock()
+        player = supriya.patterns.RealtimeEventPlayer(
+            pattern, clock=clock, server=server
+        )
+        with server.osc_io.capture() as transcript:
+            await player.start_async()
+            await asyncio.sleep(0.25)
+            await player.stop_async()
+        return [_.message for _ in transcript if _.label == "S"]
+
+    messages = run(main())
+    bundles = [_ for _ in messages if isinstance(_, supriya.osc.OscBundle)]
+    # Three note-on bundles, then the release bundle, then the sync.
+    assert len(bundles) == 4
+    assert messages[-1].address == 52
+
+
+def test_05():
+    """
+    Procedures see when they actually run, and a raising procedure doesn't
+    stop the clock.
+    """
+
+    async def main():
+        manifest, times, errors = [], [], []
+        asyncio.get_event_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+
+        def procedure(execution_time, scheduled_time):
+            times.append(round(execution_time - scheduled_time, 1))
+            raise RuntimeError
+
+        clock = supriya.patterns.AsyncClock()
+        now = time.time()
+        clock.schedule(procedure, now + 0.05, absolute=True)
+        clock.schedule(Event(manifest), now + 0.1, absolute=True)
+        # Block the loop, so the first procedure runs late.
+        time.sleep(0.25)
+        await asyncio.sleep(1.0)
+        return [round(_ - now, 6) for _ in manifest], times, errors
+
+    assert run(main()) == ([0.1, 0.35, 0.6, 0.85], [0.2], [])
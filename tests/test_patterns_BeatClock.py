@@ -0,0 +1,90 @@
+import time
+
+import supriya.patterns
+
+
+class Event:
+    def __init__(self, manifest, delta=0.25, count=4):
+        self.count = count
+        self.delta = delta
+        self.manifest = manifest
+
+    def __call__(self, execution_time, scheduled_time):
+        self.manifest.append((execution_time, scheduled_time))
+        self.count -= 1
+        if not self.count:
+            return
+        return self.delta
+
+
+def test_01():
+    """
+    Beats are converted to seconds and called a lookahead early.
+    """
+    manifest = []
+    event = Event(manifest)
+    now = time.time()
+    clock = supriya.patterns.BeatClock(tempo=120, lookahead=0.05, start_time=now)
+    assert clock.schedule(event, beat=1) == 1
+    time.sleep(1.0)
+    assert [round(y - now, 6) for x, y in manifest] == [0.5, 0.625, 0.75, 0.875]
+    assert all(0.049 < y - x for x, y in manifest)
+
+
+def test_02():
+    """
+    Quantized scheduling.
+    """
+    manifest = []
+    event = Event(manifest, count=1)
+    now = time.time()
+    clock = supriya.patterns.BeatClock(tempo=240, lookahead=0.05, start_time=now)
+    beat = clock.schedule(event, quantization=clock.beats_per_bar)
+    assert beat == 4
+    time.sleep(1.25)
+    assert [round(y - now, 6) for x, y in manifest] == [1.0]
+
+
+def test_03():
+    """
+    Dense procedures are called in batches, one wakeup per lookahead window.
+    """
+    manifest = []
+    event = Event(manifest, delta=0.01, count=40)
+    now = time.time()
+    clock = supriya.patterns.BeatClock(tempo=60, lookahead=0.1, start_time=now)
+    clock.schedule(event, beat=0.2)
+    time.sleep(1.0)
+    assert [round(y - now, 6) for x, y in manifest] == [
+        round(0.2 + i * 0.01, 6) for i in range(40)
+    ]
+    assert len(set(x for x, y in manifest)) <= 5
+
+
+def test_04():
+    """
+    Tempo changes reschedule pending procedures.
+    """
+    manifest = []
+    event = Event(manifest, delta=1, count=4)
+    now = time.time()
+    clock = supriya.patterns.BeatClock(tempo=240, lookahead=0.05, start_time=now)
+    clock.schedule(event, beat=1)
+    clock.set_tempo(120, beat=2)
+    time.sleep(1.5)
+    assert [round(y - now, 6) for x, y in manifest] == [0.25, 0.5, 1.0, 1.5]
+
+
+def test_05():
+    """
+    Canceling.
+    """
+    manifest = []
+    event = Event(manifest)
+    now = time.time()
+    clock = supriya.patterns.BeatClock(tempo=120, lookahead=0.05, start_time=now)
+    clock.schedule(event, beat=1)
+    time.sleep(0.5)
+    clock.cancel(event)
+    time.sleep(0.5)
+    assert [round(y - now, 6) for x, y in manifest] == [0.5]
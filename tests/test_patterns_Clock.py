@@ -1,6 +1,9 @@
+import threading
 import time
 import uuid
 
+import pytest
+
 import supriya.patterns
 
 
@@ -236,3 +239,89 @@ def test_13():
         (0.002, 0.002),
         (0.003, 0.003),
     ]
+
+
+def test_14():
+    """
+    Canceling leaves tombstones, compacted once they dominate the queue.
+    """
+    manifest = []
+    events = [Event(manifest, delta=0.25) for _ in range(100)]
+    clock = supriya.patterns.Clock()
+    now = time.time()
+    for event in events:
+        clock.schedule(event, now + 0.2, absolute=True)
+    for event in events[:-1]:
+        clock.cancel(event)
+    assert len(clock._queue) < 100
+    time.sleep(0.3)
+    assert [round(_ - now, 6) for _ in manifest] == [0.2]
+    clock.reset()
+
+
+def test_15():
+    """
+    A raising procedure doesn't stop the clock.
+    """
+    manifest = []
+
+    def procedure(execution_time, scheduled_time):
+        raise RuntimeError
+
+    event_a = Event(manifest, delta=0.25)
+    event_b = Event(manifest, delta=0.25)
+    clock = supriya.patterns.Clock()
+    now = time.time()
+    clock.schedule(procedure, now + 0.1, absolute=True)
+    clock.schedule(event_a, now + 0.2, absolute=True)
+    time.sleep(1.1)
+    assert clock._thread is None
+    clock.schedule(procedure, now + 1.2, absolute=True)
+    clock.schedule(event_b, now + 1.3, absolute=True)
+    time.sleep(0.3)
+    assert [round(_ - now, 6) for _ in manifest] == [0.2, 0.45, 0.7, 0.95, 1.3]
+    clock.reset()
+
+
+def schedule_many(clock, callback_count, start_time):
+    manifest = []
+
+    def procedure(execution_time, scheduled_time):
+        manifest.append(scheduled_time)
+
+    scheduled_times = [start_time + i * 0.00001 for i in range(callback_count)]
+    for i, scheduled_time in enumerate(scheduled_times, 1):
+        clock.schedule(procedure, scheduled_time, absolute=True, registry_key=i)
+    return manifest, scheduled_times
+
+
+def test_16():
+    """
+    Many procedures run in order on a single scheduler thread.
+    """
+    clock = supriya.patterns.Clock()
+    thread_count = threading.active_count()
+    manifest, scheduled_times = schedule_many(clock, 2000, time.time() + 0.1)
+    assert threading.active_count() <= thread_count + 1
+    time.sleep(0.5)
+    assert manifest == scheduled_times
+    assert clock.statistics.callback_count == 2000
+
+
+@pytest.mark.benchmark
+def test_benchmark():
+    callback_count = 100000
+    clock = supriya.patterns.Clock()
+    schedule_many(clock, callback_count, time.time() + 0.5)
+    time.sleep(2.0)
+    statistics = clock.statistics
+    print()
+    print(
+        "{} callbacks, mean lateness {:.3f} ms, max lateness {:.3f} ms".format(
+            statistics.callback_count,
+            statistics.mean_lateness * 1000,
+            statistics.maximum_lateness * 1000,
+        )
+    )
+    for upper_bound, count in statistics.lateness_histogram:
+        print("  <= {:>6} ms: {}".format(upper_bound * 1000, count))
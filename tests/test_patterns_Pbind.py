@@ -1,4 +1,6 @@
+import itertools
 import time
+import uuid
 
 import pytest
 import uqbar.strings
@@ -6,6 +8,7 @@ import uqbar.strings
 import supriya.assets.synthdefs
 import supriya.nonrealtime
 import supriya.patterns
+from supriya import utils
 
 pbind_01 = supriya.patterns.Pbind(
     amplitude=1.0,
@@ -859,3 +862,65 @@ def test_manual_stop_pbind_02(server):
             1 group
     """
     )
+
+
+class LegacyPbind(supriya.patterns.Pbind):
+    """
+    Pbind's original per-event path, for comparison.
+    """
+
+    __slots__ = ()
+
+    def _iterate(self, state=None):
+        patterns = self._coerce_pattern_pairs(self._patterns)
+        while True:
+            expr = {}
+            for name, pattern in sorted(patterns.items()):
+                try:
+                    expr[name] = next(pattern)
+                except StopIteration:
+                    return
+            expr = supriya.patterns.NoteEvent(**expr)
+            expr = utils.new(expr, uuid=uuid.uuid4())
+            should_stop = yield expr
+            if should_stop:
+                return
+
+
+def get_benchmark_pattern(class_):
+    return supriya.patterns.Pseed(
+        class_(
+            amplitude=supriya.patterns.Pwhite(0.1, 0.5),
+            duration=supriya.patterns.Prand([0.25, 0.5, 1.0], None),
+            frequency=supriya.patterns.Pseq([220, 330, 440, 550], None),
+        )
+    )
+
+
+def test_legacy():
+    def strip_uuids(events):
+        return [utils.new(_, uuid=None) for _ in events]
+
+    expected = list(itertools.islice(get_benchmark_pattern(LegacyPbind), 1000))
+    actual = list(itertools.islice(get_benchmark_pattern(supriya.patterns.Pbind), 1000))
+    assert strip_uuids(actual) == strip_uuids(expected)
+
+
+@pytest.mark.benchmark
+def test_benchmark():
+    rates = {}
+    for class_, event_count in [
+        (LegacyPbind, 50000),
+        (supriya.patterns.Pbind, 1000000),
+    ]:
+        iterator = iter(get_benchmark_pattern(class_))
+        start_time = time.time()
+        for _ in range(event_count):
+            next(iterator)
+        rates[class_] = event_count / (time.time() - start_time)
+    print()
+    print(
+        "legacy: {:.0f} events/s, compiled: {:.0f} events/s".format(
+            rates[LegacyPbind], rates[supriya.patterns.Pbind]
+        )
+    )
@@ -0,0 +1,73 @@
+import pytest
+
+import supriya.assets.synthdefs
+import supriya.nonrealtime
+import supriya.patterns
+from supriya import utils
+
+pattern = supriya.patterns.Pseq(
+    [
+        supriya.patterns.Pbind(
+            amplitude=supriya.patterns.Pseq([0.5, 1.0], 1),
+            duration=supriya.patterns.Pseq([1.0, 2.0], 1),
+            frequency=supriya.patterns.Pseq([440, [550, 660]], 1),
+        ),
+        supriya.patterns.Pbind(
+            delta=0.5, duration=1.0, pan=supriya.patterns.Pseq([-1, 1], 1)
+        ),
+    ],
+    1,
+)
+
+
+def test_columns():
+    frozen_pattern = supriya.patterns.Pfreeze(pattern)
+    assert len(frozen_pattern) == 4
+    assert frozen_pattern.onsets == (0.0, 1.0, 3.0, 3.5)
+    assert frozen_pattern.deltas == (1.0, 2.0, 0.5, 0.5)
+    assert frozen_pattern.durations == (1.0, 2.0, 1.0, 1.0)
+    assert frozen_pattern.columns["frequency"][:2] == (440, (550, 660))
+    assert frozen_pattern.columns["pan"][2:] == (-1, 1)
+    assert "pan" not in frozen_pattern[0].settings
+    assert frozen_pattern.is_infinite is False
+
+
+def test_events():
+    """
+    Frozen patterns replay the same events, UUIDs included, every time.
+    """
+    frozen_pattern = supriya.patterns.Pfreeze(pattern)
+    events = list(frozen_pattern)
+    assert events == list(frozen_pattern)
+    assert events == [frozen_pattern[i] for i in range(len(frozen_pattern))]
+    assert [utils.new(_, uuid=None) for _ in events] == [
+        utils.new(_, uuid=None) for _ in pattern
+    ]
+
+
+def test_freeze():
+    """
+    Frozen patterns are cached by value.
+    """
+    frozen_pattern = pattern.freeze()
+    assert isinstance(frozen_pattern, supriya.patterns.Pfreeze)
+    assert frozen_pattern.pattern is pattern
+    assert pattern.freeze() is frozen_pattern
+    assert utils.new(pattern).freeze() is frozen_pattern
+    assert frozen_pattern.freeze() is frozen_pattern
+
+
+def test_infinite():
+    with pytest.raises(ValueError):
+        supriya.patterns.Pbind(frequency=440).freeze()
+
+
+def test_nonrealtime():
+    sessions = []
+    for pattern_ in (pattern, pattern.freeze()):
+        session = supriya.nonrealtime.Session()
+        with session.at(0):
+            final_offset = session.inscribe(pattern_)
+        sessions.append((session.to_lists(), final_offset))
+    assert sessions[0] == sessions[1]
+    assert sessions[0][1] == 4.5
@@ -1,7 +1,12 @@
+import itertools
+import time
+import types
+
 import pytest
 import uqbar.strings
 
 import supriya.patterns
+import supriya.realtime
 
 pattern_01 = supriya.patterns.Ppar(
     [
@@ -567,3 +572,59 @@ def test___iter___06():
             )
         """
     )
+
+
+def merge_and_check(stream_count, event_count):
+    """
+    Merges many streams, checking events and event products come out in
+    order.
+
+    Returns event and event product rates, per second.
+    """
+    pattern = supriya.patterns.Ppar(
+        [
+            supriya.patterns.Pbind(
+                delta=0.25 * (1 + i % 3),
+                duration=0.2,
+                frequency=supriya.patterns.Pseq([440 + i], None),
+            )
+            for i in range(stream_count)
+        ]
+    )
+    start_time = time.time()
+    events = list(itertools.islice(pattern, event_count))
+    event_rate = event_count / (time.time() - start_time)
+    offsets = list(itertools.accumulate(_.delta for _ in events))
+    assert offsets == sorted(offsets)
+    assert len(set(_["frequency"] for _ in events[:stream_count])) == stream_count
+    pseudo_server = types.SimpleNamespace(
+        audio_bus_allocator=supriya.realtime.BlockAllocator(),
+        control_bus_allocator=supriya.realtime.BlockAllocator(),
+        node_id_allocator=supriya.realtime.NodeIdAllocator(),
+    )
+    iterator = supriya.patterns.RealtimeEventPlayer._iterate_inner(
+        pattern=pattern, server=pseudo_server, timestamp=0.0, uuids={}
+    )
+    start_time = time.time()
+    event_products = list(itertools.islice(iterator, event_count))
+    event_product_rate = event_count / (time.time() - start_time)
+    sort_bundles = [_._get_sort_bundle() for _ in event_products]
+    assert sort_bundles == sorted(sort_bundles)
+    return event_rate, event_product_rate
+
+
+@pytest.mark.parametrize("stream_count", [8, 64])
+def test_many_streams(stream_count):
+    merge_and_check(stream_count, 1000)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("stream_count", [8, 64, 512])
+def test_benchmark(stream_count):
+    event_rate, event_product_rate = merge_and_check(stream_count, 20000)
+    print()
+    print(
+        "{} streams: {:.0f} events/s, {:.0f} event products/s".format(
+            stream_count, event_rate, event_product_rate
+        )
+    )
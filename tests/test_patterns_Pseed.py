@@ -1,3 +1,6 @@
+import itertools
+import threading
+
 import supriya.patterns
 
 
@@ -128,3 +131,32 @@ def test_grouped():
     output_b = [next(iterator_b) for _ in range(10)]
     output_c = [next(iterator_c) for _ in range(10)]
     assert output_a == output_b == output_c
+
+
+def test_threaded():
+    """
+    Seeded iterators advanced in lockstep, or on separate threads, do not
+    disturb each other.
+    """
+    pattern = supriya.patterns.Pseed(supriya.patterns.Pwhite(), seed=0)
+    expected = list(itertools.islice(pattern, 100))
+    iterator_a, iterator_b = iter(pattern), iter(pattern)
+    output_a, output_b = [], []
+    for _ in range(100):
+        output_a.append(next(iterator_a))
+        output_b.append(next(iterator_b))
+    assert output_a == output_b == expected
+    outputs = [[] for _ in range(4)]
+
+    def run(output):
+        for x in pattern:
+            output.append(x)
+            if len(output) == 100:
+                break
+
+    threads = [threading.Thread(target=run, args=(_,)) for _ in outputs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(output == expected for output in outputs)
@@ -0,0 +1,43 @@
+import itertools
+import sys
+
+import pytest
+
+import supriya.patterns
+
+
+def iterate_reference(seed):
+    while True:
+        seed = (seed * 1_103_515_245 + 12345) & 0x7FFFFFFF
+        yield float(seed) / 0x7FFFFFFF
+
+
+@pytest.mark.parametrize("seed", [0, 1, 23, -5, 2 ** 40])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_01(monkeypatch, seed, use_numpy):
+    """
+    Block generation matches the scalar recurrence across block boundaries.
+    """
+    if not use_numpy:
+        module = sys.modules[supriya.patterns.RandomNumberGenerator.__module__]
+        monkeypatch.setattr(module, "numpy", None)
+    rng = supriya.patterns.RandomNumberGenerator(seed=seed)
+    expected = list(itertools.islice(iterate_reference(seed), 10000))
+    assert list(itertools.islice(rng, 10000)) == expected
+    blocks = list(itertools.islice(rng.iterate_blocks(block_size=7), 3))
+    assert [x for block in blocks for x in block] == expected[:21]
+
+
+def test_02():
+    """
+    Seeded Pwhite and Prand draw the same values as before.
+    """
+    pattern = supriya.patterns.Pseed(supriya.patterns.Pwhite(1.0, 3.0), seed=3)
+    expected = [x * 2.0 + 1.0 for x in itertools.islice(iterate_reference(3), 5000)]
+    assert list(itertools.islice(pattern, 5000)) == expected
+    pattern = supriya.patterns.Pseed(supriya.patterns.Prand([1, 2, 3], None), seed=3)
+    expected = [
+        [1, 2, 3][int(x * 0x7FFFFFFF) % 3]
+        for x in itertools.islice(iterate_reference(3), 5000)
+    ]
+    assert list(itertools.islice(pattern, 5000)) == expected
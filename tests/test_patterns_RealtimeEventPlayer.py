@@ -1,3 +1,9 @@
+import struct
+import time
+import types
+
+import supriya.commands
+import supriya.osc
 import supriya.patterns
 import supriya.realtime
 
@@ -132,3 +138,112 @@ def test_iterate_inner_5(pseudo_server):
         (4.0, (4, 0), True),
         (5.0, (5, 0), True),
     ]
+
+
+def test_lookahead():
+    """
+    Lookahead players send one packet per window, holding nested bundles
+    stamped with the latency already applied.
+    """
+    pattern = supriya.patterns.Ppar(
+        [
+            supriya.patterns.Pbind(
+                delta=delta,
+                duration=delta,
+                frequency=supriya.patterns.Pseq([440, 550, 660, 770], 2),
+            )
+            for delta in (0.125, 0.25)
+        ]
+    )
+
+    def play(lookahead):
+        datagrams = []
+        pseudo_server = types.SimpleNamespace(
+            audio_bus_allocator=supriya.realtime.BlockAllocator(),
+            control_bus_allocator=supriya.realtime.BlockAllocator(),
+            latency=0.5,
+            node_id_allocator=supriya.realtime.NodeIdAllocator(),
+            send_message=datagrams.append,
+        )
+        player = supriya.patterns.RealtimeEventPlayer(
+            pattern, lookahead=lookahead, server=pseudo_server
+        )
+        timestamp, delta = 10.0, 0.0
+        while delta is not None:
+            delta = player(timestamp, timestamp)
+            timestamp += delta or 0.0
+        return [
+            _.to_datagram() if isinstance(_, supriya.osc.OscBundle) else _
+            for _ in datagrams
+        ]
+
+    def flatten(datagrams):
+        for datagram in datagrams:
+            if not supriya.osc.OscBundle.datagram_is_bundle(datagram, 20):
+                yield datagram
+                continue
+            offset = 16
+            while offset < len(datagram):
+                size = struct.unpack_from(">i", datagram, offset)[0]
+                yield datagram[offset + 4 : offset + 4 + size]
+                offset += 4 + size
+
+    unbatched, batched = play(None), play(1.0)
+    assert len(unbatched) == 13
+    assert len(batched) == 3
+    assert list(flatten(batched)) == list(flatten(unbatched))
+    assert [
+        supriya.osc.OscBundle.from_datagram(_).timestamp for _ in batched
+    ] == [10.5, 11.5, 12.5]
+    assert all(len(_) <= 1472 for _ in batched)
+    # One window, split across packets at the MTU.
+    batched = play(10.0)
+    assert len(batched) == 2
+    assert list(flatten(batched)) == list(flatten(unbatched))
+    assert all(len(_) <= 1472 for _ in batched)
+
+
+def test_lookahead_stop():
+    """
+    Stopping mid-window releases nodes no earlier than the bundles already
+    sent ahead.
+    """
+    datagrams = []
+    pseudo_server = types.SimpleNamespace(
+        audio_bus_allocator=supriya.realtime.BlockAllocator(),
+        control_bus_allocator=supriya.realtime.BlockAllocator(),
+        is_running=True,
+        latency=0.5,
+        node_id_allocator=supriya.realtime.NodeIdAllocator(),
+        send_message=datagrams.append,
+    )
+    pattern = supriya.patterns.Pbind(
+        delta=0.25, duration=1.0, frequency=supriya.patterns.Pseq([440, 550], None)
+    )
+    player = supriya.patterns.RealtimeEventPlayer(
+        pattern, clock=supriya.patterns.Clock(), lookahead=1.0, server=pseudo_server
+    )
+    now = time.time()
+    assert player(now, now) == 1.0
+    player.stop()
+    assert len(datagrams) == 2
+    window_bundle = supriya.osc.OscBundle.from_datagram(datagrams[0])
+    stop_bundle = datagrams[1]
+    assert [round(_.timestamp - now, 6) for _ in window_bundle.contents] == [
+        0.5,
+        0.75,
+        1.0,
+        1.25,
+    ]
+    assert (
+        supriya.osc.OscBundle.from_datagram(stop_bundle.to_datagram()).timestamp
+        == window_bundle.contents[-1].timestamp
+    )
+    assert [_.to_list() for _ in stop_bundle.contents] == [
+        supriya.commands.NodeFreeRequest(node_ids=range(1000, 1006)).to_osc().to_list()
+    ]
+    # Once those bundles are due, stopping sends immediately.
+    player(now, now)
+    player._sent_timestamp = time.time() - 1.0
+    player.stop()
+    assert datagrams[-1].timestamp is None
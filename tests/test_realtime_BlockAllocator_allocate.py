@@ -1,4 +1,11 @@
+import random
+import timeit
+
+import pytest
+
 import supriya.realtime
+import supriya.time
+from supriya import utils
 
 
 def test_01():
@@ -26,3 +33,172 @@ def test_01():
 
     assert allocator.allocate(1) == 4
     assert allocator.allocate(1) == 5
+
+
+class LegacyBlockAllocator:
+    """
+    The TimespanCollection-based first-fit allocator, for comparison.
+    """
+
+    def __init__(self, heap_maximum=None, heap_minimum=0):
+        self._free_heap = supriya.time.TimespanCollection(accelerated=True)
+        self._used_heap = supriya.time.TimespanCollection(accelerated=True)
+        self._free_heap.insert(
+            supriya.realtime.Block(
+                start_offset=heap_minimum, stop_offset=heap_maximum, used=False
+            )
+        )
+
+    def allocate(self, desired_block_size=1):
+        for free_block in self._free_heap:
+            if desired_block_size <= free_block.duration:
+                break
+        else:
+            return None
+        split_offset = free_block.start_offset + desired_block_size
+        self._free_heap.remove(free_block)
+        if desired_block_size < free_block.duration:
+            self._free_heap.insert(
+                utils.new(free_block, start_offset=split_offset, used=False)
+            )
+        used_block = utils.new(free_block, stop_offset=split_offset, used=True)
+        self._used_heap.insert(used_block)
+        return used_block.start_offset
+
+    def free(self, block_id):
+        used_block = self._used_heap.find_timespans_starting_at(block_id)[0]
+        self._used_heap.remove(used_block)
+        start_offset, stop_offset = used_block.start_offset, used_block.stop_offset
+        for block in self._free_heap.find_timespans_stopping_at(start_offset):
+            self._free_heap.remove(block)
+            start_offset = block.start_offset
+        for block in self._free_heap.find_timespans_starting_at(stop_offset):
+            self._free_heap.remove(block)
+            stop_offset = block.stop_offset
+        self._free_heap.insert(
+            supriya.realtime.Block(start_offset=start_offset, stop_offset=stop_offset)
+        )
+
+
+def churn(allocator, operation_count, seed=0):
+    # Interleaved allocations and frees of mixed sizes, fragmenting the heap.
+    random_ = random.Random(seed)
+    block_ids, results = [], []
+    for _ in range(operation_count):
+        if block_ids and random_.random() < 0.45:
+            block_id = block_ids.pop(random_.randrange(len(block_ids)))
+            allocator.free(block_id)
+        else:
+            block_id = allocator.allocate(random_.choice([1, 1, 2, 2, 4, 8, 16, 33]))
+            if block_id is not None:
+                block_ids.append(block_id)
+            results.append(block_id)
+    return results
+
+
+@pytest.mark.parametrize("policy", ["best_fit", "first_fit"])
+def test_02(policy):
+    # Check against a brute-force model of the heap.
+    random_ = random.Random(1)
+    heap_size = 256
+    allocator = supriya.realtime.BlockAllocator(heap_maximum=heap_size, policy=policy)
+    used = [False] * heap_size
+    blocks = {}
+    for _ in range(5000):
+        if blocks and random_.random() < 0.4:
+            block_id = random_.choice(sorted(blocks))
+            allocator.free(block_id)
+            for i in range(block_id, blocks.pop(block_id)):
+                used[i] = False
+            continue
+        size = random_.randint(1, 24)
+        runs, start = [], None
+        for i, flag in enumerate(used + [True]):
+            if not flag and start is None:
+                start = i
+            elif flag and start is not None:
+                runs.append((start, i - start))
+                start = None
+        candidates = [run for run in runs if size <= run[1]]
+        if random_.random() < 0.2:
+            index = random_.randrange(heap_size)
+            expected = index
+            if any(used[index : index + size]) or heap_size < index + size:
+                expected = None
+            assert allocator.allocate_at(index, size) == expected
+        else:
+            expected = None
+            if candidates and policy == "first_fit":
+                expected = candidates[0][0]
+            elif candidates:
+                expected = min(candidates, key=lambda run: (run[1], run[0]))[0]
+            index = allocator.allocate(size)
+            assert index == expected
+        if expected is not None:
+            blocks[expected] = expected + size
+            for i in range(expected, expected + size):
+                used[i] = True
+        statistics = allocator.statistics
+        assert statistics.used_size == sum(used)
+        assert statistics.free_size == heap_size - sum(used)
+        assert statistics.used_block_count == len(blocks)
+    for block_id in list(blocks):
+        allocator.free(block_id)
+    assert allocator.statistics.free_block_count == 1
+    assert allocator.statistics.fragmentation == 0.0
+
+
+def test_03():
+    allocator = supriya.realtime.BlockAllocator(heap_maximum=16)
+    allocator.allocate(4)
+    with pytest.raises(ValueError):
+        allocator.free(4)
+    with pytest.raises(ValueError):
+        supriya.realtime.BlockAllocator(policy="worst_fit")
+
+
+def test_legacy():
+    operation_count = 200
+    legacy_results = churn(LegacyBlockAllocator(), operation_count)
+    assert churn(supriya.realtime.BlockAllocator(), operation_count) == legacy_results
+
+
+@pytest.mark.benchmark
+def test_benchmark():
+    operation_count = 1000
+    timings = {
+        "legacy": timeit.timeit(
+            lambda: churn(LegacyBlockAllocator(), operation_count), number=1
+        )
+    }
+    for policy in ["first_fit", "best_fit"]:
+        timings[policy] = min(
+            timeit.repeat(
+                lambda: churn(
+                    supriya.realtime.BlockAllocator(policy=policy), operation_count
+                ),
+                number=1,
+                repeat=3,
+            )
+        )
+    print()
+    for name, timing in timings.items():
+        print("{:>9}: {:.2f} us/op".format(name, timing / operation_count * 1e6))
+
+
+def test_04():
+    allocator = supriya.realtime.BlockAllocator(heap_maximum=16)
+    assert allocator.allocate_many(0) == []
+    assert allocator.allocate_many(4, 2) == [0, 2, 4, 6]
+    allocator.free_many([2, 6])
+    # No contiguous range is large enough, so blocks are placed one by one.
+    assert allocator.allocate_many(6, 2) == [2, 6, 8, 10, 12, 14]
+    allocator.free_many([2, 10])
+    # All or nothing.
+    assert allocator.allocate_many(3, 2) is None
+    assert allocator.statistics.free_size == 4
+    with pytest.raises(ValueError):
+        allocator.free_many([0, 2])
+    assert allocator.statistics.used_block_count == 6
+    allocator.free_many([0, 4, 6, 8, 12, 14])
+    assert allocator.statistics.free_block_count == 1
@@ -0,0 +1,126 @@
+import struct
+import tempfile
+import types
+
+import numpy
+import pytest
+
+import supriya.commands
+import supriya.exceptions
+import supriya.osc
+import supriya.realtime
+
+
+@pytest.mark.parametrize("address", [36, "/b_setn"])
+def test_encode_set_contiguous(address):
+    values = [0.0, 0.5, -0.25, 1.0, 0.125]
+    datagram = supriya.realtime.Buffer._encode_set_contiguous(
+        address, 3, 7, numpy.array(values, dtype=">f4")
+    )
+    assert datagram == supriya.osc.OscMessage(address, 3, 7, 5, *values).to_datagram()
+
+
+def test_decode_set_contiguous():
+    values = [0.0, 0.5, -0.25, 1.0, 0.125]
+    datagram = supriya.realtime.Buffer._encode_set_contiguous(
+        "/b_setn", 3, 7, numpy.array(values, dtype=">f4")
+    )
+    buffer_id, start, samples = supriya.realtime.Buffer._decode_set_contiguous(datagram)
+    assert (buffer_id, start, samples.tolist()) == (3, 7, values)
+    # Truncated or otherwise shaped replies are left to the OSC codec.
+    for datagram in [
+        datagram[:-4],
+        supriya.osc.OscMessage("/b_setn", 3, 7, 2, 0.5, 1).to_datagram(),
+        supriya.osc.OscMessage("/b_setn", 3).to_datagram(),
+    ]:
+        assert supriya.realtime.Buffer._decode_set_contiguous(datagram) is None
+
+
+def test_to_numpy_foreign_replies():
+    # Replies for chunks this call didn't ask for, like those for a concurrent
+    # read of the same buffer, are passed on rather than consumed.
+    array = numpy.arange(12, dtype=">f4")
+    osc_io = supriya.osc.OscIO()
+    foreign = []
+    osc_io.register(pattern=("/b_setn", 7), procedure=foreign.append)
+
+    def send_message(request):
+        ((start, count),) = request.index_count_pairs
+        for start_, count_ in [(start + 1, count - 1), (start, count)]:
+            osc_io._process_datagram(
+                supriya.realtime.Buffer._encode_set_contiguous(
+                    "/b_setn", 7, start_, array[start_ : start + count]
+                )
+            )
+
+    class Buffer(supriya.realtime.Buffer):
+        __slots__ = ()
+        buffer_id = 7
+        channel_count = 3
+        frame_count = 4
+        is_allocated = True
+        server = types.SimpleNamespace(osc_io=osc_io, send_message=send_message)
+
+    assert Buffer().to_numpy(chunk_size=4).ravel().tolist() == array.tolist()
+    assert [_.contents[1:3] for _ in foreign] == [(1, 3), (5, 3), (9, 3)]
+    assert osc_io.datagram_procedures == {}
+
+
+def test_write_wav(tmp_path):
+    array = numpy.random.RandomState(0).uniform(-1, 1, (1001, 3)).astype("f4")
+    path = tmp_path / "array.wav"
+    with path.open("wb") as file_pointer:
+        supriya.realtime.Buffer._write_wav(file_pointer, array, 48000)
+    data = path.read_bytes()
+    assert data[:4] == b"RIFF" and data[8:16] == b"WAVE" + b"fmt "
+    assert struct.unpack("<I", data[4:8])[0] == len(data) - 8
+    format_tag, channel_count, sample_rate = struct.unpack("<HHI", data[20:28])
+    assert (format_tag, channel_count, sample_rate) == (3, 3, 48000)
+    offset = data.index(b"data") + 8
+    assert struct.unpack("<I", data[offset - 4 : offset])[0] == array.nbytes
+    samples = numpy.frombuffer(data, dtype="<f4", offset=offset)
+    assert numpy.array_equal(samples.reshape(-1, 3), array)
+
+
+def test_roundtrip(server):
+    array = numpy.random.RandomState(0).uniform(-1, 1, (20000, 2))
+    buffer_ = supriya.realtime.Buffer.from_numpy(array, server=server)
+    assert (buffer_.channel_count, buffer_.frame_count) == (2, 20000)
+    result = buffer_.to_numpy()
+    assert result.dtype == numpy.float32
+    assert numpy.array_equal(result, array.astype(numpy.float32))
+    response = buffer_.get_contiguous([(39997, 3)])
+    assert response.as_dict()[39997] == tuple(array.ravel()[39997:].astype("f4"))
+    buffer_.free()
+
+
+def test_mono(server):
+    array = numpy.linspace(-1, 1, 5000, dtype="float32")
+    buffer_ = supriya.realtime.Buffer.from_numpy(array, chunk_size=100, window=4)
+    assert buffer_.to_numpy(chunk_size=100, window=4).ravel().tolist() == (
+        array.tolist()
+    )
+    buffer_.free()
+
+
+def test_not_allocated(server):
+    with pytest.raises(supriya.exceptions.BufferNotAllocated):
+        supriya.realtime.Buffer().to_numpy()
+    with pytest.raises(ValueError):
+        supriya.realtime.Buffer.from_numpy(numpy.zeros((2, 2, 2)))
+
+
+@pytest.mark.parametrize("transfer", [None, "file", "osc"])
+def test_load_array(server, monkeypatch, tmp_path, transfer):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    array = numpy.random.RandomState(0).uniform(-1, 1, (40000, 2))
+    buffer_ = supriya.realtime.Buffer.load_array(array, 48000, transfer=transfer)
+    server.sync()
+    assert not list(tmp_path.iterdir())
+    assert numpy.array_equal(buffer_.to_numpy(), array.astype(numpy.float32))
+    sample_rate = buffer_.query().items[0].sample_rate
+    if transfer == "osc":
+        assert sample_rate == server.server_options.sample_rate
+    else:
+        assert sample_rate == 48000
+    buffer_.free()
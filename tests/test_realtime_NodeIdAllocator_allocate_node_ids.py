@@ -0,0 +1,40 @@
+import threading
+
+import supriya.realtime
+
+
+def test_01():
+    allocator = supriya.realtime.NodeIdAllocator(user_id=1)
+    node_ids = allocator.allocate_node_ids(5)
+    assert node_ids == [(1 << 26) | x for x in range(1000, 1005)]
+    assert allocator.allocate_node_id() == (1 << 26) | 1005
+    assert allocator.allocate_node_ids(0) == []
+
+
+def test_02():
+    # Wrapping matches repeated single allocations.
+    one = supriya.realtime.NodeIdAllocator()
+    two = supriya.realtime.NodeIdAllocator()
+    one._temp = two._temp = 0x03FFFFFF - 2
+    assert one.allocate_node_ids(6) == [two.allocate_node_id() for _ in range(6)]
+    assert one.allocate_node_ids(3) == [two.allocate_node_id() for _ in range(3)]
+
+
+def test_03():
+    allocator = supriya.realtime.NodeIdAllocator()
+    results = []
+
+    def worker():
+        for _ in range(100):
+            results.append(allocator.allocate_node_ids(10))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for node_ids in results:
+        assert node_ids == list(range(node_ids[0], node_ids[0] + 10))
+    assert sorted(x for node_ids in results for x in node_ids) == list(
+        range(1000, 5000)
+    )
@@ -0,0 +1,102 @@
+import random
+import timeit
+
+import pytest
+
+import supriya.commands
+import supriya.realtime
+
+
+def record(group_id, node_count, notification_count, first_node_id=100000):
+    """
+    Records a stream of /n_go, /n_move and /n_end notifications against a
+    single group, along with the sibling order it should leave behind.
+    """
+    rng = random.Random(0)
+    order, node_ids, responses = [], iter(range(first_node_id, 2 ** 26)), []
+
+    def make_response(action, node_id, index):
+        previous_node_id = order[index - 1] if index else -1
+        next_node_id = order[index + 1] if index + 1 < len(order) else -1
+        return supriya.commands.NodeInfoResponse(
+            action=action,
+            node_id=node_id,
+            parent_group_id=group_id,
+            previous_node_id=previous_node_id,
+            next_node_id=next_node_id,
+            is_group=False,
+        )
+
+    while len(responses) < notification_count:
+        if len(order) < node_count:
+            action = "/n_go"
+        else:
+            action = rng.choice(["/n_move", "/n_move", "/n_end"])
+        if action == "/n_go":
+            node_id = next(node_ids)
+            index = rng.randint(0, len(order))
+            order.insert(index, node_id)
+            responses.append(make_response(action, node_id, index))
+        elif action == "/n_move":
+            node_id = order.pop(rng.randrange(len(order)))
+            index = rng.randint(0, len(order))
+            order.insert(index, node_id)
+            responses.append(make_response(action, node_id, index))
+        else:
+            index = rng.randrange(len(order))
+            responses.append(make_response(action, order[index], index))
+            order.pop(index)
+    return responses, order
+
+
+def replay(server, group, responses):
+    for response in responses:
+        server._handle_node_info_response(response)
+    return [node.node_id for node in group]
+
+
+def replay_and_check(server, node_count, notification_count):
+    """
+    Replays recorded notifications against a fresh group, checks the sibling
+    order they leave behind, then empties and frees the group.
+
+    Returns the replay time in seconds.
+    """
+    group = supriya.realtime.Group().allocate()
+    responses, expected_order = record(group.node_id, node_count, notification_count)
+    actual_order = []
+    timing = timeit.timeit(
+        lambda: actual_order.extend(replay(server, group, responses)), number=1
+    )
+    assert actual_order == expected_order
+    assert all(server[node_id].parent is group for node_id in expected_order)
+    for node in group[:]:
+        server._handle_node_info_response(
+            supriya.commands.NodeInfoResponse(
+                action="/n_end", node_id=node.node_id, parent_group_id=group.node_id
+            )
+        )
+    assert not len(group)
+    group.free()
+    return timing
+
+
+@pytest.mark.parametrize("node_count", [50, 500])
+def test_replay(server, node_count):
+    replay_and_check(server, node_count, 2000)
+
+
+@pytest.mark.benchmark
+def test_benchmark(server):
+    notification_count = 100000
+    timings = {
+        node_count: replay_and_check(server, node_count, notification_count)
+        for node_count in [50, 5000]
+    }
+    print()
+    for node_count, timing in timings.items():
+        print(
+            "{:>5} siblings: {:.2f} us/notification".format(
+                node_count, timing / notification_count * 1e6
+            )
+        )